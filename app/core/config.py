@@ -9,3 +9,9 @@ TEMPLATE_FILE = BASE_DIR / "templates" / "index.html"
 STATIC_DIR = BASE_DIR / "static"
 DEFAULT_ADMIN_USERNAME = "admin"
 DEFAULT_ADMIN_PASSWORD = "Admin@12345"
+TABLE_IDLE_SECONDS = 30 * 60
+TABLE_REAP_INTERVAL_SECONDS = 60
+BOT_TURN_DELAY_SECONDS = 0.6
+TURN_TIMEOUT_SECONDS = 30
+TURN_TIMER_TICK_SECONDS = 0.5
+TOURNAMENT_TICK_SECONDS = 1.0
@@ -30,6 +30,18 @@ def get_current_user(db: Session = Depends(get_db), authorization: str | None =
     return user
 
 
+def get_socket_user(token: str | None) -> User | None:
+    """Resolve a websocket's ``?token=`` query parameter; browsers cannot set auth headers on sockets."""
+    if not token:
+        return None
+    db = SessionLocal()
+    try:
+        session_token = db.get(SessionToken, token)
+        return db.get(User, session_token.user_id) if session_token is not None else None
+    finally:
+        db.close()
+
+
 def require_admin(user: User = Depends(get_current_user)) -> User:
     if not user.is_admin:
         raise HTTPException(403, "Admin access required")
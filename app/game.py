@@ -2,11 +2,35 @@ from __future__ import annotations
 
 from dataclasses import dataclass, field
 from datetime import datetime
+import json
 import random
-from threading import Lock
-from typing import Any
+from threading import Lock, RLock
+from typing import Any, Callable, Protocol
 
-from .teenpatti import Card, best_hand, compare_hands, new_deck
+from .registry import ShardedTableRegistry
+from .seats import at_most_one, iter_seats, next_seat, prev_seat
+from .shuffle import SeededShuffle, ShuffleService
+from .teenpatti import Card, new_deck, rank_hands, shuffled_deck
+from .teenpatti_equity import blind_equity, hand_equity
+
+# Tables one human may sit at simultaneously.
+MAX_SEATS_PER_USER = 4
+
+# Consecutive timed-out turns after which a player is removed at the next deal.
+MAX_MISSED_TURNS = 3
+
+# Once the pot reaches this many boots every live hand is shown down.
+POT_LIMIT_BOOTS = 1024
+
+# Bot policy thresholds on estimated equity (see app.teenpatti_equity).
+# Packing compares against a fair share of the pot, 1 / (opponents + 1), so a blind bot never packs outright.
+BOT_PACK_SHARE = 0.4
+BOT_RAISE_EQUITY = 0.7
+BOT_SHOW_EQUITY = 0.9
+# Each raise by an opponent who has seen their cards scales the bot's equity by this.
+BOT_RAISE_DISCOUNT = 0.85
+# A blind bot facing several opponents looks once the pot reaches this many boots.
+BOT_SEE_POT_MULTIPLE = 4
 
 
 @dataclass
@@ -18,7 +42,10 @@ class SeatPlayer:
     seen: bool = False
     packed: bool = False
     cards: list[Card] = field(default_factory=list)
+    # Chips committed this hand (boot included); side pots are cut from these.
     total_bet: int = 0
+    all_in: bool = False
+    missed_turns: int = 0
 
 
 @dataclass
@@ -37,87 +64,247 @@ class TableState:
     deck: list[Card] = field(default_factory=list)
     hand_active: bool = False
     hand_started_at: datetime | None = None
+    hand_no: int = 0
+    # The committed shuffle behind the current deck, when dealt by a ShuffleService.
+    shuffle: SeededShuffle | None = None
     action_log: list[dict[str, Any]] = field(default_factory=list)
+    # Seat index kept in step with the players by GameManager (see _reindex/_pack/_bet).
+    seat_of: dict[str, int] = field(default_factory=dict)
+    live_mask: int = 0  # seats still in the hand (not packed)
+    acting_mask: int = 0  # live seats that can still bet (not all-in)
+    live_count: int = 0
+    # Bumped on every change; the spectator frame is the public view encoded once per version.
+    version: int = 0
+    # Set on tournament tables, which are seated by the tournament director rather than by joins.
+    tournament_id: int | None = None
+    # A paused table finishes its current hand but deals no new one (tables being broken or balanced).
+    paused: bool = False
+    spectator_frame: tuple[int, bytes] | None = field(default=None, repr=False)
+    lock: RLock = field(default_factory=RLock, repr=False, compare=False)
+
+
+class TeenPattiStrategy(Protocol):
+    name: str
+
+    def choose_action(self, manager: GameManager, table: TableState, bot: SeatPlayer) -> tuple[str, int]: ...
 
 
 class GameManager:
-    def __init__(self) -> None:
-        self.tables: dict[int, TableState] = {}
-        self.user_table: dict[str, int] = {}
-        self.lock = Lock()
+    def __init__(self, rng: random.Random | None = None) -> None:
+        self.tables: ShardedTableRegistry[TableState] = ShardedTableRegistry()
+        # Player id -> ids of the tables they sit at. Each value is an immutable set
+        # replaced whole under index_lock, so lookups need no lock at all; game
+        # state is protected by each table's own lock.
+        self.user_seats: dict[str, frozenset[int]] = {}
+        self.index_lock = Lock()
+        self.max_seats_per_user = MAX_SEATS_PER_USER
+        self.rng = rng or random
+        # When set, decks come from this service with a commit-reveal entry in the hand log;
+        # otherwise from ``rng`` (tests and simulations, reproducible from a seed).
+        self.shuffler: ShuffleService | None = None
+        # Per-seat overrides of the built-in bot policy, keyed by player id.
+        self.strategies: dict[str, TeenPattiStrategy] = {}
+        # When False, bot turns are left to step_bot() so a caller can pace them
+        # (the web app hands them to the bot scheduler instead of the request).
+        self.inline_bots = True
+        # Headless simulation turns these off: it deals each hand itself and needs no wall-clock stamps.
+        self.auto_deal = True
+        self.log_timestamps = True
+        # Called (with the table's lock held) whenever a table's seating changes; the matchmaker's index hook.
+        self.on_seats_changed: Callable[[TableState], None] | None = None
 
     def seed_tables(self, configs: list[dict[str, Any]]) -> None:
-        with self.lock:
-            for cfg in configs:
-                if cfg["id"] in self.tables:
-                    continue
-                self.tables[cfg["id"]] = TableState(
-                    table_id=cfg["id"],
-                    name=cfg["name"],
-                    max_players=cfg["max_players"],
-                    boot_amount=cfg["boot_amount"],
-                    min_buyin=cfg["min_buyin"],
-                    max_buyin=cfg["max_buyin"],
-                )
+        for cfg in configs:
+            if cfg["id"] not in self.tables:
+                self.create_table(cfg)
+
+    def create_table(self, cfg: dict[str, Any], tournament_id: int | None = None) -> TableState:
+        """Register a table from a ``TableConfig``-style dict; tournament tables start paused."""
+        if cfg["id"] in self.tables:
+            raise ValueError("Table id already in use")
+        table = TableState(
+            table_id=cfg["id"],
+            name=cfg["name"],
+            max_players=cfg["max_players"],
+            boot_amount=cfg["boot_amount"],
+            min_buyin=cfg["min_buyin"],
+            max_buyin=cfg["max_buyin"],
+            tournament_id=tournament_id,
+            paused=tournament_id is not None,
+        )
+        self.tables[table.table_id] = table
+        with table.lock:
+            self._seats_changed(table)
+        return table
+
+    def close_table(self, table_id: int) -> None:
+        """Drop a table between hands, unseating whoever is left (busted tournament stacks)."""
+        table = self.tables[table_id]
+        with table.lock:
+            if table.hand_active:
+                raise ValueError("Cannot close a table during a hand")
+            for player in table.players:
+                self._index_remove(player.player_id, table_id)
+            table.players = []
+            self._reindex(table)
+            self._touch(table)
+            self.tables.pop(table_id)
+
+    def set_paused(self, table_id: int, paused: bool) -> None:
+        """Hold a table after its current hand, or release it and deal if enough players are seated."""
+        table = self.tables[table_id]
+        with table.lock:
+            table.paused = paused
+            self._maybe_start(table)
+            self._touch(table)
+
+    def set_boot(self, table_id: int, boot_amount: int) -> None:
+        """Change the boot; it is collected at the next deal."""
+        table = self.tables[table_id]
+        with table.lock:
+            table.boot_amount = boot_amount
+            self._touch(table)
 
     def list_tables(self) -> list[dict[str, Any]]:
-        with self.lock:
-            data: list[dict[str, Any]] = []
-            for table in self.tables.values():
-                data.append(
-                    {
-                        "table_id": table.table_id,
-                        "name": table.name,
-                        "players": len(table.players),
-                        "max_players": table.max_players,
-                        "boot_amount": table.boot_amount,
-                        "pot": table.pot,
-                        "hand_active": table.hand_active,
-                    }
-                )
-            return sorted(data, key=lambda item: item["table_id"])
+        return sorted(
+            (
+                {
+                    "table_id": table.table_id,
+                    "name": table.name,
+                    "players": len(table.players),
+                    "max_players": table.max_players,
+                    "boot_amount": table.boot_amount,
+                    "pot": table.pot,
+                    "hand_active": table.hand_active,
+                }
+                for table in self.tables.values()
+                if table.tournament_id is None
+            ),
+            key=lambda item: item["table_id"],
+        )
+
+    def seats_of(self, player_id: str) -> frozenset[int]:
+        """Ids of the tables ``player_id`` sits at; lock-free."""
+        return self.user_seats.get(player_id, frozenset())
+
+    def chips_on_tables(self, player_id: str) -> int:
+        """Chips ``player_id`` has brought to cash tables, stacks plus bets in the hand in progress."""
+        total = 0
+        for table_id in self.seats_of(player_id):
+            table = self.tables.get(table_id)
+            if table is None or table.tournament_id is not None:
+                continue
+            with table.lock:
+                seat = table.seat_of.get(player_id)
+                if seat is not None:
+                    player = table.players[seat]
+                    total += player.chips + (player.total_bet if table.hand_active else 0)
+        return total
 
     def join_table(self, table_id: int, player_id: str, display_name: str, chips: int, is_bot: bool = False) -> dict[str, Any]:
-        with self.lock:
-            table = self.tables[table_id]
-            if player_id in self.user_table:
-                raise ValueError("Player already seated at a table")
+        table = self.tables[table_id]
+        if table.tournament_id is not None:
+            raise ValueError("Tournament tables are seated by the tournament")
+        return self._join(table, player_id, display_name, chips, is_bot)
+
+    def seat_entrant(self, table_id: int, player_id: str, display_name: str, chips: int, is_bot: bool = False) -> dict[str, Any]:
+        """Seat a tournament entrant with their stack; the tournament director's way into its tables."""
+        table = self.tables[table_id]
+        if table.tournament_id is None:
+            raise ValueError("Not a tournament table")
+        return self._join(table, player_id, display_name, chips, is_bot)
+
+    def _join(self, table: TableState, player_id: str, display_name: str, chips: int, is_bot: bool) -> dict[str, Any]:
+        table_id = table.table_id
+        with table.lock:
             if len(table.players) >= table.max_players:
                 raise ValueError("Table is full")
-            if chips < table.min_buyin or chips > table.max_buyin:
+            if table.tournament_id is None and (chips < table.min_buyin or chips > table.max_buyin):
                 raise ValueError("Buy-in out of table range")
-
-            table.players.append(SeatPlayer(player_id=player_id, display_name=display_name, chips=chips, is_bot=is_bot))
-            self.user_table[player_id] = table_id
-            table.action_log.append({"event": "join", "player_id": player_id, "at": datetime.utcnow().isoformat()})
-
-            if len(table.players) >= 2 and not table.hand_active:
-                self._start_hand(table)
+            with self.index_lock:
+                seats = self.seats_of(player_id)
+                if table_id in seats:
+                    raise ValueError("Player already seated at this table")
+                if not is_bot and len(seats) >= self.max_seats_per_user:
+                    raise ValueError("Seat limit reached")
+                self.user_seats[player_id] = seats | {table_id}
+
+            # A mid-hand arrival sits the hand out, as transfer_seat does.
+            table.players.append(
+                SeatPlayer(player_id=player_id, display_name=display_name, chips=chips, is_bot=is_bot, packed=table.hand_active)
+            )
+            self._reindex(table)
+            table.action_log.append({"event": "join", "player_id": player_id, "at": self._now()})
+            self._seats_changed(table)
+            self._maybe_start(table)
+            self._touch(table)
             return self._public_state(table, for_player=player_id)
 
     def add_bot_players(self, table_id: int, count: int) -> None:
-        with self.lock:
-            table = self.tables[table_id]
+        table = self.tables[table_id]
+        with table.lock:
             for _ in range(count):
                 if len(table.players) >= table.max_players:
                     break
-                bot_id = f"bot-{table_id}-{len(table.players)+1}-{random.randint(1000, 9999)}"
-                bot_name = random.choice(["Ava", "Rex", "Nora", "Leo", "Mia", "Kane", "Iris"]) + " Bot"
+                bot_id = f"bot-{table_id}-{len(table.players)+1}-{self.rng.randint(1000, 9999)}"
+                bot_name = self.rng.choice(["Ava", "Rex", "Nora", "Leo", "Mia", "Kane", "Iris"]) + " Bot"
                 table.players.append(
                     SeatPlayer(player_id=bot_id, display_name=bot_name, chips=table.min_buyin * 2, is_bot=True)
                 )
-                self.user_table[bot_id] = table_id
-                table.action_log.append({"event": "bot_join", "player_id": bot_id, "at": datetime.utcnow().isoformat()})
-            if len(table.players) >= 2 and not table.hand_active:
-                self._start_hand(table)
-
-    def act(self, player_id: str, action: str, amount: int = 0) -> dict[str, Any]:
-        with self.lock:
-            table_id = self.user_table.get(player_id)
-            if table_id is None:
-                raise ValueError("Player is not seated at any table")
-
-            table = self.tables[table_id]
+                self._reindex(table)
+                self._index_add(bot_id, table_id)
+                table.action_log.append({"event": "bot_join", "player_id": bot_id, "at": self._now()})
+            self._seats_changed(table)
+            self._maybe_start(table)
+            self._touch(table)
+
+    def transfer_seat(self, player_id: str, to_table_id: int, from_table_id: int | None = None) -> dict[str, Any]:
+        """Move a player, chips and all, to another table; only between hands at the table they leave.
+
+        A player arriving mid-hand sits it out and is dealt in from the next hand.
+        """
+        from_table = self.tables[self._seat_table_id(player_id, from_table_id)]
+        to_table = self.tables[to_table_id]
+        if from_table is to_table or to_table_id in self.seats_of(player_id):
+            raise ValueError("Player is already seated at this table")
+        # Two table locks, always taken in table id order.
+        first, second = sorted((from_table, to_table), key=lambda table: table.table_id)
+        with first.lock, second.lock:
+            if player_id not in from_table.seat_of:
+                raise ValueError("Player is not seated at this table")
+            if from_table.hand_active:
+                raise ValueError("Cannot move a player during a hand")
+            if len(to_table.players) >= to_table.max_players:
+                raise ValueError("Table is full")
+            player = from_table.players[from_table.seat_of[player_id]]
+            if not self._can_post(to_table, player):
+                raise ValueError("Not enough chips for the target table")
+
+            from_table.players.remove(player)
+            self._reindex(from_table)
+            player.all_in = player.seen = False
+            player.packed = to_table.hand_active
+            player.cards = []
+            player.total_bet = 0
+            to_table.players.append(player)
+            self._reindex(to_table)
+            with self.index_lock:
+                self.user_seats[player_id] = self.seats_of(player_id) - {from_table.table_id} | {to_table_id}
+            from_table.action_log.append({"event": "seat_moved", "player_id": player_id, "to_table": to_table_id, "at": self._now()})
+            to_table.action_log.append({"event": "join", "player_id": player_id, "from_table": from_table.table_id, "at": self._now()})
+            self._seats_changed(from_table)
+            self._seats_changed(to_table)
+            self._maybe_start(to_table)
+            self._touch(from_table)
+            self._touch(to_table)
+            return self._public_state(to_table, for_player=player_id)
+
+    def act(self, player_id: str, action: str, amount: int = 0, table_id: int | None = None) -> dict[str, Any]:
+        """Play ``action`` at ``table_id``, which may be left out while the player sits at a single table."""
+        table = self.tables[self._seat_table_id(player_id, table_id)]
+        with table.lock:
+            if player_id not in table.seat_of:
+                raise ValueError("Player is not seated at this table")
             if not table.hand_active:
                 raise ValueError("No active hand")
 
@@ -126,24 +313,22 @@ class GameManager:
                 raise ValueError("Not your turn")
             if player.packed:
                 raise ValueError("Player already packed")
+            player.missed_turns = 0
 
             if action == "pack":
-                player.packed = True
+                self._pack(table, player)
             elif action == "see":
                 player.seen = True
             elif action in {"call", "raise"}:
                 commit = self._compute_commit(table, player, action, amount)
-                if player.chips < commit:
+                # A short stack may still call: it goes all-in for what it has.
+                if action == "raise" and player.chips < commit:
                     raise ValueError("Insufficient chips")
-                player.chips -= commit
-                player.total_bet += commit
-                table.pot += commit
-                if not player.seen and commit > table.current_bet:
-                    table.current_bet = commit
-                if player.seen and commit // 2 > table.current_bet:
-                    table.current_bet = commit // 2
+                self._bet(table, player, action, commit)
             elif action == "show":
                 self._showdown_on_demand(table, player)
+            elif action == "sideshow":
+                self._side_show(table, player)
             else:
                 raise ValueError("Invalid action")
 
@@ -153,199 +338,442 @@ class GameManager:
                     "player_id": player_id,
                     "action": action,
                     "amount": amount,
-                    "at": datetime.utcnow().isoformat(),
+                    "at": self._now(),
                 }
             )
+            # A show has already settled the hand (and may have dealt the next one).
+            if action != "show":
+                self._advance_turn(table)
+                self._maybe_finish_hand(table)
+            self._play_bots_until_human_turn(table)
+            self._touch(table)
+            return self._public_state(table, for_player=player_id)
+
+    def step_bot(self, table_id: int) -> dict[str, Any] | None:
+        """Play a single bot action; returns the public state, or None when no bot is to act."""
+        table = self.tables[table_id]
+        with table.lock:
+            if not table.hand_active or not table.players or not self._current_player(table).is_bot:
+                return None
+            self._play_bot_action(table, self._current_player(table))
+            self._touch(table)
+            return self._public_state(table, for_player=None)
+
+    def turn_marker(self, table_id: int) -> tuple[str, int] | None:
+        """Identifies the human turn in progress (player id, action count), or None if no human is to act."""
+        table = self.tables[table_id]
+        with table.lock:
+            return self._turn_marker(table)
+
+    def expire_turn(self, table_id: int, marker: tuple[str, int] | None) -> dict[str, Any] | None:
+        """Pack for a human whose turn ``marker`` ran out; None if that turn has already moved on."""
+        table = self.tables[table_id]
+        with table.lock:
+            if marker is None or self._turn_marker(table) != marker:
+                return None
+            player = self._current_player(table)
+            self._pack(table, player)
+            player.missed_turns += 1
+            table.action_log.append(
+                {"event": "timeout", "player_id": player.player_id, "action": "pack", "at": self._now()}
+            )
             self._advance_turn(table)
             self._maybe_finish_hand(table)
             self._play_bots_until_human_turn(table)
-            return self._public_state(table, for_player=player_id)
+            self._touch(table)
+            return self._public_state(table, for_player=None)
 
     def get_table_state(self, table_id: int, for_player: str | None = None) -> dict[str, Any]:
-        with self.lock:
-            return self._public_state(self.tables[table_id], for_player=for_player)
+        table = self.tables[table_id]
+        with table.lock:
+            return self._public_state(table, for_player=for_player)
+
+    def spectator_frame(self, table_id: int) -> bytes:
+        """The public view as a UTF-8 JSON ``state`` message, encoded once per table version and shared."""
+        table = self.tables[table_id]
+        frame = table.spectator_frame
+        if frame is not None and frame[0] == table.version:
+            return frame[1]
+        with table.lock:
+            frame = table.spectator_frame
+            if frame is None or frame[0] != table.version:
+                message = {"type": "state", "state": self._public_state(table, for_player=None)}
+                frame = (table.version, json.dumps(message, separators=(",", ":"), ensure_ascii=False).encode())
+                table.spectator_frame = frame
+            return frame[1]
+
+    def _seat_table_id(self, player_id: str, table_id: int | None) -> int:
+        seats = self.seats_of(player_id)
+        if not seats:
+            raise ValueError("Player is not seated at any table")
+        if table_id is None:
+            if len(seats) > 1:
+                raise ValueError("Player is seated at several tables; pass a table id")
+            (table_id,) = seats
+        elif table_id not in seats:
+            raise ValueError("Player is not seated at this table")
+        return table_id
+
+    def _index_add(self, player_id: str, table_id: int) -> None:
+        with self.index_lock:
+            self.user_seats[player_id] = self.seats_of(player_id) | {table_id}
+
+    def _index_remove(self, player_id: str, table_id: int) -> None:
+        with self.index_lock:
+            seats = self.seats_of(player_id) - {table_id}
+            if seats:
+                self.user_seats[player_id] = seats
+            else:
+                self.user_seats.pop(player_id, None)
 
     def _compute_commit(self, table: TableState, player: SeatPlayer, action: str, amount: int) -> int:
         base = table.current_bet
         if action == "call":
-            return base if not player.seen else base * 2
+            stake = base if not player.seen else base * 2
+            # The last player still able to bet calls an all-in by matching it.
+            if at_most_one(table.acting_mask):
+                return max(stake, self._top_contribution(table) - player.total_bet)
+            return stake
 
         if player.seen:
             return max(amount, base * 4)
         return max(amount, base * 2)
 
     def _start_hand(self, table: TableState) -> None:
-        table.deck = new_deck()
         table.pot = 0
         table.current_bet = table.boot_amount
         table.hand_active = True
-        table.hand_started_at = datetime.utcnow()
+        table.hand_started_at = datetime.utcnow() if self.log_timestamps else None
+        table.hand_no += 1
 
-        eligible_players = [player for player in table.players if player.chips >= table.boot_amount]
-        removed = [player for player in table.players if player.chips < table.boot_amount]
+        eligible_players = [player for player in table.players if self._keeps_seat(table, player)]
+        removed = [player for player in table.players if not self._keeps_seat(table, player)]
         for player in removed:
-            self.user_table.pop(player.player_id, None)
+            self._index_remove(player.player_id, table.table_id)
+            if table.tournament_id is not None:
+                reason = "busted"
+            else:
+                reason = "short_stack" if player.chips < table.boot_amount else "missed_turns"
+            table.action_log.append({"event": "seat_lost", "player_id": player.player_id, "reason": reason, "chips": player.chips})
 
         table.players = eligible_players
+        if removed:
+            self._seats_changed(table)
         if len(table.players) < 2:
+            self._reindex(table)
             table.hand_active = False
             table.action_log.append({"event": "hand_cancelled", "reason": "insufficient_eligible_players"})
             return
 
+        if self.shuffler is not None:
+            table.shuffle = self.shuffler.deal(shuffled_deck)
+            table.deck = list(table.shuffle.deck)
+        else:
+            table.shuffle = None
+            table.deck = new_deck(self.rng.getrandbits(64))
+
         for player in table.players:
             player.packed = False
             player.seen = False
-            player.total_bet = table.boot_amount
-            player.chips -= table.boot_amount
-            table.pot += table.boot_amount
+            # Only a tournament short stack can have less than the boot: it antes what it has.
+            ante = min(table.boot_amount, player.chips)
+            player.total_bet = ante
+            player.chips -= ante
+            player.all_in = player.chips == 0
+            table.pot += ante
             player.cards = [table.deck.pop(), table.deck.pop(), table.deck.pop()]
+        self._reindex(table)
 
         table.turn_idx = (table.dealer_idx + 1) % len(table.players)
-        table.action_log.append({"event": "hand_start", "at": datetime.utcnow().isoformat(), "pot": table.pot})
+        start: dict[str, Any] = {"event": "hand_start", "at": self._now(), "pot": table.pot}
+        if table.shuffle is not None:
+            start["commitment"] = table.shuffle.commitment
+        table.action_log.append(start)
+        # Stacks the boot emptied are all-in from the start and never take a turn.
+        if self._current_player(table).all_in:
+            self._advance_turn(table)
+        self._maybe_finish_hand(table)
+
+    def _now(self) -> str | None:
+        return datetime.utcnow().isoformat() if self.log_timestamps else None
+
+    def _touch(self, table: TableState) -> None:
+        table.version += 1
+
+    def _seats_changed(self, table: TableState) -> None:
+        if self.on_seats_changed is not None:
+            self.on_seats_changed(table)
+
+    def _reveal(self, table: TableState) -> dict[str, str]:
+        """The seed behind this hand's deck, logged when the hand ends so the commitment can be checked."""
+        return {"seed": table.shuffle.reveal} if table.shuffle is not None else {}
+
+    def _can_post(self, table: TableState, player: SeatPlayer) -> bool:
+        """Cash tables need the full boot; tournament stacks play down to their last chip."""
+        if table.tournament_id is not None:
+            return player.chips > 0
+        return player.chips >= table.boot_amount
+
+    def _keeps_seat(self, table: TableState, player: SeatPlayer) -> bool:
+        # Tournament players who time out are blinded off instead of unseated.
+        if table.tournament_id is not None:
+            return player.chips > 0
+        return self._can_post(table, player) and player.missed_turns < MAX_MISSED_TURNS
+
+    def _maybe_start(self, table: TableState) -> None:
+        if len(table.players) >= 2 and not table.hand_active and not table.paused:
+            self._start_hand(table)
+
+    def _turn_marker(self, table: TableState) -> tuple[str, int] | None:
+        if not table.hand_active or not table.players:
+            return None
+        player = self._current_player(table)
+        if player.is_bot:
+            return None
+        return (player.player_id, len(table.action_log))
 
     def _current_player(self, table: TableState) -> SeatPlayer:
         return table.players[table.turn_idx]
 
     def _advance_turn(self, table: TableState) -> None:
-        if not table.players:
-            return
-        for _ in range(len(table.players)):
-            table.turn_idx = (table.turn_idx + 1) % len(table.players)
-            candidate = table.players[table.turn_idx]
-            if not candidate.packed and candidate.chips > 0:
-                return
+        # With nobody left to act the turn stays put, as the hand is about to be settled.
+        if table.acting_mask:
+            table.turn_idx = next_seat(table.acting_mask, table.turn_idx)
 
     def _active_players(self, table: TableState) -> list[SeatPlayer]:
-        return [player for player in table.players if not player.packed]
+        return [table.players[seat] for seat in iter_seats(table.live_mask)]
+
+    def _reindex(self, table: TableState) -> None:
+        """Rebuild the seat index after seating changes; per-action updates go through _pack and _bet."""
+        table.seat_of = {player.player_id: seat for seat, player in enumerate(table.players)}
+        table.live_mask = sum(1 << seat for seat, player in enumerate(table.players) if not player.packed)
+        table.acting_mask = sum(
+            1 << seat for seat, player in enumerate(table.players) if not player.packed and not player.all_in
+        )
+        table.live_count = table.live_mask.bit_count()
+
+    def _pack(self, table: TableState, player: SeatPlayer) -> None:
+        if player.packed:
+            return
+        player.packed = True
+        bit = 1 << table.seat_of[player.player_id]
+        table.live_mask &= ~bit
+        table.acting_mask &= ~bit
+        table.live_count -= 1
+
+    def _bet(self, table: TableState, player: SeatPlayer, action: str, commit: int) -> None:
+        commit = min(commit, player.chips)
+        player.chips -= commit
+        player.total_bet += commit
+        table.pot += commit
+        player.all_in = player.chips == 0
+        if player.all_in:
+            table.acting_mask &= ~(1 << table.seat_of[player.player_id])
+        if action == "raise":
+            if not player.seen and commit > table.current_bet:
+                table.current_bet = commit
+            if player.seen and commit // 2 > table.current_bet:
+                table.current_bet = commit // 2
 
     def _showdown_on_demand(self, table: TableState, player: SeatPlayer) -> None:
-        active_players = self._active_players(table)
-        if len(active_players) != 2:
+        if table.live_count != 2:
             raise ValueError("Show action is only allowed with exactly two active players")
 
         show_cost = table.current_bet if not player.seen else table.current_bet * 2
-        if player.chips < show_cost:
-            raise ValueError("Insufficient chips for show")
+        self._bet(table, player, "show", show_cost)
+        self._showdown(table, self._active_players(table))
+
+    def _side_show(self, table: TableState, player: SeatPlayer) -> None:
+        """Compare hands with the previous live player; the weaker hand packs, the requester on a tie."""
+        if not player.seen:
+            raise ValueError("Side-show is only allowed after seeing your cards")
+        if table.live_count < 3:
+            raise ValueError("Side-show needs at least three active players; use show")
+        target = table.players[prev_seat(table.live_mask, table.seat_of[player.player_id])]
+        if not target.seen:
+            raise ValueError("Side-show needs the previous player to have seen their cards")
+        cost = self._compute_commit(table, player, "call", 0)
+        if player.chips < cost:
+            raise ValueError("Insufficient chips for side-show")
+
+        self._bet(table, player, "sideshow", cost)
+        best = rank_hands({player.player_id: player.cards, target.player_id: target.cards})[0]
+        loser = target if best == [player.player_id] else player
+        self._pack(table, loser)
+        table.action_log.append(
+            {"event": "sideshow", "player_id": player.player_id, "target": target.player_id, "loser": loser.player_id}
+        )
 
-        player.chips -= show_cost
-        player.total_bet += show_cost
-        table.pot += show_cost
+    def _maybe_finish_hand(self, table: TableState) -> None:
+        if table.live_count >= 2:
+            # At the pot limit every live hand is shown down.
+            if table.pot >= table.boot_amount * POT_LIMIT_BOOTS:
+                self._showdown(table, self._active_players(table))
+            # Nobody left to bet against (everyone still in, bar at most one, is all-in): once the
+            # last bettor has answered the highest contribution, the hand is shown down.
+            elif at_most_one(table.acting_mask):
+                top = self._top_contribution(table)
+                if table.acting_mask and table.players[table.acting_mask.bit_length() - 1].total_bet < top:
+                    table.turn_idx = table.acting_mask.bit_length() - 1
+                else:
+                    self._showdown(table, self._active_players(table))
+            return
+        if not table.live_count:
+            return
 
-        players_cards = {active.player_id: active.cards for active in active_players}
-        winner_id, _ = best_hand(players_cards)
-        winner = next(active for active in active_players if active.player_id == winner_id)
+        winner = table.players[table.live_mask.bit_length() - 1]
         winner.chips += table.pot
+        table.action_log.append({"event": "hand_win", "winner": winner.player_id, "pot": table.pot, **self._reveal(table)})
+        table.dealer_idx = (table.dealer_idx + 1) % len(table.players)
+        table.hand_active = False
+        self._deal_next(table)
+
+    def _top_contribution(self, table: TableState) -> int:
+        return max(table.players[seat].total_bet for seat in iter_seats(table.live_mask))
 
-        table.action_log.append({"event": "showdown", "winner": winner.player_id, "pot": table.pot})
+    def _showdown(self, table: TableState, contenders: list[SeatPlayer]) -> None:
+        pots = self._settle(table, contenders)
+        table.action_log.append(
+            {"event": "showdown", "winner": pots[0]["winners"][0], "pot": table.pot, "pots": pots, **self._reveal(table)}
+        )
         table.hand_active = False
         table.dealer_idx = (table.dealer_idx + 1) % len(table.players)
+        self._deal_next(table)
 
-        if len([active for active in table.players if active.chips >= table.boot_amount]) >= 2:
-            self._start_hand(table)
-
-    def _maybe_finish_hand(self, table: TableState) -> None:
-        active_players = self._active_players(table)
-        if len(active_players) != 1:
-            return
+    def _settle(self, table: TableState, contenders: list[SeatPlayer]) -> list[dict[str, Any]]:
+        """Split ``table.pot`` into a main pot and side pots and pay each to its best eligible hand.
 
-        winner = active_players[0]
-        winner.chips += table.pot
-        table.action_log.append({"event": "hand_win", "winner": winner.player_id, "pot": table.pot})
-        table.dealer_idx = (table.dealer_idx + 1) % len(table.players)
-        table.hand_active = False
+        Pot boundaries are the distinct contributions of the players still in: a player
+        is eligible for every pot up to their own contribution. Chips a packed player put
+        in above the highest contender go to the last pot. All hands are ranked in one
+        :func:`~app.teenpatti.rank_hands` pass; tied winners split a pot and odd chips go
+        to the first winner left of the dealer.
+        """
+        count = len(table.players)
+        first = table.dealer_idx + 1
+        ranked = sorted(contenders, key=lambda p: p.total_bet)
+        # Lower tier is stronger; equal tiers tie.
+        tier_of = {
+            player_id: tier
+            for tier, group in enumerate(rank_hands({p.player_id: p.cards for p in ranked}))
+            for player_id in group
+        }
+        contributions = [player.total_bet for player in table.players]
+
+        pots: list[dict[str, Any]] = []
+        floor = 0
+        for idx, player in enumerate(ranked):
+            level = player.total_bet
+            if level == floor:
+                continue
+            last = level == ranked[-1].total_bet
+            amount = sum((bet if last else min(bet, level)) - min(bet, floor) for bet in contributions)
+            eligible = ranked[idx:]
+            best = min(tier_of[p.player_id] for p in eligible)
+            winners = sorted((p for p in eligible if tier_of[p.player_id] == best), key=lambda p: (table.seat_of[p.player_id] - first) % count)
+            share, odd = divmod(amount, len(winners))
+            for position, winner in enumerate(winners):
+                winner.chips += share + (1 if position < odd else 0)
+            pots.append({"amount": amount, "winners": [winner.player_id for winner in winners]})
+            floor = level
+            if last:
+                break
+        return pots
 
-        if len([player for player in table.players if player.chips >= table.boot_amount]) >= 2:
+    def _deal_next(self, table: TableState) -> None:
+        if self.auto_deal and not table.paused and sum(self._can_post(table, player) for player in table.players) >= 2:
             self._start_hand(table)
 
-    def _bot_dominance_score(self, table: TableState, bot: SeatPlayer) -> float:
-        """
-        Near-unbeatable elite mode:
-        Bot evaluates real opponent cards (perfect-information strategy)
-        and estimates dominance in current hand.
-        """
-        active = [p for p in self._active_players(table) if p.player_id != bot.player_id]
-        if not active:
-            return 1.0
-
-        wins = 0.0
-        for opp in active:
-            result = compare_hands(bot.cards, opp.cards)
-            if result > 0:
-                wins += 1.0
-            elif result == 0:
-                wins += 0.5
-        return wins / len(active)
+    def _opponent_raises(self, table: TableState, bot: SeatPlayer) -> int:
+        """Raises made this hand by opponents who have seen their cards and are still in."""
+        live_seen = {p.player_id for p in self._active_players(table) if p.seen and p.player_id != bot.player_id}
+        raises = 0
+        for entry in reversed(table.action_log):
+            if entry["event"] == "hand_start":
+                break
+            if entry.get("action") == "raise" and entry.get("player_id") in live_seen:
+                raises += 1
+        return raises
 
     def _bot_decision(self, table: TableState, bot: SeatPlayer) -> tuple[str, int]:
+        """Decide from the bot's own information only: its cards once seen, the pot and the betting so far."""
         active_players = self._active_players(table)
-        if len(active_players) == 2:
+        opponents = len(active_players) - 1
+        if opponents == 1 or table.pot >= BOT_SEE_POT_MULTIPLE * table.boot_amount:
             bot.seen = True
 
-        dominance = self._bot_dominance_score(table, bot)
+        equity = hand_equity(bot.cards, opponents) if bot.seen else blind_equity(opponents)
+        equity *= BOT_RAISE_DISCOUNT ** self._opponent_raises(table, bot)
         call_commit = self._compute_commit(table, bot, "call", 0)
         raise_commit = self._compute_commit(table, bot, "raise", table.current_bet * 8)
-
-        if bot.chips < call_commit:
-            return ("pack", 0)
+        # A short stack can only call all-in, which is also all it risks.
+        call_commit = min(call_commit, bot.chips)
+        pot_odds = call_commit / (table.pot + call_commit) if call_commit else 0.0
 
         # If bot is likely losing badly, cut loss aggressively.
-        if dominance < 0.2:
+        if equity * (opponents + 1) < BOT_PACK_SHARE:
             return ("pack", 0)
 
         # With two players, trigger decisive showdown when dominating.
-        if len(active_players) == 2 and dominance >= 0.95 and bot.chips >= call_commit:
+        if opponents == 1 and bot.seen and equity >= BOT_SHOW_EQUITY:
             return ("show", 0)
 
         # High-confidence hands apply pressure with big raises.
-        if dominance >= 0.75 and bot.chips >= raise_commit:
+        if equity >= BOT_RAISE_EQUITY and bot.chips >= raise_commit:
             return ("raise", raise_commit)
 
-        # Mid-confidence hands keep pot control by calling.
-        if dominance >= 0.4:
+        # Otherwise stay in while the pot pays for the call.
+        if equity >= pot_odds:
             return ("call", call_commit)
 
         # Low-confidence fallback: rare bluff otherwise fold.
-        if random.random() < 0.05 and bot.chips >= raise_commit:
+        if self.rng.random() < 0.05 and bot.chips >= raise_commit:
             return ("raise", raise_commit)
         return ("pack", 0)
 
     def _play_bots_until_human_turn(self, table: TableState) -> None:
-        safety = 0
-        while table.hand_active and safety < 40:
-            safety += 1
+        """Play bots until a human is to act, through the end of this hand and into at most one more.
+
+        Every hand ends on its own (folds, all-ins or the pot limit), so the chain is bounded
+        without an action cap; stopping after the next deal keeps bot-only tables from looping.
+        """
+        if not self.inline_bots:
+            return
+        last_hand = table.hand_no + 1
+        while table.hand_active and table.hand_no <= last_hand:
             bot = self._current_player(table)
             if not bot.is_bot:
                 break
-
-            action, amount = self._bot_decision(table, bot)
-            if action == "pack":
-                bot.packed = True
-            elif action == "show":
-                self._showdown_on_demand(table, bot)
-            else:
-                commit = self._compute_commit(table, bot, action, amount)
-                if bot.chips < commit:
-                    bot.packed = True
-                else:
-                    bot.chips -= commit
-                    bot.total_bet += commit
-                    table.pot += commit
-                    if action == "raise":
-                        if not bot.seen and commit > table.current_bet:
-                            table.current_bet = commit
-                        if bot.seen and commit // 2 > table.current_bet:
-                            table.current_bet = commit // 2
-
-            table.action_log.append(
-                {
-                    "event": "bot_action",
-                    "player_id": bot.player_id,
-                    "action": action,
-                    "amount": amount,
-                    "at": datetime.utcnow().isoformat(),
-                }
-            )
-
+            self._play_bot_action(table, bot)
+
+    def _play_bot_action(self, table: TableState, bot: SeatPlayer) -> None:
+        strategy = self.strategies.get(bot.player_id)
+        action, amount = strategy.choose_action(self, table, bot) if strategy else self._bot_decision(table, bot)
+        if action == "pack":
+            self._pack(table, bot)
+        elif action == "show":
+            self._showdown_on_demand(table, bot)
+        elif action == "sideshow":
+            self._side_show(table, bot)
+        else:
+            commit = self._compute_commit(table, bot, action, amount)
+            if action == "raise" and bot.chips < commit:
+                # A raise it cannot cover becomes an all-in call.
+                action = "call"
+                commit = self._compute_commit(table, bot, action, 0)
+            self._bet(table, bot, action, commit)
+
+        table.action_log.append(
+            {
+                "event": "bot_action",
+                "player_id": bot.player_id,
+                "action": action,
+                "amount": amount,
+                "at": self._now(),
+            }
+        )
+
+        if action != "show":
             self._advance_turn(table)
             self._maybe_finish_hand(table)
 
@@ -360,6 +788,7 @@ class GameManager:
                     "chips": player.chips,
                     "seen": player.seen,
                     "packed": player.packed,
+                    "all_in": player.all_in,
                     "is_bot": player.is_bot,
                     "cards": cards,
                     "total_bet": player.total_bet,
@@ -370,6 +799,7 @@ class GameManager:
         return {
             "table_id": table.table_id,
             "name": table.name,
+            "version": table.version,
             "pot": table.pot,
             "boot_amount": table.boot_amount,
             "current_bet": table.current_bet,
@@ -1,27 +1,121 @@
 from __future__ import annotations
 
+from bisect import bisect_right
 from dataclasses import dataclass, field
 from datetime import datetime
+from operator import itemgetter
 import random
-from threading import Lock
-from typing import Any
+from threading import Lock, RLock
+import time
+from typing import Any, Callable, Protocol
+
+from .ludo_bitboard import LudoPosition, from_table, to_table
+from .ludo_search import LudoSearchBot
+from .ludo_rules import (
+    BOARD_SIZE,
+    CLASSIC,
+    COLORS,
+    HOME_LENGTH,
+    MAX_STEPS,
+    PATH_MASKS,
+    SAFE_SQUARES,
+    START_SQUARES,
+    STEP_SQUARES,
+    TOKENS_PER_PLAYER,
+    LudoRules,
+)
+from .registry import ShardedTableRegistry
+from .seats import next_seat
+from .shuffle import SeededShuffle, ShuffleService
+
+HISTORY_LIMIT = 200
+# History entries included in a full state when the client has no cursor yet.
+HISTORY_WINDOW = 80
+MAX_TABLES_PER_USER = 3
+BOT_LEVELS = ("standard", "expert")
+# Consecutive timed-out turns after which a seat is handed to a bot.
+MAX_MISSED_TURNS = 3
+# Events a client can apply incrementally; anything else forces a full-state resync.
+DELTA_EVENTS = {"roll", "no_move", "turn_forfeit", "move", "player_finished", "game_end", "timeout"}
 
-COLORS = ["red", "green", "yellow", "blue"]
-TOKENS_PER_PLAYER = 4
-BOARD_SIZE = 52
-HOME_LENGTH = 6
-MAX_STEPS = BOARD_SIZE + HOME_LENGTH - 1
-SAFE_SQUARES = {0, 8, 13, 21, 26, 34, 39, 47}
 
-
-@dataclass
 class LudoToken:
-    token_id: int
-    steps: int = -1
+    """A single token; every change of ``steps`` is reported to the owning table's board index."""
+
+    __slots__ = ("token_id", "_steps", "_on_move")
+
+    def __init__(self, token_id: int, steps: int = -1) -> None:
+        self.token_id = token_id
+        self._steps = steps
+        self._on_move: Callable[[int, int], None] | None = None
+
+    def __repr__(self) -> str:
+        return f"LudoToken(token_id={self.token_id}, steps={self._steps})"
+
+    @property
+    def steps(self) -> int:
+        return self._steps
+
+    @steps.setter
+    def steps(self, value: int) -> None:
+        old = self._steps
+        self._steps = value
+        if self._on_move is not None and old != value:
+            self._on_move(old, value)
 
     @property
     def finished(self) -> bool:
-        return self.steps >= MAX_STEPS
+        return self._steps >= MAX_STEPS
+
+
+class LudoBoard:
+    """Incrementally maintained occupancy of the shared track.
+
+    ``counts[pos]`` is the number of tokens on a square, ``seat_counts[seat][pos]``
+    the number owned by one seat, and ``blockades`` the squares holding two or more
+    tokens. Tokens update it through their ``steps`` setter, so it never needs a rebuild;
+    ``revision`` counts those updates so cached renderings can tell the board moved.
+    """
+
+    __slots__ = ("counts", "seat_counts", "blockades", "blockade_mask", "revision")
+
+    def __init__(self) -> None:
+        self.counts = [0] * BOARD_SIZE
+        self.seat_counts = [[0] * BOARD_SIZE for _ in COLORS]
+        self.blockades: set[int] = set()
+        self.blockade_mask = 0
+        self.revision = 0
+
+    def attach(self, seat: int, token: LudoToken) -> None:
+        squares = STEP_SQUARES[seat]
+
+        def on_move(old: int, new: int) -> None:
+            self.revision += 1
+            if 0 <= old < BOARD_SIZE:
+                self._remove(seat, squares[old])
+            if 0 <= new < BOARD_SIZE:
+                self._add(seat, squares[new])
+
+        token._on_move = on_move
+        if 0 <= token.steps < BOARD_SIZE:
+            self._add(seat, squares[token.steps])
+
+    def _add(self, seat: int, pos: int) -> None:
+        self.counts[pos] += 1
+        self.seat_counts[seat][pos] += 1
+        if self.counts[pos] == 2:
+            self.blockades.add(pos)
+            self.blockade_mask |= 1 << pos
+
+    def _remove(self, seat: int, pos: int) -> None:
+        self.counts[pos] -= 1
+        self.seat_counts[seat][pos] -= 1
+        if self.counts[pos] == 1:
+            self.blockades.discard(pos)
+            self.blockade_mask &= ~(1 << pos)
+
+    def has_opponent(self, seat: int, pos: int) -> bool:
+        return self.counts[pos] > self.seat_counts[seat][pos]
 
 
 @dataclass
@@ -32,6 +126,8 @@ class LudoPlayer:
     is_bot: bool = False
     tokens: list[LudoToken] = field(default_factory=list)
     rank: int | None = None
+    color_idx: int = 0
+    missed_turns: int = 0
 
 
 @dataclass
@@ -46,79 +142,152 @@ class LudoTable:
     consecutive_sixes: int = 0
     history: list[dict[str, Any]] = field(default_factory=list)
     winners: list[str] = field(default_factory=list)
+    # player_id -> seat, and a bit per seat that has brought all its tokens home.
+    seat_of: dict[str, int] = field(default_factory=dict)
+    finished_mask: int = 0
+    version: int = 0
+    history_floor: int = 0
+    board: LudoBoard = field(default_factory=LudoBoard, repr=False)
+    # ((version, board revision), shared view, turn player's movable token ids); see LudoManager._view.
+    view_cache: tuple[tuple[int, int], dict[str, Any], list[int]] | None = field(default=None, repr=False, compare=False)
+    bot_level: str = "standard"
+    rules: LudoRules = CLASSIC
+    rolls: int = 0
+    captures: int = 0
+    # Committed seed and the dice stream it drives, when the game was started with a ShuffleService.
+    dice_seed: SeededShuffle | None = field(default=None, repr=False)
+    dice_rng: random.Random | None = field(default=None, repr=False, compare=False)
+    created_by: str | None = None
+    last_activity: float = field(default_factory=time.monotonic)
+    lock: RLock = field(default_factory=RLock, repr=False, compare=False)
+
+
+class LudoStrategy(Protocol):
+    name: str
+
+    def choose_move(self, manager: LudoManager, table: LudoTable, bot: LudoPlayer, dice: int) -> LudoToken: ...
 
 
 class LudoManager:
-    def __init__(self) -> None:
-        self.tables: dict[int, LudoTable] = {}
+    def __init__(self, rng: random.Random | None = None) -> None:
+        self.tables: ShardedTableRegistry[LudoTable] = ShardedTableRegistry()
         self.user_table: dict[str, int] = {}
         self.next_table_id = 1
-        self.lock = Lock()
-
-    def create_table(self, name: str) -> dict[str, Any]:
-        with self.lock:
-            table = LudoTable(table_id=self.next_table_id, name=name)
-            self.tables[self.next_table_id] = table
+        # Guards table id allocation and the user_table seat index only; game
+        # state is protected by each table's own lock.
+        self.index_lock = Lock()
+        self.owned_tables: dict[str, set[int]] = {}
+        self.max_tables_per_user = MAX_TABLES_PER_USER
+        # Shared by every "expert" table; its transposition cache outlives single decisions.
+        self.search_bot = LudoSearchBot()
+        self.rng = rng or random
+        # When set, each game rolls from its own committed dice stream instead of ``rng``.
+        self.shuffler: ShuffleService | None = None
+        # Per-bot overrides of the table's bot level, keyed by player id.
+        self.strategies: dict[str, LudoStrategy] = {}
+        # When False, bot turns are left to step_bot() so a caller can pace them
+        # (the web app hands them to the bot scheduler instead of the request).
+        self.inline_bots = True
+
+    def create_table(
+        self,
+        name: str,
+        owner_id: str | None = None,
+        bot_level: str = "standard",
+        rules: LudoRules = CLASSIC,
+    ) -> dict[str, Any]:
+        if bot_level not in BOT_LEVELS:
+            raise ValueError("Unknown bot level")
+        with self.index_lock:
+            if owner_id is not None:
+                owned = self.owned_tables.setdefault(owner_id, set())
+                if len(owned) >= self.max_tables_per_user:
+                    raise ValueError("Ludo table creation limit reached")
+                owned.add(self.next_table_id)
+            table = LudoTable(
+                table_id=self.next_table_id, name=name, created_by=owner_id, bot_level=bot_level, rules=rules
+            )
             self.next_table_id += 1
+        self.tables[table.table_id] = table
+        with table.lock:
             return self._state(table, None)
 
     def list_tables(self) -> list[dict[str, Any]]:
-        with self.lock:
-            return [
+        return sorted(
+            (
                 {"table_id": t.table_id, "name": t.name, "players": len(t.players), "hand_active": t.hand_active}
                 for t in self.tables.values()
-            ]
+            ),
+            key=lambda item: item["table_id"],
+        )
 
     def join_table(self, table_id: int, player_id: str, display_name: str, is_bot: bool = False) -> dict[str, Any]:
-        with self.lock:
-            table = self.tables[table_id]
+        table = self.tables[table_id]
+        with table.lock:
             return self._join_table_locked(table, player_id, display_name, is_bot)
 
     def add_bots(self, table_id: int, count: int) -> dict[str, Any]:
-        with self.lock:
-            table = self.tables[table_id]
+        table = self.tables[table_id]
+        with table.lock:
             for _ in range(count):
-                if len(table.players) >= 4:
+                if len(table.players) >= table.rules.seats:
                     break
-                bot_id = f"ludo-bot-{table.table_id}-{len(table.players)+1}-{random.randint(1000,9999)}"
-                bot_name = random.choice(["Atlas", "Nova", "Titan", "Pulse"]) + " Bot"
+                bot_id = f"ludo-bot-{table.table_id}-{len(table.players)+1}-{self.rng.randint(1000,9999)}"
+                bot_name = self.rng.choice(["Atlas", "Nova", "Titan", "Pulse"]) + " Bot"
                 self._join_table_locked(table, bot_id, bot_name, is_bot=True)
             return self._state(table, None)
 
     def start_game(self, table_id: int) -> dict[str, Any]:
-        with self.lock:
-            table = self.tables[table_id]
-            if len(table.players) != 4:
-                raise ValueError("Ludo requires exactly 4 players")
+        table = self.tables[table_id]
+        with table.lock:
+            if len(table.players) != table.rules.seats:
+                raise ValueError(f"Ludo requires exactly {table.rules.seats} players")
             table.hand_active = True
             table.turn_idx = 0
             table.dice_value = None
             table.pending_move = False
             table.consecutive_sixes = 0
             table.winners = []
+            table.finished_mask = 0
+            table.rolls = 0
+            table.captures = 0
+            table.board = LudoBoard()
             for player in table.players:
                 player.rank = None
-                player.tokens = [LudoToken(token_id=i) for i in range(TOKENS_PER_PLAYER)]
-            table.history.append({"event": "game_start", "at": datetime.utcnow().isoformat()})
+                player.tokens = [LudoToken(token_id=i, steps=steps) for i, steps in enumerate(table.rules.start_steps)]
+                self._attach_tokens(table, player)
+            start = {"event": "game_start", "at": datetime.utcnow().isoformat()}
+            if self.shuffler is not None:
+                table.dice_seed, table.dice_rng = self.shuffler.open_stream()
+                start["commitment"] = table.dice_seed.commitment
+            else:
+                table.dice_seed = table.dice_rng = None
+            self._log(table, start)
             self._auto_play_bots(table)
             return self._state(table, None)
 
     def roll_dice(self, player_id: str) -> dict[str, Any]:
-        with self.lock:
-            table, player = self._table_player(player_id)
+        table = self._player_table(player_id)
+        with table.lock:
+            player = self._seat(table, player_id)
             self._assert_turn(table, player_id)
             if not table.hand_active:
                 raise ValueError("No active game")
             if table.pending_move:
                 raise ValueError("Move pending; play a token first")
+            player.missed_turns = 0
 
-            dice = random.randint(1, 6)
+            dice = self._roll(table)
+            table.rolls += 1
             table.dice_value = dice
             table.consecutive_sixes = table.consecutive_sixes + 1 if dice == 6 else 0
-            table.history.append({"event": "roll", "player_id": player_id, "dice": dice})
+            self._log(table, {"event": "roll", "player_id": player_id, "dice": dice})
 
-            if table.consecutive_sixes >= 3:
-                table.history.append({"event": "turn_forfeit", "player_id": player_id, "reason": "three_consecutive_sixes"})
+            if table.consecutive_sixes >= table.rules.forfeit_sixes:
+                self._log(
+                    table,
+                    {"event": "turn_forfeit", "player_id": player_id, "reason": "three_consecutive_sixes", "count": table.rules.forfeit_sixes},
+                )
                 table.dice_value = None
                 table.pending_move = False
                 table.consecutive_sixes = 0
@@ -130,7 +299,7 @@ class LudoManager:
             if not movable:
                 table.dice_value = None
                 table.pending_move = False
-                table.history.append({"event": "no_move", "player_id": player_id})
+                self._log(table, {"event": "no_move", "player_id": player_id})
                 if dice != 6:
                     self._advance_turn(table)
                 self._auto_play_bots(table)
@@ -141,38 +310,129 @@ class LudoManager:
             return self._state(table, player.player_id)
 
     def move_token(self, player_id: str, token_id: int) -> dict[str, Any]:
-        with self.lock:
-            table, player = self._table_player(player_id)
+        table = self._player_table(player_id)
+        with table.lock:
+            player = self._seat(table, player_id)
             self._move_token_locked(table, player, token_id)
+            player.missed_turns = 0
             self._auto_play_bots(table)
             return self._state(table, player.player_id)
 
-    def get_state(self, table_id: int, for_player: str | None) -> dict[str, Any]:
-        with self.lock:
-            table = self.tables.get(table_id)
-            if table is None:
-                raise KeyError(table_id)
-            return self._state(table, for_player)
+    def get_state(
+        self,
+        table_id: int,
+        for_player: str | None,
+        since_version: int | None = None,
+        history_after: int | None = None,
+    ) -> dict[str, Any]:
+        """Full state, or a delta when ``since_version`` is given.
+
+        ``history_after`` is the ``history_cursor`` of the client's previous full
+        state; only entries logged after it are sent instead of the trailing window.
+        """
+        table = self.tables.get(table_id)
+        if table is None:
+            raise KeyError(table_id)
+        with table.lock:
+            if since_version is None:
+                return self._state(table, for_player, history_after)
+            return self._delta(table, for_player, since_version)
+
+    def turn_marker(self, table_id: int) -> tuple[str, int] | None:
+        """Identifies the human turn in progress (player id, version), or None if no human is to act."""
+        table = self.tables[table_id]
+        with table.lock:
+            return self._turn_marker(table)
+
+    def expire_turn(self, table_id: int, marker: tuple[str, int] | None) -> dict[str, Any] | None:
+        """Roll and/or move for a human whose turn ``marker`` ran out; None if that turn has moved on.
+
+        After ``MAX_MISSED_TURNS`` in a row the seat is handed to a bot and the
+        player's seat index entry is freed.
+        """
+        table = self.tables[table_id]
+        with table.lock:
+            if marker is None or self._turn_marker(table) != marker:
+                return None
+            player = table.players[table.turn_idx]
+            player.missed_turns += 1
+            self._log(table, {"event": "timeout", "player_id": player.player_id})
+            self._play_bot_turn(table, player)
+            if player.missed_turns >= MAX_MISSED_TURNS:
+                self._hand_seat_to_bot(table, player)
+            self._auto_play_bots(table)
+            return self._state(table, None)
+
+    def export_position(self, table_id: int) -> LudoPosition:
+        table = self.tables[table_id]
+        with table.lock:
+            return from_table(table)
+
+    def import_position(self, table_id: int, position: LudoPosition) -> dict[str, Any]:
+        table = self.tables[table_id]
+        with table.lock:
+            if len(position.color_idx) != len(table.players):
+                raise ValueError("Position does not match table seats")
+            to_table(position, table)
+            self._log(table, {"event": "position_import"})
+            return self._state(table, None)
+
+    def reap_idle(self, idle_seconds: float, now: float | None = None) -> list[int]:
+        """Drop tables with no activity for ``idle_seconds`` and free their seats and quota."""
+        cutoff = (time.monotonic() if now is None else now) - idle_seconds
+        reaped: list[int] = []
+        for table in self.tables.values():
+            if table.last_activity >= cutoff:
+                continue
+            with table.lock:
+                if table.last_activity >= cutoff or self.tables.get(table.table_id) is not table:
+                    continue
+                self.tables.pop(table.table_id)
+                with self.index_lock:
+                    for player in table.players:
+                        if self.user_table.get(player.player_id) == table.table_id:
+                            del self.user_table[player.player_id]
+                    owned = self.owned_tables.get(table.created_by) if table.created_by is not None else None
+                    if owned is not None:
+                        owned.discard(table.table_id)
+                        if not owned:
+                            del self.owned_tables[table.created_by]
+            reaped.append(table.table_id)
+        return reaped
+
+    def _log(self, table: LudoTable, entry: dict[str, Any]) -> None:
+        table.version += 1
+        table.last_activity = time.monotonic()
+        entry["seq"] = table.version
+        table.history.append(entry)
+        if len(table.history) > HISTORY_LIMIT * 2:
+            table.history_floor = table.history[-HISTORY_LIMIT - 1]["seq"]
+            del table.history[:-HISTORY_LIMIT]
 
     def _join_table_locked(self, table: LudoTable, player_id: str, display_name: str, is_bot: bool) -> dict[str, Any]:
-        if player_id in self.user_table:
-            raise ValueError("Player already joined a Ludo table")
         if table.hand_active:
             raise ValueError("Cannot join during active game")
-        if len(table.players) >= 4:
-            raise ValueError("Ludo supports exactly 4 players")
-
-        color = COLORS[len(table.players)]
+        if len(table.players) >= table.rules.seats:
+            raise ValueError(f"Ludo table supports exactly {table.rules.seats} players")
+        with self.index_lock:
+            if player_id in self.user_table:
+                raise ValueError("Player already joined a Ludo table")
+            self.user_table[player_id] = table.table_id
+
+        color_idx = table.rules.seat_colors[len(table.players)]
+        color = COLORS[color_idx]
         player = LudoPlayer(
             player_id=player_id,
             display_name=display_name,
             color=color,
             is_bot=is_bot,
             tokens=[LudoToken(token_id=i) for i in range(TOKENS_PER_PLAYER)],
+            color_idx=color_idx,
         )
+        table.seat_of[player_id] = len(table.players)
         table.players.append(player)
-        self.user_table[player_id] = table.table_id
-        table.history.append({"event": "join", "player_id": player_id, "color": color, "at": datetime.utcnow().isoformat()})
+        self._attach_tokens(table, player)
+        self._log(table, {"event": "join", "player_id": player_id, "color": color, "at": datetime.utcnow().isoformat()})
         return self._state(table, player_id)
 
     def _move_token_locked(self, table: LudoTable, player: LudoPlayer, token_id: int) -> None:
@@ -190,14 +450,17 @@ class LudoManager:
         prev = token.steps
         token.steps = 0 if token.steps == -1 else token.steps + dice
         captured_ids = self._capture_if_needed(table, player, token)
+        table.captures += len(captured_ids)
         reached_home_now = prev < MAX_STEPS and token.steps == MAX_STEPS
 
         if all(t.finished for t in player.tokens) and player.player_id not in table.winners:
             player.rank = len(table.winners) + 1
             table.winners.append(player.player_id)
-            table.history.append({"event": "player_finished", "player_id": player.player_id, "rank": player.rank})
+            table.finished_mask |= 1 << table.seat_of[player.player_id]
+            self._log(table, {"event": "player_finished", "player_id": player.player_id, "rank": player.rank})
 
-        table.history.append(
+        self._log(
+            table,
             {
                 "event": "move",
                 "player_id": player.player_id,
@@ -213,9 +476,12 @@ class LudoManager:
         table.pending_move = False
         table.dice_value = None
 
-        if len(table.winners) >= 3:
+        if len(table.winners) >= len(table.players) - 1:
             table.hand_active = False
-            table.history.append({"event": "game_end", "winners": table.winners, "at": datetime.utcnow().isoformat()})
+            end = {"event": "game_end", "winners": table.winners, "at": datetime.utcnow().isoformat()}
+            if table.dice_seed is not None:
+                end["seed"] = table.dice_seed.reveal
+            self._log(table, end)
             return
 
         grant_extra_turn = bool(captured_ids) or reached_home_now or dice == 6
@@ -223,17 +489,35 @@ class LudoManager:
             table.consecutive_sixes = 0
             self._advance_turn(table)
 
-    def _table_player(self, player_id: str) -> tuple[LudoTable, LudoPlayer]:
+    def _turn_marker(self, table: LudoTable) -> tuple[str, int] | None:
+        if not table.hand_active or not table.players:
+            return None
+        player = table.players[table.turn_idx]
+        if player.is_bot:
+            return None
+        return (player.player_id, table.version)
+
+    def _hand_seat_to_bot(self, table: LudoTable, player: LudoPlayer) -> None:
+        player.is_bot = True
+        with self.index_lock:
+            if self.user_table.get(player.player_id) == table.table_id:
+                del self.user_table[player.player_id]
+        self._log(table, {"event": "seat_autoplay", "player_id": player.player_id})
+
+    def _player_table(self, player_id: str) -> LudoTable:
         table_id = self.user_table.get(player_id)
         if table_id is None:
             raise ValueError("Player is not seated at a Ludo table")
         table = self.tables.get(table_id)
         if table is None:
             raise ValueError("Table not found")
-        player = next((p for p in table.players if p.player_id == player_id), None)
-        if player is None:
+        return table
+
+    def _seat(self, table: LudoTable, player_id: str) -> LudoPlayer:
+        seat = table.seat_of.get(player_id)
+        if seat is None:
             raise ValueError("Player seat is stale")
-        return table, player
+        return table.players[seat]
 
     def _assert_turn(self, table: LudoTable, player_id: str) -> None:
         if not table.players or table.players[table.turn_idx].player_id != player_id:
@@ -247,61 +531,38 @@ class LudoManager:
 
     def _movable_tokens(self, table: LudoTable, player: LudoPlayer, dice: int) -> list[LudoToken]:
         movable: list[LudoToken] = []
-        blockades = self._blockade_positions(table)
+        masks = table.rules.path_masks[player.color_idx]
+        blocked = table.board.blockade_mask
         for token in player.tokens:
-            if token.finished:
+            steps = token.steps
+            if steps >= MAX_STEPS:
                 continue
-            if token.steps == -1:
+            if steps == -1:
                 if dice != 6:
                     continue
-                destination_steps = 0
-            else:
-                destination_steps = token.steps + dice
-                if destination_steps > MAX_STEPS:
-                    continue
-
-            if self._path_blocked(table, player, token.steps, destination_steps, blockades):
+            elif steps + dice > MAX_STEPS:
+                continue
+            if masks[steps + 1][dice] & blocked:
                 continue
             movable.append(token)
         return movable
 
-    def _path_blocked(
-        self,
-        table: LudoTable,
-        player: LudoPlayer,
-        start_steps: int,
-        destination_steps: int,
-        blockades: set[int],
-    ) -> bool:
-        if destination_steps >= BOARD_SIZE:
-            return False
-
-        if start_steps < 0:
-            destination_pos = self._board_position_from_steps(player, destination_steps)
-            return destination_pos in blockades if destination_pos is not None else False
-
-        # Check every traversed board square including destination for blockade crossing.
-        for step in range(start_steps + 1, destination_steps + 1):
-            if step >= BOARD_SIZE:
-                break
-            pos = self._board_position_from_steps(player, step)
-            if pos in blockades:
-                return True
-        return False
-
     def _capture_if_needed(self, table: LudoTable, mover: LudoPlayer, moved_token: LudoToken) -> list[str]:
         moved_pos = self._board_position(mover, moved_token)
-        if moved_pos is None or moved_pos in SAFE_SQUARES:
+        rules = table.rules
+        if moved_pos is None or (rules.safe_mask >> moved_pos) & 1:
             return []
 
-        captured_players: list[str] = []
-        board_occ = self._occupancy_by_position(table)
-        # Blockade (2+ tokens) is protected from capture and should be impossible to land on due to movement validation.
-        if len(board_occ.get(moved_pos, [])) > 2:
+        board = table.board
+        # With blockades on, a stack of 2+ is protected from capture (and path masks keep movers off it).
+        if board.counts[moved_pos] > rules.capture_limit:
             return []
 
+        captured_players: list[str] = []
+        mover_seat = mover.color_idx
         for opponent in table.players:
-            if opponent.player_id == mover.player_id:
+            seat = opponent.color_idx
+            if seat == mover_seat or not board.seat_counts[seat][moved_pos]:
                 continue
             for token in opponent.tokens:
                 if token.steps < 0 or token.steps >= BOARD_SIZE:
@@ -315,66 +576,98 @@ class LudoManager:
         return self._board_position_from_steps(player, token.steps)
 
     def _board_position_from_steps(self, player: LudoPlayer, steps: int) -> int | None:
-        if steps < 0 or steps >= BOARD_SIZE:
+        if steps < 0:
             return None
-        start = COLORS.index(player.color) * 13
-        return (start + steps) % BOARD_SIZE
-
-    def _occupancy_by_position(self, table: LudoTable) -> dict[int, list[tuple[str, int]]]:
-        occ: dict[int, list[tuple[str, int]]] = {}
-        for player in table.players:
-            for token in player.tokens:
-                pos = self._board_position(player, token)
-                if pos is None:
-                    continue
-                occ.setdefault(pos, []).append((player.player_id, token.token_id))
-        return occ
+        return STEP_SQUARES[player.color_idx][steps]
+
+    def _attach_tokens(self, table: LudoTable, player: LudoPlayer) -> None:
+        for token in player.tokens:
+            table.board.attach(player.color_idx, token)
 
     def _blockade_positions(self, table: LudoTable) -> set[int]:
-        occ = self._occupancy_by_position(table)
-        return {pos for pos, entries in occ.items() if len(entries) >= 2}
+        if table.rules.open_starts:
+            return table.board.blockades - START_SQUARES
+        return table.board.blockades
+
+    def _roll(self, table: LudoTable) -> int:
+        return (table.dice_rng or self.rng).randint(1, 6)
 
     def _advance_turn(self, table: LudoTable) -> None:
-        for _ in range(len(table.players)):
-            table.turn_idx = (table.turn_idx + 1) % len(table.players)
-            if table.players[table.turn_idx].rank is None:
-                return
+        playing = ((1 << len(table.players)) - 1) & ~table.finished_mask
+        if playing:
+            table.turn_idx = next_seat(playing, table.turn_idx)
 
     def _auto_play_bots(self, table: LudoTable) -> None:
+        if not self.inline_bots:
+            return
         guard = 0
         while table.hand_active and table.players and table.players[table.turn_idx].is_bot and guard < 120:
             guard += 1
-            bot = table.players[table.turn_idx]
-            if not table.pending_move:
-                dice = random.randint(1, 6)
-                table.dice_value = dice
-                table.consecutive_sixes = table.consecutive_sixes + 1 if dice == 6 else 0
-                table.history.append({"event": "roll", "player_id": bot.player_id, "dice": dice})
-
-                if table.consecutive_sixes >= 3:
-                    table.history.append({"event": "turn_forfeit", "player_id": bot.player_id, "reason": "three_consecutive_sixes"})
-                    table.consecutive_sixes = 0
-                    table.dice_value = None
-                    table.pending_move = False
-                    self._advance_turn(table)
-                    continue
+            self._play_bot_turn(table, table.players[table.turn_idx])
+
+    def play_out(self, table_id: int) -> dict[str, Any]:
+        """Run bot turns until the game ends or a human is to act, with no iteration guard."""
+        table = self.tables[table_id]
+        with table.lock:
+            while table.hand_active and table.players[table.turn_idx].is_bot:
+                self._play_bot_turn(table, table.players[table.turn_idx])
+            return self._state(table, None)
 
-                movable = self._movable_tokens(table, bot, dice)
-                if not movable:
-                    table.history.append({"event": "no_move", "player_id": bot.player_id})
-                    table.dice_value = None
-                    table.pending_move = False
-                    if dice != 6:
-                        self._advance_turn(table)
-                    continue
+    def step_bot(self, table_id: int) -> dict[str, Any] | None:
+        """Play a single bot turn (roll and move); returns the state, or None when no bot is to act."""
+        table = self.tables[table_id]
+        with table.lock:
+            if not table.hand_active or not table.players or not table.players[table.turn_idx].is_bot:
+                return None
+            self._play_bot_turn(table, table.players[table.turn_idx])
+            return self._state(table, None)
+
+    def _play_bot_turn(self, table: LudoTable, bot: LudoPlayer) -> None:
+        if not table.pending_move:
+            dice = self._roll(table)
+            table.rolls += 1
+            table.dice_value = dice
+            table.consecutive_sixes = table.consecutive_sixes + 1 if dice == 6 else 0
+            self._log(table, {"event": "roll", "player_id": bot.player_id, "dice": dice})
+
+            if table.consecutive_sixes >= table.rules.forfeit_sixes:
+                self._log(
+                    table,
+                    {"event": "turn_forfeit", "player_id": bot.player_id, "reason": "three_consecutive_sixes", "count": table.rules.forfeit_sixes},
+                )
+                table.consecutive_sixes = 0
+                table.dice_value = None
+                table.pending_move = False
+                self._advance_turn(table)
+                return
+
+            movable = self._movable_tokens(table, bot, dice)
+            if not movable:
+                self._log(table, {"event": "no_move", "player_id": bot.player_id})
+                table.dice_value = None
+                table.pending_move = False
+                if dice != 6:
+                    self._advance_turn(table)
+                return
 
-                table.pending_move = True
+            table.pending_move = True
 
-            assert table.dice_value is not None
-            move = self._choose_bot_move(table, bot, table.dice_value)
-            self._move_token_locked(table, bot, move.token_id)
+        assert table.dice_value is not None
+        move = self._choose_bot_move(table, bot, table.dice_value)
+        self._move_token_locked(table, bot, move.token_id)
 
     def _choose_bot_move(self, table: LudoTable, bot: LudoPlayer, dice: int) -> LudoToken:
+        strategy = self.strategies.get(bot.player_id)
+        if strategy is not None:
+            return strategy.choose_move(self, table, bot, dice)
+        ranked = self._ranked_moves(table, bot, dice)
+        if table.bot_level != "expert" or len(ranked) == 1:
+            return ranked[0]
+        token_id = self.search_bot.choose(from_table(table), dice, [t.token_id for t in ranked])
+        return self._find_token(bot, token_id)
+
+    def _ranked_moves(self, table: LudoTable, bot: LudoPlayer, dice: int) -> list[LudoToken]:
+        """Movable tokens ordered best-first by the standard lexicographic heuristic."""
         candidates = self._movable_tokens(table, bot, dice)
 
         def score(token: LudoToken) -> tuple[int, int, int, int, int]:
@@ -385,38 +678,51 @@ class LudoManager:
             progress_bonus = token.steps
             return (finish_bonus, capture_bonus, blockade_break_bonus, enter_bonus, progress_bonus)
 
-        return max(candidates, key=score)
+        # sorted() is stable, so the first entry is exactly what max() would pick.
+        return sorted(candidates, key=score, reverse=True)
 
     def _would_capture(self, table: LudoTable, player: LudoPlayer, token: LudoToken, dice: int) -> bool:
         new_steps = 0 if token.steps == -1 else token.steps + dice
         if new_steps >= BOARD_SIZE:
             return False
-        target = (COLORS.index(player.color) * 13 + new_steps) % BOARD_SIZE
-        if target in SAFE_SQUARES:
+        target = STEP_SQUARES[player.color_idx][new_steps]
+        rules = table.rules
+        if (rules.safe_mask >> target) & 1:
             return False
 
-        occ = self._occupancy_by_position(table).get(target, [])
-        if len(occ) >= 2:
+        board = table.board
+        if board.counts[target] >= rules.capture_limit:
             return False
-        return any(pid != player.player_id for pid, _ in occ)
-
-    def _movable_token_ids_for_player(self, table: LudoTable, for_player: str | None) -> list[int]:
-        if not table.pending_move or table.dice_value is None or not for_player:
-            return []
-        player = next((p for p in table.players if p.player_id == for_player), None)
-        if player is None:
-            return []
-        return [t.token_id for t in self._movable_tokens(table, player, table.dice_value)]
-
-    def _state(self, table: LudoTable, for_player: str | None) -> dict[str, Any]:
-        return {
+        return board.has_opponent(player.color_idx, target)
+
+    def _view(self, table: LudoTable) -> tuple[dict[str, Any], list[int]]:
+        """Viewer-independent state and the turn player's movable tokens, built once per version.
+
+        Only the player to move can have movable tokens, so every other viewer
+        shares the cached dict as is; callers must not modify it.
+        """
+        key = (table.version, table.board.revision)
+        cached = table.view_cache
+        if cached is not None and cached[0] == key:
+            return cached[1], cached[2]
+
+        turn_player = table.players[table.turn_idx] if table.players else None
+        movable: list[int] = []
+        if turn_player is not None and table.pending_move and table.dice_value is not None:
+            movable = [t.token_id for t in self._movable_tokens(table, turn_player, table.dice_value)]
+        view = {
             "table_id": table.table_id,
+            "version": table.version,
             "name": table.name,
+            "bot_level": table.bot_level,
+            "rules": table.rules.summary,
             "hand_active": table.hand_active,
-            "turn_player": table.players[table.turn_idx].player_id if table.players else None,
+            "turn_player": turn_player.player_id if turn_player is not None else None,
             "dice_value": table.dice_value,
             "pending_move": table.pending_move,
-            "winners": table.winners,
+            "winners": list(table.winners),
+            "rolls": table.rolls,
+            "captures": table.captures,
             "blockades": sorted(self._blockade_positions(table)),
             "players": [
                 {
@@ -430,13 +736,59 @@ class LudoManager:
                             "token_id": t.token_id,
                             "steps": t.steps,
                             "finished": t.finished,
-                            "board_position": self._board_position(p, t),
+                            "board_position": STEP_SQUARES[p.color_idx][t.steps] if t.steps >= 0 else None,
                         }
                         for t in p.tokens
                     ],
                 }
                 for p in table.players
             ],
-            "movable_tokens": self._movable_token_ids_for_player(table, for_player),
-            "history": table.history[-80:],
+        }
+        table.view_cache = (key, view, movable)
+        return view, movable
+
+    def _movable_for(self, table: LudoTable, for_player: str | None) -> list[int]:
+        view, movable = self._view(table)
+        return movable if for_player is not None and view["turn_player"] == for_player else []
+
+    def _history_after(self, table: LudoTable, cursor: int | None) -> list[dict[str, Any]]:
+        history = table.history
+        if cursor is None or cursor < table.history_floor:
+            return history[-HISTORY_WINDOW:]
+        return history[bisect_right(history, cursor, key=itemgetter("seq")) :]
+
+    def _state(self, table: LudoTable, for_player: str | None, history_after: int | None = None) -> dict[str, Any]:
+        view, _ = self._view(table)
+        return {
+            **view,
+            "movable_tokens": self._movable_for(table, for_player),
+            "history": self._history_after(table, history_after),
+            "history_cursor": table.history[-1]["seq"] if table.history else table.history_floor,
+        }
+
+    def _delta(self, table: LudoTable, for_player: str | None, since_version: int) -> dict[str, Any]:
+        if since_version == table.version:
+            return {"table_id": table.table_id, "version": table.version, "changed": False}
+        if since_version > table.version or since_version < table.history_floor:
+            return self._state(table, for_player)
+
+        events: list[dict[str, Any]] = []
+        for entry in reversed(table.history):
+            if entry["seq"] <= since_version:
+                break
+            if entry["event"] not in DELTA_EVENTS:
+                return self._state(table, for_player)
+            events.append(entry)
+        events.reverse()
+        return {
+            "table_id": table.table_id,
+            "version": table.version,
+            "changed": True,
+            "events": events,
+            "hand_active": table.hand_active,
+            "turn_player": table.players[table.turn_idx].player_id if table.players else None,
+            "dice_value": table.dice_value,
+            "pending_move": table.pending_move,
+            "winners": list(table.winners),
+            "movable_tokens": self._movable_for(table, for_player),
         }
@@ -0,0 +1,218 @@
+"""Compact Ludo position for bot lookahead and mass simulation.
+
+A :class:`LudoPosition` keeps all token progress in one ``array('b')`` (index
+``seat * 4 + token``), a per-square token count and a 52-bit blockade mask.
+:func:`roll`, :func:`move` and :func:`undo` follow the same rules as
+``LudoManager`` (yard exit on six, exact finish, blockades, safe squares,
+capture/home/six extra turns, three-sixes forfeit) for the position's
+compiled :class:`~app.ludo_rules.LudoRules`, without allocating dataclasses
+per token.
+"""
+
+from __future__ import annotations
+
+from array import array
+from dataclasses import dataclass, field
+from typing import TYPE_CHECKING
+
+from .ludo_rules import BOARD_SIZE, CLASSIC, MAX_STEPS, STEP_SQUARES, TOKENS_PER_PLAYER, LudoRules
+
+if TYPE_CHECKING:
+    from .ludo import LudoTable
+
+
+@dataclass
+class LudoPosition:
+    color_idx: tuple[int, ...]
+    steps: array = field(default_factory=lambda: array("b"))
+    counts: bytearray = field(default_factory=lambda: bytearray(BOARD_SIZE))
+    blockade_mask: int = 0
+    turn: int = 0
+    consecutive_sixes: int = 0
+    active: bool = True
+    winners: list[int] = field(default_factory=list)
+    rules: LudoRules = CLASSIC
+
+    @classmethod
+    def new(cls, color_idx: tuple[int, ...], rules: LudoRules = CLASSIC) -> LudoPosition:
+        return cls(color_idx=color_idx, steps=array("b", [-1] * (len(color_idx) * TOKENS_PER_PLAYER)), rules=rules)
+
+    @property
+    def seats(self) -> int:
+        return len(self.color_idx)
+
+    def key(self) -> tuple[bytes, int, int, LudoRules]:
+        """Hashable identity for transposition tables (winners follow from the steps)."""
+        return (self.steps.tobytes(), self.turn, self.consecutive_sixes, self.rules)
+
+    def square(self, idx: int) -> int | None:
+        steps = self.steps[idx]
+        if steps < 0:
+            return None
+        return STEP_SQUARES[self.color_idx[idx // TOKENS_PER_PLAYER]][steps]
+
+    def seat_finished(self, seat: int) -> bool:
+        base = seat * TOKENS_PER_PLAYER
+        return all(self.steps[i] >= MAX_STEPS for i in range(base, base + TOKENS_PER_PLAYER))
+
+    def copy(self) -> LudoPosition:
+        return LudoPosition(
+            color_idx=self.color_idx,
+            steps=array("b", self.steps),
+            counts=bytearray(self.counts),
+            blockade_mask=self.blockade_mask,
+            turn=self.turn,
+            consecutive_sixes=self.consecutive_sixes,
+            active=self.active,
+            winners=list(self.winners),
+            rules=self.rules,
+        )
+
+
+# (turn, consecutive_sixes, active, len(winners), [(token index, previous steps), ...])
+Undo = tuple[int, int, bool, int, list[tuple[int, int]]]
+
+
+def from_steps(color_idx: tuple[int, ...], steps: list[int], turn: int = 0, rules: LudoRules = CLASSIC) -> LudoPosition:
+    pos = LudoPosition.new(color_idx, rules)
+    for idx, value in enumerate(steps):
+        _set(pos, idx, value)
+    pos.turn = turn
+    return pos
+
+
+def from_table(table: LudoTable) -> LudoPosition:
+    pos = from_steps(
+        tuple(p.color_idx for p in table.players),
+        [t.steps for p in table.players for t in p.tokens],
+        table.turn_idx,
+        table.rules,
+    )
+    pos.consecutive_sixes = table.consecutive_sixes
+    pos.active = table.hand_active
+    pos.winners = [table.seat_of[pid] for pid in table.winners]
+    return pos
+
+
+def to_table(pos: LudoPosition, table: LudoTable) -> None:
+    """Write ``pos`` back into ``table``; token setters keep the table's board index in sync."""
+    for seat, player in enumerate(table.players):
+        for t, token in enumerate(player.tokens):
+            token.steps = pos.steps[seat * TOKENS_PER_PLAYER + t]
+        player.rank = pos.winners.index(seat) + 1 if seat in pos.winners else None
+    table.winners = [table.players[seat].player_id for seat in pos.winners]
+    table.finished_mask = sum(1 << seat for seat in pos.winners)
+    table.turn_idx = pos.turn
+    table.consecutive_sixes = pos.consecutive_sixes
+    table.hand_active = pos.active
+    table.dice_value = None
+    table.pending_move = False
+
+
+def movable(pos: LudoPosition, dice: int) -> list[int]:
+    """Token numbers (0-3) the player to move may play with ``dice``."""
+    seat = pos.turn
+    masks = pos.rules.path_masks[pos.color_idx[seat]]
+    blocked = pos.blockade_mask
+    base = seat * TOKENS_PER_PLAYER
+    result: list[int] = []
+    for t in range(TOKENS_PER_PLAYER):
+        steps = pos.steps[base + t]
+        if steps >= MAX_STEPS:
+            continue
+        if steps == -1:
+            if dice != 6:
+                continue
+        elif steps + dice > MAX_STEPS:
+            continue
+        if masks[steps + 1][dice] & blocked:
+            continue
+        result.append(t)
+    return result
+
+
+def roll(pos: LudoPosition, dice: int) -> tuple[list[int], Undo]:
+    """Register a roll for the player to move.
+
+    Returns the playable tokens; when there are none (or three sixes were rolled)
+    the turn has already been passed on exactly as ``LudoManager`` would.
+    """
+    undo: Undo = (pos.turn, pos.consecutive_sixes, pos.active, len(pos.winners), [])
+    pos.consecutive_sixes = pos.consecutive_sixes + 1 if dice == 6 else 0
+    if pos.consecutive_sixes >= pos.rules.forfeit_sixes:
+        pos.consecutive_sixes = 0
+        _advance_turn(pos)
+        return [], undo
+    tokens = movable(pos, dice)
+    if not tokens and dice != 6:
+        _advance_turn(pos)
+    return tokens, undo
+
+
+def move(pos: LudoPosition, token: int, dice: int) -> Undo:
+    """Play ``token`` of the player to move; the caller guarantees it is in :func:`movable`."""
+    seat = pos.turn
+    changes: list[tuple[int, int]] = []
+    undo: Undo = (pos.turn, pos.consecutive_sixes, pos.active, len(pos.winners), changes)
+    idx = seat * TOKENS_PER_PLAYER + token
+    prev = pos.steps[idx]
+    new = 0 if prev == -1 else prev + dice
+    changes.append((idx, prev))
+    _set(pos, idx, new)
+
+    captured = False
+    if new < BOARD_SIZE:
+        square = STEP_SQUARES[pos.color_idx[seat]][new]
+        # With blockades on, only the mover plus one other token can be a capture; 3+ is protected.
+        if 1 < pos.counts[square] <= pos.rules.capture_limit and not (pos.rules.safe_mask >> square) & 1:
+            for other in range(len(pos.steps)):
+                if other // TOKENS_PER_PLAYER == seat:
+                    continue
+                if pos.square(other) == square:
+                    changes.append((other, pos.steps[other]))
+                    _set(pos, other, -1)
+                    captured = True
+
+    reached_home = new == MAX_STEPS
+    if reached_home and seat not in pos.winners and pos.seat_finished(seat):
+        pos.winners.append(seat)
+    if len(pos.winners) >= pos.seats - 1:
+        pos.active = False
+        return undo
+    if not (captured or reached_home or dice == 6):
+        pos.consecutive_sixes = 0
+        _advance_turn(pos)
+    return undo
+
+
+def undo(pos: LudoPosition, record: Undo) -> None:
+    turn, sixes, active, winners_len, changes = record
+    for idx, prev in reversed(changes):
+        _set(pos, idx, prev)
+    pos.turn = turn
+    pos.consecutive_sixes = sixes
+    pos.active = active
+    del pos.winners[winners_len:]
+
+
+def _advance_turn(pos: LudoPosition) -> None:
+    for _ in range(pos.seats):
+        pos.turn = (pos.turn + 1) % pos.seats
+        if pos.turn not in pos.winners:
+            return
+
+
+def _set(pos: LudoPosition, idx: int, steps: int) -> None:
+    squares = STEP_SQUARES[pos.color_idx[idx // TOKENS_PER_PLAYER]]
+    old = pos.steps[idx]
+    if 0 <= old < BOARD_SIZE:
+        square = squares[old]
+        pos.counts[square] -= 1
+        if pos.counts[square] == 1:
+            pos.blockade_mask &= ~(1 << square)
+    pos.steps[idx] = steps
+    if 0 <= steps < BOARD_SIZE:
+        square = squares[steps]
+        pos.counts[square] += 1
+        if pos.counts[square] == 2:
+            pos.blockade_mask |= 1 << square
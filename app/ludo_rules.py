@@ -0,0 +1,154 @@
+"""Ludo board geometry and precomputed movement tables shared by every Ludo engine.
+
+Board geometry is fixed. Everything a table may vary (seat count, tokens that
+start out of the yard, blockades, safe squares, the sixes forfeit) is described
+by a :class:`LudoVariant` and compiled once into an immutable :class:`LudoRules`,
+whose lookup tables the engines index without per-move branching on the variant.
+"""
+
+from __future__ import annotations
+
+from dataclasses import dataclass, field, replace
+from functools import lru_cache
+from typing import Any
+
+COLORS = ["red", "green", "yellow", "blue"]
+TOKENS_PER_PLAYER = 4
+BOARD_SIZE = 52
+HOME_LENGTH = 6
+MAX_STEPS = BOARD_SIZE + HOME_LENGTH - 1
+SAFE_SQUARES = {0, 8, 13, 21, 26, 34, 39, 47}
+SAFE_MASK = sum(1 << square for square in SAFE_SQUARES)
+MAX_DICE = 6
+
+
+def _build_step_squares() -> tuple[tuple[int | None, ...], ...]:
+    """Per color: steps (0..MAX_STEPS) -> shared board square, or None once in the home lane."""
+    return tuple(
+        tuple((color_idx * 13 + steps) % BOARD_SIZE if steps < BOARD_SIZE else None for steps in range(MAX_STEPS + 1))
+        for color_idx in range(len(COLORS))
+    )
+
+
+def _build_path_masks(
+    step_squares: tuple[tuple[int | None, ...], ...], open_squares: int = 0
+) -> tuple[tuple[tuple[int, ...], ...], ...]:
+    """Per color: [steps + 1][dice] -> bitmask of board squares a move must not find blockaded.
+
+    Leaving the yard only checks the start square; a move ending in the home lane is never blocked.
+    Squares in ``open_squares`` are left out of every mask, so a stack there never blocks.
+    """
+    masks = []
+    for squares in step_squares:
+        by_start = []
+        for start in range(-1, MAX_STEPS):
+            row = [0]
+            for dice in range(1, MAX_DICE + 1):
+                destination = 0 if start < 0 else start + dice
+                mask = 0
+                if destination < BOARD_SIZE:
+                    for step in range(0 if start < 0 else start + 1, destination + 1):
+                        mask |= 1 << squares[step]
+                row.append(mask & ~open_squares)
+            by_start.append(tuple(row))
+        masks.append(tuple(by_start))
+    return tuple(masks)
+
+
+STEP_SQUARES = _build_step_squares()
+START_SQUARES = frozenset(squares[0] for squares in STEP_SQUARES)
+PATH_MASKS = _build_path_masks(STEP_SQUARES)
+# For variants that start tokens out of the yard: the stacks they begin with never block.
+OPEN_START_PATH_MASKS = _build_path_masks(STEP_SQUARES, sum(1 << square for square in START_SQUARES))
+
+# Seats take opposite colors first so a two-player game starts on opposite sides.
+SEAT_COLORS = {2: (0, 2), 3: (0, 1, 2), 4: (0, 1, 2, 3)}
+# Effectively "never": used where a variant disables a threshold rule.
+NEVER = 1 << 30
+_OPEN_PATHS = tuple(tuple((0,) * (MAX_DICE + 1) for _ in range(MAX_STEPS + 1)) for _ in COLORS)
+
+
+@dataclass(frozen=True)
+class LudoVariant:
+    name: str = "classic"
+    players: int = 4
+    tokens_out: int = 0
+    blockades: bool = True
+    safe_squares: frozenset[int] = frozenset(SAFE_SQUARES)
+    sixes_forfeit: int = 3
+
+
+@dataclass(frozen=True, eq=False)
+class LudoRules:
+    """Compiled variant. Identity-hashed: :func:`compile_rules` returns one instance per variant."""
+
+    variant: LudoVariant
+    seat_colors: tuple[int, ...]
+    start_steps: tuple[int, ...]
+    safe_mask: int
+    path_masks: tuple[tuple[tuple[int, ...], ...], ...]
+    # Highest token count on a square (mover included) at which a landing still captures.
+    capture_limit: int
+    # Stacks on start squares are not blockades (set when tokens start out of the yard).
+    open_starts: bool
+    forfeit_sixes: int
+    summary: dict[str, Any] = field(compare=False)
+
+    @property
+    def seats(self) -> int:
+        return len(self.seat_colors)
+
+
+VARIANTS = {
+    "classic": LudoVariant(),
+    "quick": LudoVariant(name="quick", tokens_out=TOKENS_PER_PLAYER),
+    "no_blockade": LudoVariant(name="no_blockade", blockades=False),
+}
+
+
+@lru_cache(maxsize=256)
+def compile_rules(variant: LudoVariant) -> LudoRules:
+    if variant.players not in SEAT_COLORS:
+        raise ValueError("Ludo supports 2 to 4 players")
+    if not 0 <= variant.tokens_out <= TOKENS_PER_PLAYER:
+        raise ValueError("tokens_out must be between 0 and 4")
+    if any(not 0 <= square < BOARD_SIZE for square in variant.safe_squares):
+        raise ValueError("Safe squares must be on the shared track")
+    if variant.sixes_forfeit < 0:
+        raise ValueError("sixes_forfeit cannot be negative")
+    open_starts = variant.tokens_out > 1
+    if not variant.blockades:
+        path_masks = _OPEN_PATHS
+    else:
+        path_masks = OPEN_START_PATH_MASKS if open_starts else PATH_MASKS
+    return LudoRules(
+        variant=variant,
+        seat_colors=SEAT_COLORS[variant.players],
+        start_steps=tuple(0 if t < variant.tokens_out else -1 for t in range(TOKENS_PER_PLAYER)),
+        safe_mask=sum(1 << square for square in variant.safe_squares),
+        path_masks=path_masks,
+        capture_limit=2 if variant.blockades else NEVER,
+        open_starts=open_starts,
+        forfeit_sixes=variant.sixes_forfeit or NEVER,
+        summary={
+            "variant": variant.name,
+            "players": variant.players,
+            "tokens_out": variant.tokens_out,
+            "blockades": variant.blockades,
+            "safe_squares": sorted(variant.safe_squares),
+            "sixes_forfeit": variant.sixes_forfeit,
+        },
+    )
+
+
+def build_variant(name: str = "classic", **overrides: Any) -> LudoVariant:
+    """A preset from :data:`VARIANTS` with ``overrides`` applied (``None`` values are ignored)."""
+    if name not in VARIANTS:
+        raise ValueError("Unknown Ludo variant")
+    changes = {key: value for key, value in overrides.items() if value is not None}
+    if "safe_squares" in changes:
+        changes["safe_squares"] = frozenset(changes["safe_squares"])
+    return replace(VARIANTS[name], **changes)
+
+
+CLASSIC = compile_rules(VARIANTS["classic"])
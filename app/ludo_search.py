@@ -0,0 +1,164 @@
+"""Expectiminimax Ludo bot over :mod:`app.ludo_bitboard` positions.
+
+Chance nodes average over the six dice faces; the bot maximises its own
+evaluation on its turns and assumes opponents minimise it (paranoid search).
+Iterative deepening stops at a strict per-decision time budget, and chance-node
+values are shared across decisions through a bounded transposition cache.
+"""
+
+from __future__ import annotations
+
+import time
+
+from .ludo_bitboard import LudoPosition, move, roll, undo
+from .ludo_rules import BOARD_SIZE, MAX_DICE, MAX_STEPS, STEP_SQUARES, TOKENS_PER_PLAYER, LudoRules
+
+FINISHED_BONUS = 20.0
+ON_BOARD_BONUS = 6.0
+SAFE_BONUS = 2.0
+THREAT_PENALTY = 0.35
+DEFAULT_BUDGET_MS = 40.0
+DEFAULT_MAX_DEPTH = 4
+CACHE_LIMIT = 200_000
+
+
+class _Timeout(Exception):
+    pass
+
+
+def seat_value(pos: LudoPosition, seat: int) -> float:
+    """Leaf heuristic for one seat: progress, tokens out/home, safety and capture exposure."""
+    base = seat * TOKENS_PER_PLAYER
+    squares = STEP_SQUARES[pos.color_idx[seat]]
+    safe_mask = pos.rules.safe_mask
+    stacked = pos.rules.capture_limit
+    value = 0.0
+    for idx in range(base, base + TOKENS_PER_PLAYER):
+        steps = pos.steps[idx]
+        if steps < 0:
+            continue
+        if steps >= MAX_STEPS:
+            value += MAX_STEPS + FINISHED_BONUS
+            continue
+        value += steps + ON_BOARD_BONUS
+        if steps >= BOARD_SIZE:
+            continue
+        square = squares[steps]
+        if (safe_mask >> square) & 1 or pos.counts[square] >= stacked:
+            value += SAFE_BONUS
+        elif _threatened(pos, seat, square):
+            value -= (steps + ON_BOARD_BONUS) * THREAT_PENALTY
+    return value
+
+
+def evaluate(pos: LudoPosition, seat: int) -> float:
+    own = seat_value(pos, seat)
+    best_other = max(seat_value(pos, other) for other in range(pos.seats) if other != seat)
+    return own - best_other
+
+
+def _threatened(pos: LudoPosition, seat: int, square: int) -> bool:
+    for idx in range(len(pos.steps)):
+        if idx // TOKENS_PER_PLAYER == seat:
+            continue
+        steps = pos.steps[idx]
+        if steps < 0 or steps >= BOARD_SIZE:
+            continue
+        other = STEP_SQUARES[pos.color_idx[idx // TOKENS_PER_PLAYER]][steps]
+        if 1 <= (square - other) % BOARD_SIZE <= MAX_DICE and steps + (square - other) % BOARD_SIZE < BOARD_SIZE:
+            return True
+    return False
+
+
+class LudoSearchBot:
+    def __init__(
+        self,
+        budget_ms: float = DEFAULT_BUDGET_MS,
+        max_depth: int = DEFAULT_MAX_DEPTH,
+        cache_limit: int = CACHE_LIMIT,
+    ) -> None:
+        self.budget_ms = budget_ms
+        self.max_depth = max_depth
+        self.cache_limit = cache_limit
+        self.cache: dict[tuple[tuple[bytes, int, int, LudoRules], int, int], float] = {}
+
+    def choose(self, pos: LudoPosition, dice: int, tokens: list[int]) -> int:
+        """Pick one of ``tokens`` (ordered best-first by the caller's heuristic) for ``dice``."""
+        if len(tokens) == 1:
+            return tokens[0]
+        if len(self.cache) > self.cache_limit:
+            self.cache.clear()
+        search = _Search(pos.copy(), self.cache, time.perf_counter() + self.budget_ms / 1000)
+        best = tokens[0]
+        for depth in range(1, self.max_depth + 1):
+            try:
+                best = search.root(dice, tokens, depth)
+            except _Timeout:
+                break
+        return best
+
+
+class _Search:
+    def __init__(self, pos: LudoPosition, cache: dict, deadline: float) -> None:
+        self.pos = pos
+        self.root_seat = pos.turn
+        self.cache = cache
+        self.deadline = deadline
+        self.nodes = 0
+
+    def check_deadline(self) -> None:
+        # A chance node expands up to 24 leaf evaluations, so the clock is read at every one.
+        if time.perf_counter() > self.deadline:
+            raise _Timeout
+
+    def root(self, dice: int, tokens: list[int], depth: int) -> int:
+        best_token, best_value = tokens[0], float("-inf")
+        for token in tokens:
+            record = move(self.pos, token, dice)
+            try:
+                value = self.chance(depth - 1)
+            finally:
+                undo(self.pos, record)
+            # Strict comparison keeps the caller's heuristic order as tie-break.
+            if value > best_value:
+                best_token, best_value = token, value
+        return best_token
+
+    def chance(self, depth: int) -> float:
+        pos = self.pos
+        if depth <= 0 or not pos.active:
+            return evaluate(pos, self.root_seat)
+        key = (pos.key(), depth, self.root_seat)
+        cached = self.cache.get(key)
+        if cached is not None:
+            return cached
+
+        self.nodes += 1
+        self.check_deadline()
+
+        total = 0.0
+        for dice in range(1, MAX_DICE + 1):
+            tokens, roll_record = roll(pos, dice)
+            try:
+                total += self.decide(dice, tokens, depth) if tokens else self.chance(depth - 1)
+            finally:
+                undo(pos, roll_record)
+        value = total / MAX_DICE
+        self.cache[key] = value
+        return value
+
+    def decide(self, dice: int, tokens: list[int], depth: int) -> float:
+        pos = self.pos
+        maximize = pos.turn == self.root_seat
+        best: float | None = None
+        for token in tokens:
+            self.check_deadline()
+            record = move(pos, token, dice)
+            try:
+                value = self.chance(depth - 1)
+            finally:
+                undo(pos, record)
+            if best is None or (value > best if maximize else value < best):
+                best = value
+        assert best is not None
+        return best
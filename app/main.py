@@ -1,5 +1,8 @@
 from __future__ import annotations
 
+import asyncio
+import contextlib
+
 from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
 from fastapi.responses import FileResponse
@@ -7,9 +10,13 @@ from fastapi.staticfiles import StaticFiles
 
 from app.core.config import APP_NAME, APP_VERSION, STATIC_DIR, TEMPLATE_FILE
 from app.database import Base, SessionLocal, engine
-from app.routers import admin, auth, game, lobby, ludo, profile, twentynine
+from app.routers import admin, auth, game, lobby, ludo, profile, tournaments, twentynine
+from app.services.bot_scheduler import bot_scheduler
 from app.services.bootstrap import seed_default_admin, seed_tables
-from app.services.runtime import manager
+from app.services.lifecycle import run_table_reaper, run_tournament_director
+from app.services.persistence import persist_twentynine_results
+from app.services.runtime import PREGENERATED_DECKS, manager, shuffle_service, twentynine_manager
+from app.services.turn_timers import turn_timers
 
 
 def create_app() -> FastAPI:
@@ -30,8 +37,11 @@ def create_app() -> FastAPI:
     app.include_router(game.router)
     app.include_router(game.ws_router)
     app.include_router(admin.router)
+    app.include_router(tournaments.router)
     app.include_router(twentynine.router)
+    app.include_router(twentynine.ws_router)
     app.include_router(ludo.router)
+    app.include_router(ludo.ws_router)
 
     @app.get("/")
     def index() -> FileResponse:
@@ -46,6 +56,26 @@ def create_app() -> FastAPI:
             seed_tables(db, manager)
         finally:
             db.close()
+        twentynine_manager.result_sink = persist_twentynine_results
+        for build in PREGENERATED_DECKS:
+            shuffle_service.prefill(build)
+
+    @app.on_event("startup")
+    async def start_background_tasks() -> None:
+        app.state.table_reaper = asyncio.create_task(run_table_reaper())
+        app.state.tournament_director = asyncio.create_task(run_tournament_director())
+        bot_scheduler.on_idle = turn_timers.arm
+        app.state.turn_timers = asyncio.create_task(turn_timers.run())
+
+    @app.on_event("shutdown")
+    async def shutdown() -> None:
+        for task in (app.state.table_reaper, app.state.tournament_director, app.state.turn_timers):
+            task.cancel()
+            with contextlib.suppress(asyncio.CancelledError):
+                await task
+        await bot_scheduler.shutdown()
+        twentynine_manager.flush_results()
+        shuffle_service.shutdown()
 
     return app
 
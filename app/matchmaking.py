@@ -0,0 +1,128 @@
+"""Seat placement and consolidation for Teen Patti tables.
+
+Tables are grouped into stake tiers by boot amount. Each tier keeps a heap of
+the tables that still have room, ordered fullest first, so placing a player
+fills the busiest table instead of spreading players thin. Heap entries are
+never updated in place: a seating change pushes a fresh entry with a new
+generation, and stale entries are discarded when they reach the top.
+"""
+
+from __future__ import annotations
+
+import heapq
+from threading import Lock
+from typing import Any
+
+from .game import GameManager, TableState
+
+# Placement retries when a chosen table fills up before the join lands.
+MAX_PLACEMENT_ATTEMPTS = 5
+
+
+class Matchmaker:
+    def __init__(self, manager: GameManager) -> None:
+        self.manager = manager
+        self.lock = Lock()
+        # boot amount -> heap of (-seated, table_id, generation) for tables with room
+        self._heaps: dict[int, list[tuple[int, int, int]]] = {}
+        self._tiers: dict[int, set[int]] = {}
+        self._generation: dict[int, int] = {}
+        self._next_generation = 0
+        manager.on_seats_changed = self.refresh
+        for table in list(manager.tables.values()):
+            self.refresh(table)
+
+    def refresh(self, table: TableState) -> None:
+        """Re-index ``table`` after its seating changed (the manager calls this with the table lock held)."""
+        if table.tournament_id is not None:
+            return  # seated by the tournament director, never by placement
+        with self.lock:
+            self._next_generation += 1
+            generation = self._next_generation
+            self._generation[table.table_id] = generation
+            self._tiers.setdefault(table.boot_amount, set()).add(table.table_id)
+            heap = self._heaps.setdefault(table.boot_amount, [])
+            if len(table.players) < table.max_players:
+                heapq.heappush(heap, (-len(table.players), table.table_id, generation))
+            if len(heap) > 4 * len(self._tiers[table.boot_amount]):
+                self._compact(table.boot_amount)
+
+    def tiers(self) -> list[dict[str, Any]]:
+        with self.lock:
+            tiers = {boot: sorted(ids) for boot, ids in self._tiers.items()}
+        summary = []
+        for boot, table_ids in sorted(tiers.items()):
+            tables = [self.manager.tables[table_id] for table_id in table_ids]
+            summary.append(
+                {
+                    "boot_amount": boot,
+                    "tables": len(tables),
+                    "seated": sum(len(table.players) for table in tables),
+                    "open_seats": sum(table.max_players - len(table.players) for table in tables),
+                    "min_buyin": min(table.min_buyin for table in tables),
+                    "max_buyin": max(table.max_buyin for table in tables),
+                }
+            )
+        return summary
+
+    def join_any(self, boot_amount: int, player_id: str, display_name: str, buyin: int) -> dict[str, Any]:
+        """Seat a player at the fullest table with room in the ``boot_amount`` tier."""
+        if boot_amount not in self._tiers:
+            raise ValueError("Unknown stake tier")
+        for _ in range(MAX_PLACEMENT_ATTEMPTS):
+            table_id = self._best(boot_amount)
+            if table_id is None:
+                break
+            try:
+                return self.manager.join_table(table_id, player_id, display_name, buyin)
+            except ValueError as exc:
+                # Another join filled the table first; its refresh has already re-ranked it.
+                if str(exc) != "Table is full":
+                    raise
+        raise ValueError("No open seat in this stake tier")
+
+    def consolidate(self) -> list[dict[str, int | str]]:
+        """Move players stranded alone at an idle table to the fullest other table in their tier."""
+        moves: list[dict[str, int | str]] = []
+        with self.lock:
+            tiers = {boot: sorted(ids) for boot, ids in self._tiers.items()}
+        for boot, table_ids in tiers.items():
+            for table_id in table_ids:
+                table = self.manager.tables[table_id]
+                if table.hand_active or len(table.players) != 1:
+                    continue
+                target = self._best(boot, exclude=table_id)
+                if target is None or not self.manager.tables[target].players:
+                    continue
+                player_id = table.players[0].player_id
+                try:
+                    self.manager.transfer_seat(player_id, target, from_table_id=table_id)
+                except (KeyError, ValueError):
+                    # The table changed under us (a join, a new hand); try again next round.
+                    continue
+                moves.append({"player_id": player_id, "from_table": table_id, "to_table": target})
+        return moves
+
+    def _best(self, boot_amount: int, exclude: int | None = None) -> int | None:
+        with self.lock:
+            heap = self._heaps.get(boot_amount, [])
+            skipped = []
+            best = None
+            while heap:
+                entry = heap[0]
+                if self._generation.get(entry[1]) != entry[2]:
+                    heapq.heappop(heap)
+                    continue
+                if entry[1] == exclude:
+                    skipped.append(heapq.heappop(heap))
+                    continue
+                best = entry[1]
+                break
+            for entry in skipped:
+                heapq.heappush(heap, entry)
+            return best
+
+    def _compact(self, boot_amount: int) -> None:
+        heap = [entry for entry in self._heaps[boot_amount] if self._generation.get(entry[1]) == entry[2]]
+        heapq.heapify(heap)
+        self._heaps[boot_amount] = heap
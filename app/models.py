@@ -52,3 +52,16 @@ class AuditLog(Base):
     action: Mapped[str] = mapped_column(String(128))
     payload: Mapped[str] = mapped_column(Text, default="")
     created_at: Mapped[datetime] = mapped_column(DateTime, default=datetime.utcnow)
+
+
+class TwentyNineMatchResult(Base):
+    __tablename__ = "twentynine_match_results"
+
+    id: Mapped[int] = mapped_column(Integer, primary_key=True)
+    table_id: Mapped[int] = mapped_column(Integer, index=True)
+    match_no: Mapped[int] = mapped_column(Integer)
+    winner_team: Mapped[int] = mapped_column(Integer)
+    team0_score: Mapped[int] = mapped_column(Integer)
+    team1_score: Mapped[int] = mapped_column(Integer)
+    hands: Mapped[int] = mapped_column(Integer)
+    created_at: Mapped[datetime] = mapped_column(DateTime, default=datetime.utcnow)
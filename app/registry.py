@@ -0,0 +1,62 @@
+from __future__ import annotations
+
+from threading import Lock
+from typing import Generic, Iterator, TypeVar
+
+T = TypeVar("T")
+
+DEFAULT_SHARDS = 16
+
+
+class ShardedTableRegistry(Generic[T]):
+    """Table id -> table map split across shards so registry access never serialises on one lock.
+
+    Game state itself is protected by each table's own lock; the shard locks only
+    guard insertion, removal and iteration of the underlying dicts.
+    """
+
+    def __init__(self, shards: int = DEFAULT_SHARDS) -> None:
+        self._shards: list[dict[int, T]] = [{} for _ in range(shards)]
+        self._locks = [Lock() for _ in range(shards)]
+
+    def _shard(self, table_id: int) -> int:
+        return table_id % len(self._shards)
+
+    def __getitem__(self, table_id: int) -> T:
+        return self._shards[self._shard(table_id)][table_id]
+
+    def __setitem__(self, table_id: int, table: T) -> None:
+        idx = self._shard(table_id)
+        with self._locks[idx]:
+            self._shards[idx][table_id] = table
+
+    def __contains__(self, table_id: object) -> bool:
+        return isinstance(table_id, int) and table_id in self._shards[self._shard(table_id)]
+
+    def __len__(self) -> int:
+        return sum(len(shard) for shard in self._shards)
+
+    def __iter__(self) -> Iterator[int]:
+        return iter(self.keys())
+
+    def get(self, table_id: int, default: T | None = None) -> T | None:
+        return self._shards[self._shard(table_id)].get(table_id, default)
+
+    def pop(self, table_id: int, default: T | None = None) -> T | None:
+        idx = self._shard(table_id)
+        with self._locks[idx]:
+            return self._shards[idx].pop(table_id, default)
+
+    def keys(self) -> list[int]:
+        keys: list[int] = []
+        for shard, lock in zip(self._shards, self._locks):
+            with lock:
+                keys.extend(shard)
+        return keys
+
+    def values(self) -> list[T]:
+        values: list[T] = []
+        for shard, lock in zip(self._shards, self._locks):
+            with lock:
+                values.extend(shard.values())
+        return values
@@ -7,8 +7,10 @@ from sqlalchemy.orm import Session
 from app.deps import get_db, require_admin
 from app.models import AuditLog, User
 from app.schemas import AddBotsRequest
-from app.services.realtime import ws_manager
+from app.services.bot_scheduler import schedule_teenpatti_bots
 from app.services.runtime import manager
+from app.services.teenpatti_feed import publish_teenpatti_state
+from app.services.turn_timers import turn_timers
 
 router = APIRouter(prefix="/api/admin", tags=["admin"])
 
@@ -41,5 +43,7 @@ async def add_bots(
     )
     db.commit()
     state = manager.get_table_state(payload.table_id, for_player=str(admin_user.id))
-    await ws_manager.broadcast(payload.table_id, {"type": "state", "state": state})
+    await publish_teenpatti_state(payload.table_id)
+    schedule_teenpatti_bots(payload.table_id)
+    turn_timers.arm(payload.table_id)
     return {"message": "Bots added", "state": state}
@@ -1,13 +1,18 @@
 from __future__ import annotations
 
+from functools import partial
+
 from fastapi import APIRouter, Depends, HTTPException, WebSocket, WebSocketDisconnect
 from sqlalchemy.orm import Session
 
 from app.deps import get_current_user, get_db
 from app.models import User
-from app.schemas import ActionRequest, JoinTableRequest
+from app.schemas import ActionRequest, JoinAnyTableRequest, JoinTableRequest
+from app.services.bot_scheduler import schedule_teenpatti_bots
 from app.services.realtime import ws_manager
-from app.services.runtime import manager
+from app.services.runtime import manager, matchmaker
+from app.services.teenpatti_feed import publish_teenpatti_state
+from app.services.turn_timers import turn_timers
 
 router = APIRouter(prefix="/api/game", tags=["game"])
 ws_router = APIRouter(tags=["ws"])
@@ -19,7 +24,8 @@ async def join_table(
     db: Session = Depends(get_db),
     user: User = Depends(get_current_user),
 ) -> dict:
-    if user.chips < payload.buyin:
+    # Every seat draws on the same balance: a new buy-in must fit beside the chips already on tables.
+    if user.chips < manager.chips_on_tables(str(user.id)) + payload.buyin:
         raise HTTPException(400, "Not enough chips")
     try:
         state = manager.join_table(payload.table_id, str(user.id), user.display_name, payload.buyin)
@@ -27,22 +33,49 @@ async def join_table(
         raise HTTPException(404, "Table not found") from exc
     except ValueError as exc:
         raise HTTPException(400, str(exc)) from exc
-    await ws_manager.broadcast(payload.table_id, {"type": "state", "state": state})
+    await publish_teenpatti_state(payload.table_id)
+    schedule_teenpatti_bots(payload.table_id)
+    turn_timers.arm(payload.table_id)
+    return state
+
+
+@router.post("/join-any")
+async def join_any_table(
+    payload: JoinAnyTableRequest,
+    db: Session = Depends(get_db),
+    user: User = Depends(get_current_user),
+) -> dict:
+    if user.chips < manager.chips_on_tables(str(user.id)) + payload.buyin:
+        raise HTTPException(400, "Not enough chips")
+    try:
+        state = matchmaker.join_any(payload.boot_amount, str(user.id), user.display_name, payload.buyin)
+    except ValueError as exc:
+        raise HTTPException(400, str(exc)) from exc
+    await publish_teenpatti_state(state["table_id"])
+    schedule_teenpatti_bots(state["table_id"])
+    turn_timers.arm(state["table_id"])
     return state
 
 
 @router.post("/action")
 async def action(payload: ActionRequest, user: User = Depends(get_current_user)) -> dict:
     try:
-        state = manager.act(str(user.id), payload.action, payload.amount)
+        state = manager.act(str(user.id), payload.action, payload.amount, table_id=payload.table_id)
     except KeyError as exc:
         raise HTTPException(404, "Table session not found") from exc
     except ValueError as exc:
         raise HTTPException(400, str(exc)) from exc
-    await ws_manager.broadcast(state["table_id"], {"type": "state", "state": state})
+    await publish_teenpatti_state(state["table_id"])
+    schedule_teenpatti_bots(state["table_id"])
+    turn_timers.arm(state["table_id"])
     return state
 
 
+@router.get("/seats")
+def my_seats(user: User = Depends(get_current_user)) -> list[int]:
+    return sorted(manager.seats_of(str(user.id)))
+
+
 @router.get("/table/{table_id}")
 def table_state(table_id: int, user: User = Depends(get_current_user)) -> dict:
     try:
@@ -59,3 +92,8 @@ async def table_socket(ws: WebSocket, table_id: int) -> None:
             _ = await ws.receive_text()
     except WebSocketDisconnect:
         ws_manager.disconnect(table_id, ws)
+
+
+@ws_router.websocket("/ws/table/{table_id}/watch")
+async def spectator_socket(ws: WebSocket, table_id: int) -> None:
+    await ws_manager.watch(ws, table_id, partial(manager.spectator_frame, table_id))
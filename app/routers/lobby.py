@@ -2,7 +2,7 @@ from __future__ import annotations
 
 from fastapi import APIRouter
 
-from app.services.runtime import manager
+from app.services.runtime import manager, matchmaker
 
 router = APIRouter(prefix="/api/lobby", tags=["lobby"])
 
@@ -10,3 +10,8 @@ router = APIRouter(prefix="/api/lobby", tags=["lobby"])
 @router.get("/tables")
 def list_tables() -> list[dict]:
     return manager.list_tables()
+
+
+@router.get("/tiers")
+def list_tiers() -> list[dict]:
+    return matchmaker.tiers()
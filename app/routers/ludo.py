@@ -1,13 +1,28 @@
 from __future__ import annotations
 
-from fastapi import APIRouter, Depends, HTTPException
+import asyncio
+from typing import Any
 
-from app.deps import get_current_user
+from fastapi import APIRouter, Depends, HTTPException, WebSocket
+
+from app.deps import get_current_user, get_socket_user
+from app.ludo_rules import build_variant, compile_rules
 from app.models import User
 from app.schemas import LudoAddBotsRequest, LudoCreateTableRequest, LudoMoveRequest
+from app.services.bot_scheduler import schedule_ludo_bots
+from app.services.realtime import ludo_channel, ws_manager
 from app.services.runtime import ludo_manager
+from app.services.turn_timers import turn_timers
 
 router = APIRouter(prefix="/api/ludo", tags=["ludo"])
+ws_router = APIRouter(tags=["ws"])
+
+
+def _publish(table_id: int) -> None:
+    channel = ludo_channel(table_id)
+    ws_manager.notify(channel)
+    schedule_ludo_bots(table_id)
+    turn_timers.arm(channel)
 
 
 @router.get("/tables")
@@ -16,57 +31,114 @@ def list_tables() -> list[dict]:
 
 
 @router.post("/tables")
-def create_table(payload: LudoCreateTableRequest, _: User = Depends(get_current_user)) -> dict:
-    return ludo_manager.create_table(payload.name)
+def create_table(payload: LudoCreateTableRequest, user: User = Depends(get_current_user)) -> dict:
+    try:
+        variant = build_variant(
+            payload.variant,
+            players=payload.players,
+            safe_squares=payload.safe_squares,
+            sixes_forfeit=payload.sixes_forfeit,
+        )
+        rules = compile_rules(variant)
+    except ValueError as exc:
+        raise HTTPException(400, str(exc)) from exc
+    try:
+        return ludo_manager.create_table(payload.name, owner_id=str(user.id), bot_level=payload.bot_level, rules=rules)
+    except ValueError as exc:
+        raise HTTPException(429, str(exc)) from exc
 
 
 @router.post("/join/{table_id}")
-def join_table(table_id: int, user: User = Depends(get_current_user)) -> dict:
+async def join_table(table_id: int, user: User = Depends(get_current_user)) -> dict:
     try:
-        return ludo_manager.join_table(table_id, str(user.id), user.display_name)
+        state = await asyncio.to_thread(ludo_manager.join_table, table_id, str(user.id), user.display_name)
     except KeyError as exc:
         raise HTTPException(404, "Table not found") from exc
     except ValueError as exc:
         raise HTTPException(400, str(exc)) from exc
+    ws_manager.notify(ludo_channel(table_id))
+    return state
 
 
 @router.post("/start/{table_id}")
-def start_game(table_id: int, _: User = Depends(get_current_user)) -> dict:
+async def start_game(table_id: int, _: User = Depends(get_current_user)) -> dict:
     try:
-        return ludo_manager.start_game(table_id)
+        state = await asyncio.to_thread(ludo_manager.start_game, table_id)
     except KeyError as exc:
         raise HTTPException(404, "Table not found") from exc
     except ValueError as exc:
         raise HTTPException(400, str(exc)) from exc
+    _publish(table_id)
+    return state
 
 
 @router.post("/roll")
-def roll_dice(user: User = Depends(get_current_user)) -> dict:
+async def roll_dice(user: User = Depends(get_current_user)) -> dict:
     try:
-        return ludo_manager.roll_dice(str(user.id))
+        state = await asyncio.to_thread(ludo_manager.roll_dice, str(user.id))
     except (KeyError, ValueError) as exc:
         raise HTTPException(400, str(exc)) from exc
+    _publish(state["table_id"])
+    return state
 
 
 @router.post("/move")
-def move_token(payload: LudoMoveRequest, user: User = Depends(get_current_user)) -> dict:
+async def move_token(payload: LudoMoveRequest, user: User = Depends(get_current_user)) -> dict:
     try:
-        return ludo_manager.move_token(str(user.id), payload.token_id)
+        state = await asyncio.to_thread(ludo_manager.move_token, str(user.id), payload.token_id)
     except (KeyError, ValueError) as exc:
         raise HTTPException(400, str(exc)) from exc
+    _publish(state["table_id"])
+    return state
 
 
 @router.post("/bots/{table_id}")
-def add_bots(table_id: int, payload: LudoAddBotsRequest, _: User = Depends(get_current_user)) -> dict:
+async def add_bots(table_id: int, payload: LudoAddBotsRequest, _: User = Depends(get_current_user)) -> dict:
     try:
-        return ludo_manager.add_bots(table_id, payload.count)
+        state = await asyncio.to_thread(ludo_manager.add_bots, table_id, payload.count)
     except (KeyError, ValueError) as exc:
         raise HTTPException(400, str(exc)) from exc
+    ws_manager.notify(ludo_channel(table_id))
+    return state
 
 
 @router.get("/state/{table_id}")
-def state(table_id: int, user: User = Depends(get_current_user)) -> dict:
+def state(
+    table_id: int,
+    since_version: int | None = None,
+    history_after: int | None = None,
+    user: User = Depends(get_current_user),
+) -> dict:
     try:
-        return ludo_manager.get_state(table_id, str(user.id))
+        return ludo_manager.get_state(table_id, str(user.id), since_version, history_after)
     except KeyError as exc:
         raise HTTPException(404, "Table not found") from exc
+
+
+@ws_router.websocket("/ws/ludo/{table_id}")
+async def ludo_socket(ws: WebSocket, table_id: int, token: str | None = None) -> None:
+    user = get_socket_user(token)
+    if user is None:
+        await ws.close(code=4401)
+        return
+    player_id = str(user.id)
+
+    async def handle(message: dict[str, Any]) -> None:
+        if ludo_manager.user_table.get(player_id) != table_id:
+            raise ValueError("Not seated at this table")
+        action = message.get("action")
+        if action == "roll":
+            await asyncio.to_thread(ludo_manager.roll_dice, player_id)
+        elif action == "move":
+            await asyncio.to_thread(ludo_manager.move_token, player_id, int(message["token_id"]))
+        else:
+            raise ValueError("Unknown action")
+        schedule_ludo_bots(table_id)
+        turn_timers.arm(ludo_channel(table_id))
+
+    await ws_manager.serve(
+        ws,
+        ludo_channel(table_id),
+        lambda since: ludo_manager.get_state(table_id, player_id, since),
+        handle,
+    )
@@ -0,0 +1,82 @@
+from __future__ import annotations
+
+from fastapi import APIRouter, Depends, HTTPException
+from sqlalchemy.orm import Session
+
+from app.deps import get_current_user, get_db, require_admin
+from app.models import AuditLog, User
+from app.schemas import TournamentAddBotsRequest, TournamentCreateRequest
+from app.services.lifecycle import refresh_tables
+from app.services.runtime import tournaments
+from app.tournament import BlindLevel, TournamentBlueprint
+
+router = APIRouter(prefix="/api/tournaments", tags=["tournaments"])
+
+
+@router.get("")
+def list_tournaments() -> list[dict]:
+    return tournaments.list_tournaments()
+
+
+@router.get("/{tournament_id}")
+def tournament_state(tournament_id: int, limit: int = 20) -> dict:
+    try:
+        return tournaments.state(tournament_id, limit)
+    except KeyError as exc:
+        raise HTTPException(404, "Tournament not found") from exc
+
+
+@router.post("")
+def create_tournament(
+    payload: TournamentCreateRequest,
+    db: Session = Depends(get_db),
+    admin_user: User = Depends(require_admin),
+) -> dict:
+    blueprint = TournamentBlueprint(
+        name=payload.name,
+        seats_per_table=payload.seats_per_table,
+        starting_stack=payload.starting_stack,
+        min_entrants=payload.min_entrants,
+        max_entrants=payload.max_entrants,
+        levels=tuple(BlindLevel(boot, payload.level_seconds) for boot in payload.boots),
+    )
+    try:
+        state = tournaments.create(blueprint)
+    except ValueError as exc:
+        raise HTTPException(400, str(exc)) from exc
+    db.add(AuditLog(actor_user_id=admin_user.id, action="create_tournament", payload=f"tournament={state['tournament_id']}"))
+    db.commit()
+    return state
+
+
+@router.post("/{tournament_id}/register")
+def register(tournament_id: int, user: User = Depends(get_current_user)) -> dict:
+    try:
+        return tournaments.register(tournament_id, str(user.id), user.display_name)
+    except KeyError as exc:
+        raise HTTPException(404, "Tournament not found") from exc
+    except ValueError as exc:
+        raise HTTPException(400, str(exc)) from exc
+
+
+@router.post("/{tournament_id}/bots")
+def add_bots(tournament_id: int, payload: TournamentAddBotsRequest, _: User = Depends(require_admin)) -> dict:
+    try:
+        return tournaments.add_bots(tournament_id, payload.count)
+    except KeyError as exc:
+        raise HTTPException(404, "Tournament not found") from exc
+    except ValueError as exc:
+        raise HTTPException(400, str(exc)) from exc
+
+
+@router.post("/{tournament_id}/start")
+async def start(tournament_id: int, _: User = Depends(require_admin)) -> dict:
+    """Start before the field is full; a full tournament starts on the director's next tick."""
+    try:
+        table_ids = tournaments.start(tournament_id)
+    except KeyError as exc:
+        raise HTTPException(404, "Tournament not found") from exc
+    except ValueError as exc:
+        raise HTTPException(400, str(exc)) from exc
+    await refresh_tables(table_ids)
+    return tournaments.state(tournament_id)
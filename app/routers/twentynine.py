@@ -1,13 +1,31 @@
 from __future__ import annotations
 
-from fastapi import APIRouter, Depends, HTTPException
+import asyncio
+from typing import Any
 
-from app.deps import get_current_user
+from fastapi import APIRouter, Depends, HTTPException, WebSocket
+
+from app.deps import get_current_user, get_socket_user, require_admin
 from app.models import User
-from app.schemas import TwentyNineAddBotsRequest, TwentyNineBidRequest, TwentyNineCreateTableRequest, TwentyNinePlayRequest
+from app.schemas import (
+    TwentyNineAddBotsRequest,
+    TwentyNineBidRequest,
+    TwentyNineCreateTableRequest,
+    TwentyNinePlayRequest,
+    TwentyNineTrainRequest,
+)
+from app.services.realtime import twentynine_channel, ws_manager
 from app.services.runtime import twentynine_manager
+from app.services.turn_timers import turn_timers
 
 router = APIRouter(prefix="/api/twentynine", tags=["twentynine"])
+ws_router = APIRouter(tags=["ws"])
+
+
+def _publish(table_id: int) -> None:
+    channel = twentynine_channel(table_id)
+    ws_manager.notify(channel)
+    turn_timers.arm(channel)
 
 
 @router.get("/tables")
@@ -16,57 +34,120 @@ def list_tables() -> list[dict]:
 
 
 @router.post("/tables")
-def create_table(payload: TwentyNineCreateTableRequest, _: User = Depends(get_current_user)) -> dict:
-    return twentynine_manager.create_table(payload.name)
+def create_table(payload: TwentyNineCreateTableRequest, user: User = Depends(get_current_user)) -> dict:
+    try:
+        return twentynine_manager.create_table(payload.name, owner_id=str(user.id))
+    except ValueError as exc:
+        raise HTTPException(429, str(exc)) from exc
 
 
 @router.post("/join/{table_id}")
-def join_table(table_id: int, user: User = Depends(get_current_user)) -> dict:
+async def join_table(table_id: int, user: User = Depends(get_current_user)) -> dict:
     try:
-        return twentynine_manager.join_table(table_id, str(user.id), user.display_name)
+        state = await asyncio.to_thread(twentynine_manager.join_table, table_id, str(user.id), user.display_name)
     except KeyError as exc:
         raise HTTPException(404, "Table not found") from exc
     except ValueError as exc:
         raise HTTPException(400, str(exc)) from exc
+    _publish(table_id)
+    return state
 
 
 @router.post("/start/{table_id}")
-def start_hand(table_id: int, _: User = Depends(get_current_user)) -> dict:
+async def start_hand(table_id: int, _: User = Depends(get_current_user)) -> dict:
     try:
-        return twentynine_manager.start_hand(table_id)
+        state = await asyncio.to_thread(twentynine_manager.start_hand, table_id)
     except KeyError as exc:
         raise HTTPException(404, "Table not found") from exc
     except ValueError as exc:
         raise HTTPException(400, str(exc)) from exc
+    _publish(table_id)
+    return state
 
 
 @router.post("/bid")
-def place_bid(payload: TwentyNineBidRequest, user: User = Depends(get_current_user)) -> dict:
+async def place_bid(payload: TwentyNineBidRequest, user: User = Depends(get_current_user)) -> dict:
     try:
-        return twentynine_manager.bid(str(user.id), payload.amount, payload.trump_suit)
+        state = await asyncio.to_thread(twentynine_manager.bid, str(user.id), payload.amount, payload.trump_suit)
     except (KeyError, ValueError) as exc:
         raise HTTPException(400, str(exc)) from exc
+    _publish(state["table_id"])
+    return state
 
 
 @router.post("/play")
-def play_card(payload: TwentyNinePlayRequest, user: User = Depends(get_current_user)) -> dict:
+async def play_card(payload: TwentyNinePlayRequest, user: User = Depends(get_current_user)) -> dict:
+    try:
+        state = await asyncio.to_thread(twentynine_manager.play_card, str(user.id), payload.card)
+    except (KeyError, ValueError) as exc:
+        raise HTTPException(400, str(exc)) from exc
+    _publish(state["table_id"])
+    return state
+
+
+@router.post("/ready")
+async def mark_ready(user: User = Depends(get_current_user)) -> dict:
     try:
-        return twentynine_manager.play_card(str(user.id), payload.card)
+        state = await asyncio.to_thread(twentynine_manager.mark_ready, str(user.id))
     except (KeyError, ValueError) as exc:
         raise HTTPException(400, str(exc)) from exc
+    _publish(state["table_id"])
+    return state
+
+
+@router.post("/train/{table_id}")
+def run_bot_hands(table_id: int, payload: TwentyNineTrainRequest, _: User = Depends(require_admin)) -> dict:
+    try:
+        return twentynine_manager.run_bot_hands(table_id, payload.hands)
+    except KeyError as exc:
+        raise HTTPException(404, "Table not found") from exc
+    except ValueError as exc:
+        raise HTTPException(400, str(exc)) from exc
 
 
 @router.post("/bots/{table_id}")
-def add_bots(table_id: int, payload: TwentyNineAddBotsRequest, _: User = Depends(get_current_user)) -> dict:
+async def add_bots(table_id: int, payload: TwentyNineAddBotsRequest, _: User = Depends(get_current_user)) -> dict:
     try:
-        return twentynine_manager.add_bots(table_id, payload.count)
+        state = await asyncio.to_thread(twentynine_manager.add_bots, table_id, payload.count)
     except (KeyError, ValueError) as exc:
         raise HTTPException(400, str(exc)) from exc
+    _publish(table_id)
+    return state
 
 
 @router.get("/state/{table_id}")
-def get_state(table_id: int, user: User = Depends(get_current_user)) -> dict:
+def get_state(table_id: int, since_version: int | None = None, user: User = Depends(get_current_user)) -> dict:
     try:
-        return twentynine_manager.get_state(table_id, str(user.id))
+        return twentynine_manager.get_state(table_id, str(user.id), since_version)
     except KeyError as exc:
         raise HTTPException(404, "Table not found") from exc
+
+
+@ws_router.websocket("/ws/twentynine/{table_id}")
+async def twentynine_socket(ws: WebSocket, table_id: int, token: str | None = None) -> None:
+    user = get_socket_user(token)
+    if user is None:
+        await ws.close(code=4401)
+        return
+    player_id = str(user.id)
+
+    async def handle(message: dict[str, Any]) -> None:
+        if twentynine_manager.user_table.get(player_id) != table_id:
+            raise ValueError("Not seated at this table")
+        action = message.get("action")
+        if action == "bid":
+            await asyncio.to_thread(twentynine_manager.bid, player_id, int(message["amount"]), str(message["trump_suit"]))
+        elif action == "play":
+            await asyncio.to_thread(twentynine_manager.play_card, player_id, str(message["card"]))
+        elif action == "ready":
+            await asyncio.to_thread(twentynine_manager.mark_ready, player_id)
+        else:
+            raise ValueError("Unknown action")
+        turn_timers.arm(twentynine_channel(table_id))
+
+    await ws_manager.serve(
+        ws,
+        twentynine_channel(table_id),
+        lambda since: twentynine_manager.get_state(table_id, player_id, since),
+        handle,
+    )
@@ -28,8 +28,15 @@ class JoinTableRequest(BaseModel):
     buyin: int
 
 
+class JoinAnyTableRequest(BaseModel):
+    boot_amount: int
+    buyin: int
+
+
 class ActionRequest(BaseModel):
-    action: Literal["pack", "see", "call", "raise", "show"]
+    # Optional while the player sits at a single table.
+    table_id: int | None = None
+    action: Literal["pack", "see", "call", "raise", "show", "sideshow"]
     amount: int = 0
 
 
@@ -38,6 +45,20 @@ class AddBotsRequest(BaseModel):
     count: int = Field(ge=1, le=5)
 
 
+class TournamentCreateRequest(BaseModel):
+    name: str = Field(min_length=2, max_length=64)
+    seats_per_table: int = Field(default=6, ge=2, le=6)
+    starting_stack: int = Field(default=1000, ge=10)
+    min_entrants: int = Field(default=2, ge=2)
+    max_entrants: int = Field(default=6, ge=2, le=10000)
+    level_seconds: float = Field(default=300, gt=0)
+    boots: list[int] = Field(default_factory=lambda: [10, 20, 30, 50, 75, 100, 150, 200, 300, 500, 750, 1000], min_length=1)
+
+
+class TournamentAddBotsRequest(BaseModel):
+    count: int = Field(ge=1, le=1000)
+
+
 class TwentyNineCreateTableRequest(BaseModel):
     name: str = Field(min_length=2, max_length=64)
 
@@ -57,6 +78,11 @@ class TwentyNineAddBotsRequest(BaseModel):
 
 class LudoCreateTableRequest(BaseModel):
     name: str = Field(min_length=2, max_length=64)
+    bot_level: Literal["standard", "expert"] = "standard"
+    variant: Literal["classic", "quick", "no_blockade"] = "classic"
+    players: int | None = Field(default=None, ge=2, le=4)
+    safe_squares: list[int] | None = Field(default=None, max_length=52)
+    sixes_forfeit: int | None = Field(default=None, ge=0, le=6)
 
 
 class LudoMoveRequest(BaseModel):
@@ -65,3 +91,7 @@ class LudoMoveRequest(BaseModel):
 
 class LudoAddBotsRequest(BaseModel):
     count: int = Field(ge=1, le=4)
+
+
+class TwentyNineTrainRequest(BaseModel):
+    hands: int = Field(ge=1, le=100_000)
@@ -0,0 +1,34 @@
+"""Seat bitmask helpers shared by the table engines.
+
+Bit ``i`` of a mask stands for seat ``i``. Finding the next or previous seat in
+a mask is a couple of integer operations instead of a scan over the players.
+"""
+
+from __future__ import annotations
+
+from collections.abc import Iterator
+
+
+def next_seat(mask: int, seat: int) -> int:
+    """First seat in ``mask`` after ``seat``, wrapping round; ``seat`` itself if it is the only one; -1 if empty."""
+    later = mask >> (seat + 1) << (seat + 1)
+    pick = later or mask
+    return (pick & -pick).bit_length() - 1
+
+
+def prev_seat(mask: int, seat: int) -> int:
+    """Last seat in ``mask`` before ``seat``, wrapping round and skipping ``seat``; -1 if there is none."""
+    others = mask & ~(1 << seat)
+    earlier = others & ((1 << seat) - 1)
+    return (earlier or others).bit_length() - 1
+
+
+def iter_seats(mask: int) -> Iterator[int]:
+    while mask:
+        low = mask & -mask
+        yield low.bit_length() - 1
+        mask ^= low
+
+
+def at_most_one(mask: int) -> bool:
+    return mask & (mask - 1) == 0
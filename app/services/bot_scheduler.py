@@ -0,0 +1,98 @@
+from __future__ import annotations
+
+import asyncio
+from functools import partial
+import logging
+from typing import Any, Awaitable, Callable
+
+from app.core.config import BOT_TURN_DELAY_SECONDS
+from app.services.realtime import Channel, ludo_channel, ws_manager
+from app.services.runtime import ludo_manager, manager
+from app.services.teenpatti_feed import publish_teenpatti_state
+
+logger = logging.getLogger(__name__)
+
+BotStep = Callable[[], dict[str, Any] | None]
+Publisher = Callable[[Channel, dict[str, Any]], Awaitable[None]]
+
+
+async def _broadcast_state(channel: Channel, state: dict[str, Any]) -> None:
+    await ws_manager.broadcast(channel, {"type": "state", "state": state})
+
+
+async def _notify_subscribers(channel: Channel, _: dict[str, Any]) -> None:
+    ws_manager.notify(channel)
+
+
+class BotScheduler:
+    """Plays bot turns in the background, one asyncio task per table with bots to act.
+
+    A request only performs the human's own action and calls ``schedule``; the
+    table's task then calls ``step`` (one bot turn, run in a worker thread so
+    search bots never block the event loop), publishes the resulting state
+    (a broadcast, or a notify for per-viewer channels) and waits
+    ``delay_seconds`` before the next turn. ``step`` returning None ends the
+    task until the next ``schedule``.
+    """
+
+    def __init__(self, delay_seconds: float = BOT_TURN_DELAY_SECONDS, publish: Publisher = _broadcast_state) -> None:
+        self.delay_seconds = delay_seconds
+        self.publish = publish
+        self.tasks: dict[Channel, asyncio.Task[None]] = {}
+        # Channels poked while their task was mid-step; the task re-checks
+        # instead of exiting, so a human action can never strand a bot turn.
+        self._wake: set[Channel] = set()
+        # Called with the channel once its bots are done and a human (or nobody) is to act.
+        self.on_idle: Callable[[Channel], None] | None = None
+
+    def schedule(self, channel: Channel, step: BotStep, publish: Publisher | None = None) -> None:
+        task = self.tasks.get(channel)
+        if task is not None and not task.done():
+            self._wake.add(channel)
+            return
+        run = self._run(channel, step, publish or self.publish)
+        self.tasks[channel] = asyncio.get_running_loop().create_task(run)
+
+    async def _run(self, channel: Channel, step: BotStep, publish: Publisher) -> None:
+        try:
+            while True:
+                self._wake.discard(channel)
+                try:
+                    state = await asyncio.to_thread(step)
+                except KeyError:
+                    return  # table was reaped
+                if state is None:
+                    if channel in self._wake:
+                        continue
+                    if self.on_idle is not None:
+                        self.on_idle(channel)
+                    return
+                await publish(channel, state)
+                if self.delay_seconds:
+                    await asyncio.sleep(self.delay_seconds)
+        except asyncio.CancelledError:
+            raise
+        except Exception:  # noqa: BLE001 - one broken table must not stop the others
+            logger.exception("Bot turn failed on %s", channel)
+        finally:
+            if self.tasks.get(channel) is asyncio.current_task():
+                del self.tasks[channel]
+            self._wake.discard(channel)
+
+    async def shutdown(self) -> None:
+        tasks = list(self.tasks.values())
+        for task in tasks:
+            task.cancel()
+        await asyncio.gather(*tasks, return_exceptions=True)
+        self.tasks.clear()
+
+
+bot_scheduler = BotScheduler()
+
+
+def schedule_teenpatti_bots(table_id: int) -> None:
+    bot_scheduler.schedule(table_id, partial(manager.step_bot, table_id), publish_teenpatti_state)
+
+
+def schedule_ludo_bots(table_id: int) -> None:
+    bot_scheduler.schedule(ludo_channel(table_id), partial(ludo_manager.step_bot, table_id), _notify_subscribers)
@@ -0,0 +1,78 @@
+from __future__ import annotations
+
+import asyncio
+import logging
+
+from app.core.config import TABLE_IDLE_SECONDS, TABLE_REAP_INTERVAL_SECONDS, TOURNAMENT_TICK_SECONDS
+from app.services.bot_scheduler import schedule_teenpatti_bots
+from app.services.realtime import ws_manager
+from app.services.runtime import ludo_manager, matchmaker, tournaments, twentynine_manager
+from app.services.teenpatti_feed import publish_teenpatti_state
+from app.services.turn_timers import turn_timers
+
+logger = logging.getLogger(__name__)
+
+
+def reap_idle_tables(idle_seconds: float = TABLE_IDLE_SECONDS) -> dict[str, list[int]]:
+    return {
+        "twentynine": twentynine_manager.reap_idle(idle_seconds),
+        "ludo": ludo_manager.reap_idle(idle_seconds),
+    }
+
+
+async def rebalance_tables() -> list[dict[str, int | str]]:
+    """Consolidate stranded Teen Patti players and tell both tables' subscribers."""
+    # Sweeps take every table lock in turn; run them off the loop so a busy table stalls only the sweep.
+    moves = await asyncio.to_thread(matchmaker.consolidate)
+    for move in moves:
+        await ws_manager.broadcast(move["from_table"], {"type": "seat_moved", **move})
+        await publish_teenpatti_state(int(move["to_table"]))
+        schedule_teenpatti_bots(int(move["to_table"]))
+        turn_timers.arm(move["to_table"])
+    return moves
+
+
+async def refresh_tables(table_ids: set[int]) -> None:
+    """Publish Teen Patti tables the tournament director changed and restart their bots and turn timers."""
+    for table_id in sorted(table_ids):
+        try:
+            await publish_teenpatti_state(table_id)
+        except KeyError:
+            # A broken table: its players have moved on and can find their new seats via /api/game/seats.
+            await ws_manager.broadcast(table_id, {"type": "table_closed", "table_id": table_id})
+            continue
+        schedule_teenpatti_bots(table_id)
+        turn_timers.arm(table_id)
+
+
+async def run_tournament_director(interval_seconds: float = TOURNAMENT_TICK_SECONDS) -> None:
+    """The one scheduler for every tournament: level changes, busts, table breaking and balancing."""
+    while True:
+        await asyncio.sleep(interval_seconds)
+        try:
+            touched = await asyncio.to_thread(tournaments.tick)
+            await refresh_tables(touched)
+        except Exception:  # noqa: BLE001 - keep ticking for the other tournaments
+            logger.exception("Tournament tick failed")
+
+
+async def run_table_reaper(
+    interval_seconds: float = TABLE_REAP_INTERVAL_SECONDS,
+    idle_seconds: float = TABLE_IDLE_SECONDS,
+) -> None:
+    while True:
+        await asyncio.sleep(interval_seconds)
+        try:
+            reaped = await asyncio.to_thread(reap_idle_tables, idle_seconds)
+        except Exception:  # noqa: BLE001 - the reaper must survive a bad table
+            logger.exception("Idle table reaper failed")
+            continue
+        if any(reaped.values()):
+            logger.info("Reaped idle tables: %s", reaped)
+        try:
+            moves = await rebalance_tables()
+        except Exception:  # noqa: BLE001 - keep the loop alive for the next round
+            logger.exception("Table rebalancing failed")
+            continue
+        if moves:
+            logger.info("Consolidated Teen Patti seats: %s", moves)
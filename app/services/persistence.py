@@ -0,0 +1,29 @@
+from __future__ import annotations
+
+from datetime import datetime
+from typing import Any
+
+from app.database import SessionLocal
+from app.models import TwentyNineMatchResult
+
+
+def persist_twentynine_results(batch: list[dict[str, Any]]) -> None:
+    db = SessionLocal()
+    try:
+        db.add_all(
+            [
+                TwentyNineMatchResult(
+                    table_id=row["table_id"],
+                    match_no=row["match_no"],
+                    winner_team=row["winner_team"],
+                    team0_score=row["game_score"][0],
+                    team1_score=row["game_score"][1],
+                    hands=row["hands"],
+                    created_at=datetime.fromisoformat(row["finished_at"]),
+                )
+                for row in batch
+            ]
+        )
+        db.commit()
+    finally:
+        db.close()
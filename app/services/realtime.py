@@ -1,25 +1,154 @@
 from __future__ import annotations
 
-from fastapi import WebSocket
+import asyncio
+import contextlib
+import json
+from typing import Any, Awaitable, Callable
+
+from fastapi import WebSocket, WebSocketDisconnect
+
+
+Channel = int | str
+# view(since_version) returns a full state (since_version None or too old) or a compact delta.
+StateView = Callable[[int | None], dict[str, Any]]
+CommandHandler = Callable[[dict[str, Any]], Awaitable[None]]
+# Returns the channel's current pre-encoded spectator message.
+FrameSource = Callable[[], bytes]
 
 
 class WSManager:
+    """Websocket fan-out keyed by channel: a Teen Patti table id, or a prefixed key such as ``"ludo:3"``.
+
+    Teen Patti pushes one payload to every socket with ``broadcast``. Ludo and
+    Twenty-Nine sockets render per-viewer updates, so those channels are only
+    ``notify``-ed and each subscriber pulls its own delta. Spectators (``watch``)
+    are read-only and all receive the same pre-encoded bytes via ``broadcast_frame``.
+    """
+
     def __init__(self) -> None:
-        self.connections: dict[int, set[WebSocket]] = {}
+        self.connections: dict[Channel, set[WebSocket]] = {}
+        self.listeners: dict[Channel, set[asyncio.Event]] = {}
+        self.spectators: dict[Channel, set[WebSocket]] = {}
 
-    async def connect(self, table_id: int, ws: WebSocket) -> None:
+    async def connect(self, channel: Channel, ws: WebSocket) -> None:
         await ws.accept()
-        self.connections.setdefault(table_id, set()).add(ws)
+        self.connections.setdefault(channel, set()).add(ws)
 
-    def disconnect(self, table_id: int, ws: WebSocket) -> None:
-        bucket = self.connections.get(table_id)
+    def disconnect(self, channel: Channel, ws: WebSocket) -> None:
+        bucket = self.connections.get(channel)
         if not bucket:
             return
         bucket.discard(ws)
 
-    async def broadcast(self, table_id: int, payload: dict) -> None:
-        for ws in list(self.connections.get(table_id, set())):
+    async def broadcast(self, channel: Channel, payload: dict) -> None:
+        for ws in list(self.connections.get(channel, set())):
             await ws.send_json(payload)
 
+    async def broadcast_frame(self, channel: Channel, frame: bytes) -> None:
+        """Send one already-encoded message to every spectator at once, dropping sockets that fail."""
+        sockets = list(self.spectators.get(channel, ()))
+        results = await asyncio.gather(*(ws.send_bytes(frame) for ws in sockets), return_exceptions=True)
+        for ws, result in zip(sockets, results):
+            if isinstance(result, Exception):
+                self._unwatch(channel, ws)
+
+    async def watch(self, ws: WebSocket, channel: Channel, frame: FrameSource) -> None:
+        """Serve a spectator: the current frame on connect, then whatever ``broadcast_frame`` sends."""
+        await ws.accept()
+        try:
+            current = await asyncio.to_thread(frame)
+        except KeyError:
+            await ws.close(code=4404)
+            return
+        self.spectators.setdefault(channel, set()).add(ws)
+        try:
+            await ws.send_bytes(current)
+            while True:
+                await ws.receive_text()  # spectators only listen; anything they send is ignored
+        except WebSocketDisconnect:
+            pass
+        finally:
+            self._unwatch(channel, ws)
+
+    def _unwatch(self, channel: Channel, ws: WebSocket) -> None:
+        bucket = self.spectators.get(channel)
+        if bucket is None:
+            return
+        bucket.discard(ws)
+        if not bucket:
+            del self.spectators[channel]
+
+    def subscribe(self, channel: Channel) -> asyncio.Event:
+        wake = asyncio.Event()
+        self.listeners.setdefault(channel, set()).add(wake)
+        return wake
+
+    def unsubscribe(self, channel: Channel, wake: asyncio.Event) -> None:
+        bucket = self.listeners.get(channel)
+        if bucket is None:
+            return
+        bucket.discard(wake)
+        if not bucket:
+            del self.listeners[channel]
+
+    def notify(self, channel: Channel) -> None:
+        for wake in self.listeners.get(channel, ()):
+            wake.set()
+
+    async def serve(self, ws: WebSocket, channel: Channel, view: StateView, handle: CommandHandler) -> None:
+        """Send the full state once, then a compact update after every ``notify`` while relaying commands.
+
+        Commands are JSON objects awaited through ``handle``; a ``ValueError``, ``KeyError``
+        or ``TypeError`` from it is reported back as ``{"type": "error"}``.
+        """
+        await ws.accept()
+        wake = self.subscribe(channel)
+        pusher = asyncio.create_task(self._push(ws, view, wake))
+        try:
+            while True:
+                raw = await ws.receive_text()
+                try:
+                    message = json.loads(raw)
+                    if not isinstance(message, dict):
+                        raise ValueError("Commands must be JSON objects")
+                    await handle(message)
+                except (KeyError, TypeError, ValueError) as exc:
+                    await ws.send_json({"type": "error", "detail": str(exc)})
+                    continue
+                self.notify(channel)
+        except WebSocketDisconnect:
+            pass
+        finally:
+            pusher.cancel()
+            # The pusher may also have died on a send to a socket that just went away.
+            with contextlib.suppress(asyncio.CancelledError, Exception):
+                await pusher
+            self.unsubscribe(channel, wake)
+
+    async def _push(self, ws: WebSocket, view: StateView, wake: asyncio.Event) -> None:
+        version: int | None = None
+        while True:
+            try:
+                # Views take the table lock, which a bot search or training run may hold for a while.
+                update = await asyncio.to_thread(view, version)
+            except KeyError:
+                await ws.close(code=4404)
+                return
+            if "changed" not in update:
+                await ws.send_json({"type": "state", "state": update})
+            elif update["changed"]:
+                await ws.send_json({"type": "update", "update": update})
+            version = update["version"]
+            await wake.wait()
+            wake.clear()
+
+
+def ludo_channel(table_id: int) -> str:
+    return f"ludo:{table_id}"
+
+
+def twentynine_channel(table_id: int) -> str:
+    return f"twentynine:{table_id}"
+
 
 ws_manager = WSManager()
@@ -2,9 +2,30 @@ from __future__ import annotations
 
 from app.game import GameManager
 from app.ludo import LudoManager
-from app.twentynine import TwentyNineManager
+from app.matchmaking import Matchmaker
+from app.shuffle import ShuffleService
+from app.teenpatti import shuffled_deck
+from app.tournament import TournamentDirector
+from app.twentynine import TwentyNineManager, shuffled_deck as shuffled_t29_deck
 
 manager = GameManager()
 twentynine_manager = TwentyNineManager()
 
 ludo_manager = LudoManager()
+
+# Indexes Teen Patti tables by stake tier and fill level as seats change.
+matchmaker = Matchmaker(manager)
+
+# Runs every tournament on tables it creates in ``manager``; ticked by the lifecycle loop.
+tournaments = TournamentDirector(manager)
+
+# Bot turns are played by the bot scheduler, never inside a human's request.
+manager.inline_bots = False
+ludo_manager.inline_bots = False
+
+# Every deal and dice stream is seeded from the OS CSPRNG and committed in the table log.
+shuffle_service = ShuffleService()
+manager.shuffler = shuffle_service
+twentynine_manager.shuffler = shuffle_service
+ludo_manager.shuffler = shuffle_service
+PREGENERATED_DECKS = (shuffled_deck, shuffled_t29_deck)
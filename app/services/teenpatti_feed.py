@@ -0,0 +1,18 @@
+from __future__ import annotations
+
+from typing import Any
+
+from app.services.realtime import ws_manager
+from app.services.runtime import manager
+
+
+async def publish_teenpatti_state(table_id: int, state: dict[str, Any] | None = None) -> None:
+    """Push a table's public state to its player sockets and the shared pre-encoded frame to its spectators.
+
+    ``state`` must be a public view (no hole cards); by default it is fetched.
+    """
+    if state is None:
+        state = manager.get_table_state(table_id)
+    await ws_manager.broadcast(table_id, {"type": "state", "state": state})
+    if table_id in ws_manager.spectators:
+        await ws_manager.broadcast_frame(table_id, manager.spectator_frame(table_id))
@@ -0,0 +1,108 @@
+from __future__ import annotations
+
+import asyncio
+import logging
+import time
+from typing import Any, Protocol
+
+from app.core.config import TURN_TIMEOUT_SECONDS, TURN_TIMER_TICK_SECONDS
+from app.services.bot_scheduler import schedule_ludo_bots, schedule_teenpatti_bots
+from app.services.realtime import Channel, ws_manager
+from app.services.runtime import ludo_manager, manager, twentynine_manager
+from app.services.teenpatti_feed import publish_teenpatti_state
+from app.timer_wheel import TimerWheel
+
+logger = logging.getLogger(__name__)
+
+
+class TurnEngine(Protocol):
+    def turn_marker(self, table_id: int) -> tuple[str, int] | None: ...
+
+    def expire_turn(self, table_id: int, marker: tuple[str, int] | None) -> dict[str, Any] | None: ...
+
+
+def _route(channel: Channel) -> tuple[str, int]:
+    """Websocket channel -> (game, table id); Teen Patti channels are bare table ids."""
+    if isinstance(channel, int):
+        return "teenpatti", channel
+    game, _, table_id = channel.partition(":")
+    return game, int(table_id)
+
+
+class TurnTimerService:
+    """Per-turn deadlines for every table of every game on one timer wheel.
+
+    Timers are keyed by the table's websocket channel. ``arm`` is called after
+    anything that may hand the turn to a human; it reads the engine's turn
+    marker off the event loop (the read takes the table lock) and (re)starts
+    the deadline only when the marker changed. One task
+    advances the wheel each tick and, for each expired turn, lets the engine
+    apply its default action, then publishes the result and re-arms.
+    """
+
+    def __init__(
+        self,
+        timeout_seconds: float = TURN_TIMEOUT_SECONDS,
+        tick_seconds: float = TURN_TIMER_TICK_SECONDS,
+    ) -> None:
+        self.timeout_seconds = timeout_seconds
+        self.tick_seconds = tick_seconds
+        self.wheel: TimerWheel[Channel] = TimerWheel(tick_seconds, now=time.monotonic())
+        self.markers: dict[Channel, tuple[str, int]] = {}
+        self.pending: set[asyncio.Task[None]] = set()
+        self.engines: dict[str, TurnEngine] = {
+            "teenpatti": manager,
+            "ludo": ludo_manager,
+            "twentynine": twentynine_manager,
+        }
+
+    def arm(self, channel: Channel) -> None:
+        """Re-arm ``channel`` in the background; callable from any handler on the event loop."""
+        task = asyncio.get_running_loop().create_task(self.rearm(channel))
+        self.pending.add(task)
+        task.add_done_callback(self.pending.discard)
+
+    async def rearm(self, channel: Channel) -> None:
+        game, table_id = _route(channel)
+        try:
+            marker = await asyncio.to_thread(self.engines[game].turn_marker, table_id)
+        except KeyError:
+            marker = None  # table was reaped
+        if marker is None:
+            self.markers.pop(channel, None)
+            self.wheel.cancel(channel)
+            return
+        if self.markers.get(channel) == marker and channel in self.wheel:
+            return
+        self.markers[channel] = marker
+        self.wheel.schedule(channel, self.timeout_seconds, time.monotonic())
+
+    async def run(self) -> None:
+        while True:
+            await asyncio.sleep(self.tick_seconds)
+            for channel in self.wheel.advance(time.monotonic()):
+                try:
+                    await self._expire(channel)
+                except Exception:  # noqa: BLE001 - one broken table must not stop the others
+                    logger.exception("Turn timeout failed on %s", channel)
+
+    async def _expire(self, channel: Channel) -> None:
+        game, table_id = _route(channel)
+        marker = self.markers.pop(channel, None)
+        try:
+            # Off the event loop: the default Ludo move may run the expert search.
+            state = await asyncio.to_thread(self.engines[game].expire_turn, table_id, marker)
+        except KeyError:
+            return
+        if state is not None:
+            if game == "teenpatti":
+                await publish_teenpatti_state(table_id, state)
+                schedule_teenpatti_bots(table_id)
+            else:
+                ws_manager.notify(channel)
+                if game == "ludo":
+                    schedule_ludo_bots(table_id)
+        await self.rearm(channel)
+
+
+turn_timers = TurnTimerService()
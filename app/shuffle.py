@@ -0,0 +1,127 @@
+"""Auditable shuffles and dice streams.
+
+Every hand gets a fresh 256-bit seed from the OS CSPRNG. Its SHA-256
+commitment goes into the hand log when the hand starts, and the seed itself
+when the hand ends. The seed drives an ordinary ``random.Random`` stream, so
+anyone can check the commitment and replay the exact shuffle (or dice) with
+:func:`replay`. The OS is only asked for 32 bytes per hand; the shuffling runs
+on a per-hand PRNG instead of the process-wide ``random`` module.
+
+:class:`ShuffleService` also keeps a pool of pre-shuffled decks per deck
+builder, refilled on a background thread, so a deal is usually just a pop.
+"""
+
+from __future__ import annotations
+
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass
+import hashlib
+import random
+import secrets
+from threading import Lock
+from typing import Any, Callable
+
+SEED_BYTES = 32
+DEFAULT_POOL_SIZE = 64
+
+DeckBuilder = Callable[[random.Random], list[Any]]
+
+
+@dataclass(frozen=True)
+class SeededShuffle:
+    seed: bytes
+    commitment: str
+    deck: list[Any]
+
+    @property
+    def reveal(self) -> str:
+        return self.seed.hex()
+
+
+def commitment_for(seed: bytes) -> str:
+    return hashlib.sha256(seed).hexdigest()
+
+
+def stream_for(seed: bytes) -> random.Random:
+    return random.Random(int.from_bytes(seed, "big"))
+
+
+def verify(reveal: str, commitment: str) -> bool:
+    """True when the revealed seed (hex) matches the commitment published at the start of the hand."""
+    return secrets.compare_digest(commitment_for(bytes.fromhex(reveal)), commitment)
+
+
+def replay(build: DeckBuilder, reveal: str) -> list[Any]:
+    """Rebuild the deck a revealed seed produced."""
+    return build(stream_for(bytes.fromhex(reveal)))
+
+
+def _shuffle(build: DeckBuilder) -> SeededShuffle:
+    seed = secrets.token_bytes(SEED_BYTES)
+    return SeededShuffle(seed=seed, commitment=commitment_for(seed), deck=build(stream_for(seed)))
+
+
+class ShuffleService:
+    """Hands out committed shuffles and dice streams; one instance is shared by every engine."""
+
+    def __init__(self, pool_size: int = DEFAULT_POOL_SIZE) -> None:
+        self.pool_size = pool_size
+        self._pools: dict[DeckBuilder, deque[SeededShuffle]] = {}
+        self._refilling: set[DeckBuilder] = set()
+        self._lock = Lock()
+        self._executor: ThreadPoolExecutor | None = None
+
+    def deal(self, build: DeckBuilder) -> SeededShuffle:
+        """A fresh shuffle from ``build``: pre-generated when the pool has one, else made on the spot."""
+        with self._lock:
+            pool = self._pools.setdefault(build, deque())
+            shuffle = pool.popleft() if pool else None
+            low = len(pool) < self.pool_size // 2
+        if low:
+            self.prefill(build)
+        return shuffle if shuffle is not None else _shuffle(build)
+
+    def open_stream(self) -> tuple[SeededShuffle, random.Random]:
+        """A committed seed (with an empty deck) and the PRNG stream it drives, for dice."""
+        seed = secrets.token_bytes(SEED_BYTES)
+        return SeededShuffle(seed=seed, commitment=commitment_for(seed), deck=[]), stream_for(seed)
+
+    def prefill(self, build: DeckBuilder) -> None:
+        """Top up the pool for ``build`` in the background; a no-op while a refill is already queued."""
+        if self.pool_size <= 0:
+            return
+        with self._lock:
+            if build in self._refilling:
+                return
+            self._refilling.add(build)
+            if self._executor is None:
+                self._executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="shuffle")
+            executor = self._executor
+        executor.submit(self._refill, build)
+
+    def pooled(self, build: DeckBuilder) -> int:
+        with self._lock:
+            return len(self._pools.get(build, ()))
+
+    def shutdown(self) -> None:
+        with self._lock:
+            executor, self._executor = self._executor, None
+        if executor is not None:
+            executor.shutdown(wait=True, cancel_futures=True)
+
+    def _refill(self, build: DeckBuilder) -> None:
+        try:
+            while True:
+                with self._lock:
+                    pool = self._pools.setdefault(build, deque())
+                    missing = self.pool_size - len(pool)
+                if missing <= 0:
+                    return
+                # Shuffle outside the lock so deals never wait on a refill.
+                fresh = [_shuffle(build) for _ in range(missing)]
+                with self._lock:
+                    pool.extend(fresh)
+        finally:
+            with self._lock:
+                self._refilling.discard(build)
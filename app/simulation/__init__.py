@@ -0,0 +1 @@
+"""Headless simulators that drive the game engines without FastAPI or the database."""
@@ -0,0 +1,134 @@
+from __future__ import annotations
+
+import argparse
+import statistics
+from threading import Lock, Thread
+import time
+from typing import Any, ContextManager, Callable
+
+from app.ludo import LudoManager
+from app.twentynine import TwentyNineManager
+
+
+# Stand-in for the blocking work (a database write, a socket send) an action does while it
+# holds its lock. Pure-Python engine work serialises on the GIL whatever the locking, so
+# without it the per-table and global-lock runs measure the same thing.
+DEFAULT_IO_MS = 1.0
+
+TableBench = tuple[Callable[[], None], ContextManager[Any]]
+
+
+def _ludo_table(manager: LudoManager, idx: int) -> TableBench:
+    table_id = manager.create_table(f"Bench {idx}")["table_id"]
+    human = f"bench-{idx}"
+    manager.join_table(table_id, human, "Bench")
+    manager.add_bots(table_id, 3)
+    manager.start_game(table_id)
+
+    def act() -> None:
+        table = manager.tables[table_id]
+        if not table.hand_active or table.players[table.turn_idx].player_id != human:
+            # Game over, or the human finished and the bot loop hit its guard: start afresh.
+            table.history.clear()
+            manager.start_game(table_id)
+        elif table.pending_move:
+            state = manager.get_state(table_id, human)
+            manager.move_token(human, state["movable_tokens"][0])
+        else:
+            manager.roll_dice(human)
+
+    return act, manager.tables[table_id].lock
+
+
+def _twentynine_table(manager: TwentyNineManager, idx: int) -> TableBench:
+    table_id = manager.create_table(f"Bench {idx}")["table_id"]
+    human = f"bench-{idx}"
+    manager.join_table(table_id, human, "Bench")
+    manager.add_bots(table_id, 3)
+    manager.start_hand(table_id)
+
+    def act() -> None:
+        table = manager.tables[table_id]
+        if not table.hand_active:
+            manager.mark_ready(human)
+            return
+        seat = table.players[0]
+        manager.play_card(human, str(manager._legal_cards(table, seat)[0]))
+
+    return act, manager.tables[table_id].lock
+
+
+GAMES: dict[str, Callable[[Any, int], TableBench]] = {"ludo": _ludo_table, "twentynine": _twentynine_table}
+MANAGERS: dict[str, type] = {"ludo": LudoManager, "twentynine": TwentyNineManager}
+
+
+def run_contention(
+    game: str, tables: int, seconds: float, global_lock: bool = False, io_ms: float = DEFAULT_IO_MS
+) -> dict[str, Any]:
+    """Drive one human per table from its own thread and measure action throughput and latency.
+
+    Each action holds its table's lock for the engine call plus ``io_ms`` of blocking
+    work. With ``global_lock`` one shared lock is held instead, reproducing the old
+    single-manager-lock behaviour as a baseline.
+    """
+    manager = MANAGERS[game]()
+    benches = [GAMES[game](manager, idx) for idx in range(tables)]
+    shared = Lock()
+    io_seconds = io_ms / 1000
+    latencies: list[list[float]] = [[] for _ in range(tables)]
+    deadline = time.perf_counter() + seconds
+
+    def worker(idx: int) -> None:
+        act, table_lock = benches[idx]
+        lock = shared if global_lock else table_lock
+        samples = latencies[idx]
+        while time.perf_counter() < deadline:
+            started = time.perf_counter()
+            with lock:
+                act()
+                time.sleep(io_seconds)
+            samples.append(time.perf_counter() - started)
+
+    threads = [Thread(target=worker, args=(idx,)) for idx in range(tables)]
+    started = time.perf_counter()
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    elapsed = time.perf_counter() - started
+
+    samples = sorted(sample for bucket in latencies for sample in bucket)
+    p99 = samples[int(len(samples) * 0.99) - 1] if samples else 0.0
+    return {
+        "game": game,
+        "tables": tables,
+        "global_lock": global_lock,
+        "io_ms": io_ms,
+        "actions": len(samples),
+        "actions_per_second": len(samples) / elapsed,
+        "median_ms": statistics.median(samples) * 1000 if samples else 0.0,
+        "p99_ms": p99 * 1000,
+        "min_table_actions": min(len(bucket) for bucket in latencies),
+    }
+
+
+def main(argv: list[str] | None = None) -> None:
+    parser = argparse.ArgumentParser(description="Per-table lock contention benchmark")
+    parser.add_argument("--game", choices=sorted(GAMES), default="ludo")
+    parser.add_argument("--tables", type=int, nargs="+", default=[1, 2, 4, 8, 16, 32])
+    parser.add_argument("--seconds", type=float, default=2.0)
+    parser.add_argument("--io-ms", type=float, default=DEFAULT_IO_MS, help="blocking work per action under the lock")
+    args = parser.parse_args(argv)
+
+    print(f"{'tables':>6} {'lock':>8} {'actions/s':>10} {'median ms':>10} {'p99 ms':>8} {'min/table':>9}")
+    for count in args.tables:
+        for global_lock in (True, False):
+            row = run_contention(args.game, count, args.seconds, global_lock, args.io_ms)
+            print(
+                f"{row['tables']:>6} {'global' if global_lock else 'table':>8} {row['actions_per_second']:>10.0f} "
+                f"{row['median_ms']:>10.3f} {row['p99_ms']:>8.3f} {row['min_table_actions']:>9}"
+            )
+
+
+if __name__ == "__main__":
+    main()
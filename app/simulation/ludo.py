@@ -0,0 +1,185 @@
+from __future__ import annotations
+
+import argparse
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import dataclass, field
+import random
+import time
+from typing import Any
+
+from app.ludo import LudoManager, LudoPlayer, LudoStrategy, LudoTable, LudoToken
+from app.ludo_bitboard import from_table
+from app.ludo_search import LudoSearchBot
+
+SEATS = 4
+
+
+class StandardStrategy:
+    """The built-in lexicographic heuristic used by "standard" tables."""
+
+    name = "standard"
+
+    def choose_move(self, manager: LudoManager, table: LudoTable, bot: LudoPlayer, dice: int) -> LudoToken:
+        return manager._ranked_moves(table, bot, dice)[0]
+
+
+class ExpertStrategy:
+    """Expectiminimax search used by "expert" tables, with its own time budget."""
+
+    name = "expert"
+
+    def __init__(self, budget_ms: float = 5.0) -> None:
+        self.budget_ms = budget_ms
+        self._bot: LudoSearchBot | None = None
+
+    def choose_move(self, manager: LudoManager, table: LudoTable, bot: LudoPlayer, dice: int) -> LudoToken:
+        if self._bot is None:
+            self._bot = LudoSearchBot(budget_ms=self.budget_ms)
+        ranked = manager._ranked_moves(table, bot, dice)
+        token_id = self._bot.choose(from_table(table), dice, [t.token_id for t in ranked])
+        return manager._find_token(bot, token_id)
+
+    def __getstate__(self) -> dict[str, Any]:
+        # Ship only the configuration to worker processes, not the transposition cache.
+        return {"budget_ms": self.budget_ms, "_bot": None}
+
+
+class RandomStrategy:
+    name = "random"
+
+    def choose_move(self, manager: LudoManager, table: LudoTable, bot: LudoPlayer, dice: int) -> LudoToken:
+        return manager.rng.choice(manager._movable_tokens(table, bot, dice))
+
+
+STRATEGIES: dict[str, type] = {"standard": StandardStrategy, "expert": ExpertStrategy, "random": RandomStrategy}
+
+
+@dataclass
+class TournamentReport:
+    games: int = 0
+    seconds: float = 0.0
+    rolls: int = 0
+    captures: int = 0
+    seat_wins: list[int] = field(default_factory=lambda: [0] * SEATS)
+    strategy_games: dict[str, int] = field(default_factory=dict)
+    strategy_wins: dict[str, int] = field(default_factory=dict)
+
+    def merge(self, other: TournamentReport) -> None:
+        self.games += other.games
+        self.rolls += other.rolls
+        self.captures += other.captures
+        self.seat_wins = [a + b for a, b in zip(self.seat_wins, other.seat_wins)]
+        for label, count in other.strategy_games.items():
+            self.strategy_games[label] = self.strategy_games.get(label, 0) + count
+        for label, count in other.strategy_wins.items():
+            self.strategy_wins[label] = self.strategy_wins.get(label, 0) + count
+
+    @property
+    def games_per_second(self) -> float:
+        return self.games / self.seconds if self.seconds else 0.0
+
+    def as_dict(self) -> dict[str, Any]:
+        games = self.games or 1
+        return {
+            "games": self.games,
+            "seconds": round(self.seconds, 3),
+            "games_per_second": round(self.games_per_second, 2),
+            "avg_rolls_per_game": self.rolls / games,
+            "captures_per_game": self.captures / games,
+            "seat_win_rate": [wins / games for wins in self.seat_wins],
+            "strategy_win_rate": {
+                label: self.strategy_wins.get(label, 0) / seated for label, seated in self.strategy_games.items()
+            },
+        }
+
+
+def _labels(lineup: list[LudoStrategy]) -> list[str]:
+    names = [s.name for s in lineup]
+    return [f"{name}:{seat}" if names.count(name) > 1 else name for seat, name in enumerate(names)]
+
+
+def _play_games(lineup: list[LudoStrategy], games: int, seed: int, first_game: int) -> TournamentReport:
+    manager = LudoManager(rng=random.Random(seed))
+    labels = _labels(lineup)
+    report = TournamentReport()
+    for game_no in range(first_game, first_game + games):
+        table_id = manager.create_table(f"Sim {game_no}")["table_id"]
+        manager.add_bots(table_id, SEATS)
+        table = manager.tables[table_id]
+        # Rotate the lineup every game so no strategy keeps the first-move advantage.
+        shift = game_no % SEATS
+        seat_labels = labels[shift:] + labels[:shift]
+        seat_strategies = lineup[shift:] + lineup[:shift]
+        for player, strategy in zip(table.players, seat_strategies):
+            manager.strategies[player.player_id] = strategy
+
+        manager.start_game(table_id)
+        manager.play_out(table_id)
+
+        winner_seat = next(seat for seat, p in enumerate(table.players) if p.player_id == table.winners[0])
+        report.games += 1
+        report.rolls += table.rolls
+        report.captures += table.captures
+        report.seat_wins[winner_seat] += 1
+        for label in seat_labels:
+            report.strategy_games[label] = report.strategy_games.get(label, 0) + 1
+        report.strategy_wins[seat_labels[winner_seat]] = report.strategy_wins.get(seat_labels[winner_seat], 0) + 1
+
+        for player in table.players:
+            manager.strategies.pop(player.player_id, None)
+        manager.tables.pop(table_id)
+    return report
+
+
+def run_tournament(
+    lineup: list[LudoStrategy],
+    games: int,
+    seed: int | None = None,
+    workers: int = 1,
+) -> TournamentReport:
+    """Play ``games`` full 4-bot Ludo games between the four strategies in ``lineup``."""
+    if len(lineup) != SEATS:
+        raise ValueError("A Ludo lineup needs exactly 4 strategies")
+    workers = max(1, min(workers, games))
+    base_seed = seed if seed is not None else random.SystemRandom().getrandbits(32)
+    chunk, extra = divmod(games, workers)
+    sizes = [chunk + (1 if i < extra else 0) for i in range(workers)]
+    starts = [sum(sizes[:i]) for i in range(workers)]
+
+    started = time.perf_counter()
+    if workers == 1:
+        partials = [_play_games(lineup, games, base_seed, 0)]
+    else:
+        with ProcessPoolExecutor(max_workers=workers) as pool:
+            futures = [
+                pool.submit(_play_games, lineup, size, base_seed + i, first)
+                for i, (size, first) in enumerate(zip(sizes, starts))
+            ]
+            partials = [future.result() for future in futures]
+
+    report = TournamentReport()
+    for partial in partials:
+        report.merge(partial)
+    report.seconds = time.perf_counter() - started
+    return report
+
+
+def main(argv: list[str] | None = None) -> None:
+    parser = argparse.ArgumentParser(description="Headless Ludo bot tournament")
+    parser.add_argument("--games", type=int, default=1000)
+    parser.add_argument("--workers", type=int, default=1)
+    parser.add_argument("--seed", type=int, default=None)
+    parser.add_argument("--lineup", nargs=SEATS, choices=sorted(STRATEGIES), default=["standard"] * SEATS)
+    args = parser.parse_args(argv)
+
+    report = run_tournament([STRATEGIES[name]() for name in args.lineup], args.games, args.seed, args.workers)
+    data = report.as_dict()
+    print(f"games={data['games']} seconds={data['seconds']} games/s={data['games_per_second']}")
+    print(f"avg rolls/game={data['avg_rolls_per_game']:.1f} captures/game={data['captures_per_game']:.2f}")
+    print("seat win rate: " + " ".join(f"{rate:.3f}" for rate in data["seat_win_rate"]))
+    for label, rate in data["strategy_win_rate"].items():
+        print(f"{label:>12}: win rate {rate:.3f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,215 @@
+from __future__ import annotations
+
+import argparse
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import dataclass, field
+import random
+import time
+from typing import Any
+
+from app.game import GameManager, SeatPlayer, TableState, TeenPattiStrategy
+from app.teenpatti import evaluate_hand
+
+CATEGORIES = {6: "trail", 5: "pure_sequence", 4: "sequence", 3: "color", 2: "pair", 1: "high_card"}
+DEFAULT_BOOT = 10
+# Every seat starts each hand with this many boots, so results are per hand rather than per bankroll.
+DEFAULT_STACK_BOOTS = 100
+
+
+class EquityStrategy:
+    """The built-in equity-table bot (``GameManager._bot_decision``)."""
+
+    name = "equity"
+
+    def choose_action(self, manager: GameManager, table: TableState, bot: SeatPlayer) -> tuple[str, int]:
+        return manager._bot_decision(table, bot)
+
+
+class CallingStrategy:
+    """Baseline: always calls (all-in when short), never raises, shows heads-up."""
+
+    name = "calling"
+
+    def choose_action(self, manager: GameManager, table: TableState, bot: SeatPlayer) -> tuple[str, int]:
+        call = manager._compute_commit(table, bot, "call", 0)
+        if len(manager._active_players(table)) == 2:
+            return ("show", 0)
+        return ("call", call)
+
+
+class RandomStrategy:
+    """Baseline: a uniformly random affordable action."""
+
+    name = "random"
+
+    def choose_action(self, manager: GameManager, table: TableState, bot: SeatPlayer) -> tuple[str, int]:
+        call = manager._compute_commit(table, bot, "call", 0)
+        raise_commit = manager._compute_commit(table, bot, "raise", 0)
+        options = [("pack", 0), ("call", call)]
+        if len(manager._active_players(table)) == 2:
+            options.append(("show", 0))
+        if bot.chips >= raise_commit:
+            options.append(("raise", raise_commit))
+        return manager.rng.choice(options)
+
+
+STRATEGIES: dict[str, type] = {"equity": EquityStrategy, "calling": CallingStrategy, "random": RandomStrategy}
+
+
+@dataclass
+class PolicyStats:
+    hands: int = 0
+    net_chips: int = 0
+    wins: int = 0
+
+    def merge(self, other: PolicyStats) -> None:
+        self.hands += other.hands
+        self.net_chips += other.net_chips
+        self.wins += other.wins
+
+
+@dataclass
+class SimulationReport:
+    hands: int = 0
+    seconds: float = 0.0
+    showdowns: int = 0
+    boot: int = DEFAULT_BOOT
+    categories: dict[str, int] = field(default_factory=dict)
+    policies: dict[str, PolicyStats] = field(default_factory=dict)
+
+    def merge(self, other: SimulationReport) -> None:
+        self.hands += other.hands
+        self.showdowns += other.showdowns
+        for name, count in other.categories.items():
+            self.categories[name] = self.categories.get(name, 0) + count
+        for label, stats in other.policies.items():
+            self.policies.setdefault(label, PolicyStats()).merge(stats)
+
+    @property
+    def hands_per_second(self) -> float:
+        return self.hands / self.seconds if self.seconds else 0.0
+
+    def as_dict(self) -> dict[str, Any]:
+        hands = self.hands or 1
+        dealt = sum(self.categories.values()) or 1
+        return {
+            "hands": self.hands,
+            "seconds": round(self.seconds, 3),
+            "hands_per_second": round(self.hands_per_second, 2),
+            "showdown_rate": self.showdowns / hands,
+            "category_rate": {name: self.categories.get(name, 0) / dealt for name in CATEGORIES.values()},
+            "policies": {
+                label: {
+                    "hands": stats.hands,
+                    "win_rate": stats.wins / stats.hands if stats.hands else 0.0,
+                    # Chip EV in boots per hand played.
+                    "ev_boots_per_hand": stats.net_chips / self.boot / stats.hands if stats.hands else 0.0,
+                }
+                for label, stats in self.policies.items()
+            },
+        }
+
+
+def _labels(lineup: list[TeenPattiStrategy]) -> list[str]:
+    names = [s.name for s in lineup]
+    return [f"{name}:{seat}" if names.count(name) > 1 else name for seat, name in enumerate(names)]
+
+
+def _play_hands(lineup: list[TeenPattiStrategy], hands: int, seed: int, boot: int, stack: int) -> SimulationReport:
+    manager = GameManager(rng=random.Random(seed))
+    manager.inline_bots = False
+    manager.auto_deal = False
+    manager.log_timestamps = False
+    manager.seed_tables([{"id": 1, "name": "Sim", "max_players": len(lineup), "boot_amount": boot, "min_buyin": stack, "max_buyin": stack}])
+    table = manager.tables[1]
+    labels = _labels(lineup)
+    for seat, (label, strategy) in enumerate(zip(labels, lineup)):
+        player_id = f"sim-{seat}"
+        table.players.append(SeatPlayer(player_id=player_id, display_name=label, chips=stack, is_bot=True))
+        manager.strategies[player_id] = strategy
+
+    report = SimulationReport(boot=boot, policies={label: PolicyStats() for label in labels})
+    for _ in range(hands):
+        for player in table.players:
+            player.chips = stack
+        table.action_log.clear()
+        manager._start_hand(table)
+        for player in table.players:
+            category = CATEGORIES[evaluate_hand(player.cards)[0]]
+            report.categories[category] = report.categories.get(category, 0) + 1
+
+        while table.hand_active:
+            manager._play_bot_action(table, manager._current_player(table))
+
+        report.hands += 1
+        # A bot's "show" logs its own action after the showdown it triggered.
+        outcome = next(entry for entry in reversed(table.action_log) if entry["event"] in {"showdown", "hand_win"})
+        if outcome["event"] == "showdown":
+            report.showdowns += 1
+            # Split and side pots have several winners; each of them is credited with the win.
+            winners = {player_id for pot in outcome["pots"] for player_id in pot["winners"]}
+        else:
+            winners = {outcome["winner"]}
+        for label, player in zip(labels, table.players):
+            stats = report.policies[label]
+            stats.hands += 1
+            stats.net_chips += player.chips - stack
+            if player.player_id in winners:
+                stats.wins += 1
+    return report
+
+
+def run_simulation(
+    lineup: list[TeenPattiStrategy],
+    hands: int,
+    seed: int | None = None,
+    workers: int = 1,
+    boot: int = DEFAULT_BOOT,
+    stack_boots: int = DEFAULT_STACK_BOOTS,
+) -> SimulationReport:
+    """Play ``hands`` Teen Patti hands at one table seating ``lineup`` (2-6 policies), dealer rotating each hand."""
+    if not 2 <= len(lineup) <= 6:
+        raise ValueError("A Teen Patti lineup needs 2 to 6 policies")
+    workers = max(1, min(workers, hands))
+    base_seed = seed if seed is not None else random.SystemRandom().getrandbits(32)
+    chunk, extra = divmod(hands, workers)
+    sizes = [chunk + (1 if i < extra else 0) for i in range(workers)]
+    stack = boot * stack_boots
+
+    started = time.perf_counter()
+    if workers == 1:
+        partials = [_play_hands(lineup, hands, base_seed, boot, stack)]
+    else:
+        with ProcessPoolExecutor(max_workers=workers) as pool:
+            futures = [pool.submit(_play_hands, lineup, size, base_seed + i, boot, stack) for i, size in enumerate(sizes)]
+            partials = [future.result() for future in futures]
+
+    report = SimulationReport(boot=boot)
+    for partial in partials:
+        report.merge(partial)
+    report.seconds = time.perf_counter() - started
+    return report
+
+
+def main(argv: list[str] | None = None) -> None:
+    parser = argparse.ArgumentParser(description="Headless Teen Patti bot arena")
+    parser.add_argument("--hands", type=int, default=10000)
+    parser.add_argument("--workers", type=int, default=1)
+    parser.add_argument("--seed", type=int, default=None)
+    parser.add_argument("--boot", type=int, default=DEFAULT_BOOT)
+    parser.add_argument("--stack-boots", type=int, default=DEFAULT_STACK_BOOTS)
+    parser.add_argument("--lineup", nargs="+", choices=sorted(STRATEGIES), default=["equity", "equity", "calling", "random"])
+    args = parser.parse_args(argv)
+
+    lineup = [STRATEGIES[name]() for name in args.lineup]
+    report = run_simulation(lineup, args.hands, args.seed, args.workers, args.boot, args.stack_boots)
+    data = report.as_dict()
+    print(f"hands={data['hands']} seconds={data['seconds']} hands/s={data['hands_per_second']}")
+    print(f"showdown rate={data['showdown_rate']:.3f}")
+    print("dealt: " + " ".join(f"{name}={rate:.4f}" for name, rate in data["category_rate"].items()))
+    for label, stats in data["policies"].items():
+        print(f"{label:>12}: EV {stats['ev_boots_per_hand']:+.3f} boots/hand  win rate {stats['win_rate']:.3f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,87 @@
+from __future__ import annotations
+
+import argparse
+import random
+import time
+from typing import Any
+
+from app.game import GameManager
+from app.tournament import BlindLevel, TournamentBlueprint, TournamentDirector
+
+DEFAULT_BOOTS = (10, 20, 40, 80, 160, 320, 640, 1280, 2560, 5120, 10240)
+# Bot actions played at each table between director ticks; one tick is one simulated second.
+ACTIONS_PER_TICK = 20
+MAX_TICKS = 100_000
+
+
+def run_tournament(
+    entrants: int,
+    seed: int | None = None,
+    seats_per_table: int = 6,
+    starting_stack: int = 500,
+    level_seconds: float = 10.0,
+) -> dict[str, Any]:
+    """Play a bot-only tournament to the end on a simulated clock and report its shape and speed."""
+    rng = random.Random(seed)
+    manager = GameManager(rng=random.Random(rng.getrandbits(32)))
+    manager.inline_bots = False
+    manager.log_timestamps = False
+    director = TournamentDirector(manager, rng=random.Random(rng.getrandbits(32)))
+    blueprint = TournamentBlueprint(
+        name="Sim",
+        seats_per_table=seats_per_table,
+        starting_stack=starting_stack,
+        max_entrants=entrants,
+        levels=tuple(BlindLevel(boot, level_seconds) for boot in DEFAULT_BOOTS),
+    )
+    tournament_id = director.create(blueprint)["tournament_id"]
+    director.add_bots(tournament_id, entrants)
+    tournament = director.tournaments[tournament_id]
+
+    started = time.perf_counter()
+    now = 0.0
+    director.tick(now)
+    peak_tables = len(tournament.table_ids)
+    actions = ticks = 0
+    while tournament.status != "finished" and ticks < MAX_TICKS:
+        ticks += 1
+        now += 1.0
+        for table_id in list(tournament.table_ids):
+            for _ in range(ACTIONS_PER_TICK):
+                if manager.step_bot(table_id) is None:
+                    break
+                actions += 1
+        director.tick(now)
+        peak_tables = max(peak_tables, len(tournament.table_ids))
+    elapsed = time.perf_counter() - started
+
+    standings = director.standings(tournament_id, limit=1)
+    return {
+        "entrants": entrants,
+        "finished": tournament.status == "finished",
+        "winner": standings[0]["display_name"] if standings else None,
+        "ticks": ticks,
+        "bot_actions": actions,
+        "peak_tables": peak_tables,
+        "final_level": tournament.level + 1,
+        "seconds": round(elapsed, 3),
+        "actions_per_second": round(actions / elapsed, 1) if elapsed else 0.0,
+    }
+
+
+def main(argv: list[str] | None = None) -> None:
+    parser = argparse.ArgumentParser(description="Headless Teen Patti tournament run")
+    parser.add_argument("--entrants", type=int, default=1000)
+    parser.add_argument("--seed", type=int, default=None)
+    parser.add_argument("--seats", type=int, default=6)
+    parser.add_argument("--stack", type=int, default=500)
+    parser.add_argument("--level-seconds", type=float, default=10.0)
+    args = parser.parse_args(argv)
+
+    report = run_tournament(args.entrants, args.seed, args.seats, args.stack, args.level_seconds)
+    for key, value in report.items():
+        print(f"{key:>18}: {value}")
+
+
+if __name__ == "__main__":
+    main()
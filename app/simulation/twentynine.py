@@ -0,0 +1,153 @@
+from __future__ import annotations
+
+import argparse
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import dataclass, field
+import random
+import time
+from typing import Any
+
+from app.twentynine import EliteStrategy, T29Card, T29Player, T29Strategy, T29Table, TwentyNineManager
+
+
+class RandomStrategy:
+    """Baseline: never bids on its own and plays a random legal card."""
+
+    name = "random"
+
+    def choose_bid(self, manager: TwentyNineManager, table: T29Table, player: T29Player) -> tuple[int, str] | None:
+        return None
+
+    def choose_card(self, manager: TwentyNineManager, table: T29Table, player: T29Player) -> T29Card:
+        return manager.rng.choice(manager._legal_cards(table, player))
+
+
+STRATEGIES: dict[str, type] = {"elite": EliteStrategy, "random": RandomStrategy}
+# Hands per game: one full turn of the deal. Each game starts on a fresh table.
+HANDS_PER_GAME = 4
+
+
+@dataclass
+class StrategyStats:
+    hands: int = 0
+    contracts: int = 0
+    contracts_made: int = 0
+    points: int = 0
+
+    def merge(self, other: StrategyStats) -> None:
+        self.hands += other.hands
+        self.contracts += other.contracts
+        self.contracts_made += other.contracts_made
+        self.points += other.points
+
+    def as_dict(self) -> dict[str, Any]:
+        return {
+            "hands": self.hands,
+            "contracts": self.contracts,
+            "contract_success_rate": self.contracts_made / self.contracts if self.contracts else 0.0,
+            "points_per_hand": self.points / self.hands if self.hands else 0.0,
+        }
+
+
+@dataclass
+class SimulationReport:
+    hands: int = 0
+    seconds: float = 0.0
+    teams: dict[str, StrategyStats] = field(default_factory=dict)
+
+    @property
+    def hands_per_second(self) -> float:
+        return self.hands / self.seconds if self.seconds else 0.0
+
+    def as_dict(self) -> dict[str, Any]:
+        return {
+            "hands": self.hands,
+            "seconds": round(self.seconds, 3),
+            "hands_per_second": round(self.hands_per_second, 1),
+            "teams": {label: stats.as_dict() for label, stats in self.teams.items()},
+        }
+
+
+def _team_labels(team_a: T29Strategy, team_b: T29Strategy) -> tuple[str, str]:
+    if team_a.name == team_b.name:
+        return f"{team_a.name}:A", f"{team_b.name}:B"
+    return team_a.name, team_b.name
+
+
+def _play_chunk(team_a: T29Strategy, team_b: T29Strategy, hands: int, seed: int | None) -> dict[str, StrategyStats]:
+    manager = TwentyNineManager(rng=random.Random(seed))
+    labels = _team_labels(team_a, team_b)
+    stats = {label: StrategyStats() for label in labels}
+    for game, first in enumerate(range(0, hands, HANDS_PER_GAME)):
+        # Lineups swap seats every game, so neither strategy keeps a seat's place in the deal or auction.
+        swap = game % 2
+        team_labels = labels[swap:] + labels[:swap]
+        table_id = manager.create_table("Simulation")["table_id"]
+        manager.add_bots(table_id, 4)
+        table = manager.tables[table_id]
+        for seat, player in enumerate(table.players):
+            manager.strategies[player.player_id] = team_a if (seat + swap) % 2 == 0 else team_b
+
+        for _ in range(min(HANDS_PER_GAME, hands - first)):
+            manager.run_bot_hands(table_id, 1)
+            result = next(e for e in reversed(table.history) if e["event"] == "hand_end")
+            for team, label in enumerate(team_labels):
+                stats[label].hands += 1
+                stats[label].points += result["team_points"][team]
+            bidder_stats = stats[team_labels[table.seat_of[result["bidder"]] % 2]]
+            bidder_stats.contracts += 1
+            bidder_stats.contracts_made += int(result["contract_made"])
+        with table.lock:
+            manager._drop_table(table)
+    return stats
+
+
+def run_simulation(
+    team_a: T29Strategy,
+    team_b: T29Strategy,
+    hands: int,
+    seed: int | None = None,
+    workers: int = 1,
+) -> SimulationReport:
+    """Play ``hands`` Twenty-Nine hands between two strategies, swapping seats 0/2 and 1/3 every game."""
+    workers = max(1, min(workers, hands))
+    base_seed = seed if seed is not None else random.SystemRandom().getrandbits(32)
+    chunk, extra = divmod(hands, workers)
+    sizes = [chunk + (1 if i < extra else 0) for i in range(workers)]
+
+    started = time.perf_counter()
+    if workers == 1:
+        results = [_play_chunk(team_a, team_b, hands, base_seed)]
+    else:
+        with ProcessPoolExecutor(max_workers=workers) as pool:
+            futures = [pool.submit(_play_chunk, team_a, team_b, size, base_seed + i) for i, size in enumerate(sizes)]
+            results = [future.result() for future in futures]
+
+    report = SimulationReport(hands=hands, seconds=time.perf_counter() - started)
+    for partial in results:
+        for label, stats in partial.items():
+            report.teams.setdefault(label, StrategyStats()).merge(stats)
+    return report
+
+
+def main(argv: list[str] | None = None) -> None:
+    parser = argparse.ArgumentParser(description="Headless Twenty-Nine self-play simulator")
+    parser.add_argument("--hands", type=int, default=10_000)
+    parser.add_argument("--workers", type=int, default=1)
+    parser.add_argument("--seed", type=int, default=None)
+    parser.add_argument("--team-a", choices=sorted(STRATEGIES), default="elite")
+    parser.add_argument("--team-b", choices=sorted(STRATEGIES), default="elite")
+    args = parser.parse_args(argv)
+
+    report = run_simulation(STRATEGIES[args.team_a](), STRATEGIES[args.team_b](), args.hands, args.seed, args.workers)
+    data = report.as_dict()
+    print(f"hands={data['hands']} seconds={data['seconds']} hands/s={data['hands_per_second']}")
+    for label, stats in data["teams"].items():
+        print(
+            f"{label:>10}: contracts={stats['contracts']} "
+            f"success={stats['contract_success_rate']:.3f} points/hand={stats['points_per_hand']:.2f}"
+        )
+
+
+if __name__ == "__main__":
+    main()
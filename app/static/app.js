@@ -64,6 +64,8 @@ class TeenPattiClient {
       seeBtn: byId("seeBtn"),
       callBtn: byId("callBtn"),
       raiseBtn: byId("raiseBtn"),
+      showBtn: byId("showBtn"),
+      sideShowBtn: byId("sideShowBtn"),
       packBtn: byId("packBtn"),
       refreshAdminBtn: byId("refreshAdminBtn"),
       addBotsBtn: byId("addBotsBtn"),
@@ -92,6 +94,8 @@ class TeenPattiClient {
     this.nodes.seeBtn.addEventListener("click", () => this.doAction("see"));
     this.nodes.callBtn.addEventListener("click", () => this.doAction("call"));
     this.nodes.raiseBtn.addEventListener("click", () => this.raiseAction());
+    this.nodes.showBtn.addEventListener("click", () => this.doAction("show"));
+    this.nodes.sideShowBtn.addEventListener("click", () => this.doAction("sideshow"));
     this.nodes.packBtn.addEventListener("click", () => this.doAction("pack"));
     this.nodes.refreshAdminBtn.addEventListener("click", () => this.loadAdminOverview());
     this.nodes.addBotsBtn.addEventListener("click", () => this.addBots());
@@ -434,6 +438,10 @@ class TeenPattiClient {
         joinButton.textContent = "Join Table";
         joinButton.addEventListener("click", () => this.joinTable(table.table_id, table.boot_amount * 100));
         row.appendChild(joinButton);
+        const watchButton = document.createElement("button");
+        watchButton.textContent = "Watch";
+        watchButton.addEventListener("click", () => this.watchTable(table.table_id));
+        row.appendChild(watchButton);
         this.nodes.tableList.appendChild(row);
       });
       this.playTone(520, 0.05, 0.02);
@@ -455,6 +463,21 @@ class TeenPattiClient {
     }
   }
 
+  watchTable(tableId) {
+    this.currentTableId = tableId;
+    this.nodes.tableSection.style.display = "block";
+    if (this.ws) this.ws.close();
+    const protocol = location.protocol === "https:" ? "wss" : "ws";
+    this.ws = new WebSocket(`${protocol}://${location.host}/ws/table/${tableId}/watch`);
+    // Spectator frames are pre-encoded JSON sent as binary messages.
+    this.ws.binaryType = "arraybuffer";
+    const decoder = new TextDecoder();
+    this.ws.onmessage = (event) => {
+      const payload = JSON.parse(decoder.decode(event.data));
+      if (payload.type === "state") this.renderTable(payload.state);
+    };
+  }
+
   connectSocket(tableId) {
     if (this.ws) this.ws.close();
     const protocol = location.protocol === "https:" ? "wss" : "ws";
@@ -462,10 +485,46 @@ class TeenPattiClient {
     this.ws.onopen = () => this.ws.send("listen");
     this.ws.onmessage = (event) => {
       const payload = JSON.parse(event.data);
-      if (payload.type === "state") this.renderTable(payload.state);
+      // Broadcasts carry the public view; pull our own to keep seeing our cards.
+      if (payload.type === "state") this.refreshOwnView(tableId, payload.state);
+      if (payload.type === "seat_moved" && payload.player_id === String(this.profile?.id)) this.followSeat(payload.to_table);
+      if (payload.type === "table_closed") this.findSeat();
     };
   }
 
+  async refreshOwnView(tableId, publicState) {
+    const me = String(this.profile?.id);
+    const moved = [...(publicState.action_log || [])].reverse().find((e) => e.event === "seat_moved" && e.player_id === me);
+    if (moved && !publicState.players.some((p) => p.player_id === me)) return this.followSeat(moved.to_table);
+    this.renderTable(publicState);
+    if (!publicState.hand_active) return;
+    try {
+      const state = await this.api(`/api/game/table/${tableId}`);
+      if (this.currentTableId === tableId && state.version >= publicState.version) this.renderTable(state);
+    } catch (error) {
+      this.setMessage(this.nodes.profileMsg, error.message, true);
+    }
+  }
+
+  async findSeat() {
+    try {
+      const seats = await this.api("/api/game/seats");
+      if (seats.length) this.followSeat(seats[0]);
+    } catch (error) {
+      this.setMessage(this.nodes.profileMsg, error.message, true);
+    }
+  }
+
+  async followSeat(tableId) {
+    this.currentTableId = tableId;
+    this.connectSocket(tableId);
+    try {
+      this.renderTable(await this.api(`/api/game/table/${tableId}`));
+    } catch (error) {
+      this.setMessage(this.nodes.profileMsg, error.message, true);
+    }
+  }
+
   seatClass(index) {
     return `seat seat-${Math.min(index, 5)}`;
   }
@@ -516,7 +575,7 @@ class TeenPattiClient {
 
   async doAction(action) {
     try {
-      const state = await this.api("/api/game/action", "POST", { action });
+      const state = await this.api("/api/game/action", "POST", { table_id: this.currentTableId, action });
       this.renderTable(state);
       this.playTone(680, 0.05, 0.025);
     } catch (error) {
@@ -526,7 +585,7 @@ class TeenPattiClient {
 
   async raiseAction() {
     try {
-      const state = await this.api("/api/game/action", "POST", { action: "raise", amount: 1000 });
+      const state = await this.api("/api/game/action", "POST", { table_id: this.currentTableId, action: "raise", amount: 1000 });
       this.renderTable(state);
       this.playTone(920, 0.08, 0.025);
     } catch (error) {
@@ -18,13 +18,20 @@ class Card:
         return f"{self.rank}{self.suit}"
 
 
-def new_deck(seed: int | None = None) -> list[Card]:
-    deck = [Card(rank, suit) for rank in RANK_ORDER for suit in SUITS]
-    rnd = random.Random(seed)
-    rnd.shuffle(deck)
+# Cards are immutable, so every deck is a shuffled copy of this one.
+_DECK = tuple(Card(rank, suit) for rank in RANK_ORDER for suit in SUITS)
+
+
+def shuffled_deck(rng: random.Random) -> list[Card]:
+    deck = list(_DECK)
+    rng.shuffle(deck)
     return deck
 
 
+def new_deck(seed: int | None = None) -> list[Card]:
+    return shuffled_deck(random.Random(seed))
+
+
 def _validate_hand(cards: list[Card]) -> None:
     if len(cards) != 3:
         raise ValueError("Teen Patti hand must contain exactly 3 cards")
@@ -101,6 +108,19 @@ def best_hand(players_cards: dict[str, list[Card]]) -> tuple[str, tuple[int, lis
     return winner_player_id, winner_score
 
 
+def rank_hands(players_cards: dict[str, list[Card]]) -> list[list[str]]:
+    """Rank every hand in one pass: groups of player ids, strongest first; a group holds tied hands."""
+    scored = sorted(((evaluate_hand(cards), player_id) for player_id, cards in players_cards.items()), reverse=True)
+    tiers: list[list[str]] = []
+    previous: tuple[int, list[int]] | None = None
+    for score, player_id in scored:
+        if score != previous:
+            tiers.append([])
+            previous = score
+        tiers[-1].append(player_id)
+    return tiers
+
+
 def odds_snapshot(deck: list[Card], known_cards: list[Card], simulations: int = 500) -> float:
     if not known_cards:
         return 0.0
@@ -0,0 +1,56 @@
+"""Precomputed Teen Patti hand equity for bots that only see their own cards.
+
+Every one of the 22,100 three-card hands is ranked once at import. A hand's
+equity against one random opponent is the share of hands it beats (ties count
+half). Against ``n`` opponents it is that share to the ``n``-th power, which
+treats opponents as independent and ignores card removal. A decision then
+costs one :func:`~app.teenpatti.evaluate_hand` and a dict lookup.
+"""
+
+from __future__ import annotations
+
+from itertools import combinations
+
+from .teenpatti import RANK_ORDER, SUITS, Card, evaluate_hand
+
+MAX_OPPONENTS = 5
+
+HandKey = tuple[int, tuple[int, ...]]
+
+
+def hand_key(cards: list[Card]) -> HandKey:
+    rank, tiebreak = evaluate_hand(cards)
+    return (rank, tuple(tiebreak))
+
+
+def _build_tables() -> tuple[dict[HandKey, tuple[float, ...]], tuple[float, ...]]:
+    deck = [Card(rank, suit) for rank in RANK_ORDER for suit in SUITS]
+    counts: dict[HandKey, int] = {}
+    for cards in combinations(deck, 3):
+        key = hand_key(list(cards))
+        counts[key] = counts.get(key, 0) + 1
+
+    total = sum(counts.values())
+    equity: dict[HandKey, tuple[float, ...]] = {}
+    blind = [0.0] * (MAX_OPPONENTS + 1)
+    beaten = 0
+    for key in sorted(counts):
+        heads_up = (beaten + counts[key] / 2) / total
+        row = tuple(heads_up**n for n in range(MAX_OPPONENTS + 1))
+        equity[key] = row
+        for n in range(MAX_OPPONENTS + 1):
+            blind[n] += row[n] * counts[key] / total
+        beaten += counts[key]
+    return equity, tuple(blind)
+
+
+# EQUITY[hand_key][n]: chance of beating n random opponents; BLIND_EQUITY[n]: the same for an unseen hand.
+EQUITY, BLIND_EQUITY = _build_tables()
+
+
+def hand_equity(cards: list[Card], opponents: int) -> float:
+    return EQUITY[hand_key(cards)][min(max(opponents, 0), MAX_OPPONENTS)]
+
+
+def blind_equity(opponents: int) -> float:
+    return BLIND_EQUITY[min(max(opponents, 0), MAX_OPPONENTS)]
@@ -0,0 +1,75 @@
+from __future__ import annotations
+
+import math
+from typing import Generic, Hashable, TypeVar
+
+K = TypeVar("K", bound=Hashable)
+
+DEFAULT_TICK_SECONDS = 0.5
+DEFAULT_SLOTS = 512
+
+
+class TimerWheel(Generic[K]):
+    """Hashed timing wheel holding at most one pending deadline per key.
+
+    A deadline lands in slot ``tick % slots``; ``advance`` only visits the slots
+    whose tick has passed, so its cost is the number of timers falling due there
+    rather than the number of armed timers. Re-arming or cancelling a key only
+    bumps its generation and the stale slot entry is dropped when its slot comes
+    round. Deadlines further out than one revolution (``tick_seconds * slots``)
+    are carried over until their tick arrives.
+
+    Not thread-safe: the owner drives it from a single thread or event loop.
+    """
+
+    def __init__(self, tick_seconds: float = DEFAULT_TICK_SECONDS, slots: int = DEFAULT_SLOTS, now: float = 0.0) -> None:
+        self.tick_seconds = tick_seconds
+        self._origin = now
+        self._tick = 0
+        self._slots: list[list[tuple[K, int, int]]] = [[] for _ in range(slots)]
+        self._active: dict[K, int] = {}
+        self._generation = 0
+
+    def __len__(self) -> int:
+        return len(self._active)
+
+    def __contains__(self, key: object) -> bool:
+        return key in self._active
+
+    def schedule(self, key: K, delay: float, now: float) -> None:
+        """Arm ``key`` to fire ``delay`` seconds after ``now``, replacing any pending deadline."""
+        due = max(self._tick + 1, math.ceil((now + delay - self._origin) / self.tick_seconds))
+        self._generation += 1
+        self._active[key] = self._generation
+        self._slots[due % len(self._slots)].append((key, self._generation, due))
+
+    def cancel(self, key: K) -> None:
+        self._active.pop(key, None)
+
+    def advance(self, now: float) -> list[K]:
+        """Move the wheel to ``now`` and return the keys whose deadline has passed, in firing order."""
+        target = math.floor((now - self._origin) / self.tick_seconds)
+        if target <= self._tick:
+            return []
+        slots = len(self._slots)
+        # After a stall longer than a revolution every slot is visited exactly once.
+        first = max(self._tick + 1, target - slots + 1)
+        expired: list[K] = []
+        for tick in range(first, target + 1):
+            idx = tick % slots
+            bucket = self._slots[idx]
+            if not bucket:
+                continue
+            keep: list[tuple[K, int, int]] = []
+            for entry in bucket:
+                key, generation, due = entry
+                if self._active.get(key) != generation:
+                    continue
+                if due > target:
+                    keep.append(entry)
+                    continue
+                del self._active[key]
+                expired.append(key)
+            self._slots[idx] = keep
+        self._tick = target
+        return expired
@@ -0,0 +1,398 @@
+"""Sit-and-go and multi-table Teen Patti tournaments on top of the GameManager.
+
+Tournament tables are ordinary Teen Patti tables, each under its own lock. They
+are created on demand from a :class:`TournamentBlueprint`, and only the director
+seats players at them. A single :meth:`TournamentDirector.tick`, driven by one
+background loop, does the periodic work for every tournament:
+
+- starts those that have filled;
+- raises boots as levels fall due, using one heap of level deadlines;
+- records busted players;
+- breaks or balances tables.
+
+A table that has to give up players is paused. Once its current hand is over the
+players are moved, and the table either deals again or is closed.
+
+Standings keep live stacks in a heap with lazy deletion, as the matchmaker does
+for tables, followed by busted players, last out first.
+"""
+
+from __future__ import annotations
+
+from dataclasses import dataclass, field
+import heapq
+import math
+import random
+from threading import Lock, RLock
+import time
+from typing import Any, Callable
+
+from .game import GameManager
+
+# Tournament tables take ids from here up, clear of the seeded cash tables.
+TOURNAMENT_TABLE_ID_BASE = 100_000
+
+
+@dataclass(frozen=True)
+class BlindLevel:
+    boot_amount: int
+    seconds: float
+
+
+DEFAULT_LEVELS = tuple(
+    BlindLevel(boot, 300.0) for boot in (10, 20, 30, 50, 75, 100, 150, 200, 300, 500, 750, 1000, 1500, 2000, 3000, 5000)
+)
+
+
+@dataclass(frozen=True)
+class TournamentBlueprint:
+    """Shape of a tournament's tables, in the manner of a ``TableConfig`` row, plus its structure."""
+
+    name: str
+    seats_per_table: int = 6
+    starting_stack: int = 1000
+    min_entrants: int = 2
+    # Starts on its own once this many have registered; with one table's worth it is a sit-and-go.
+    max_entrants: int = 6
+    levels: tuple[BlindLevel, ...] = DEFAULT_LEVELS
+
+
+@dataclass
+class Entrant:
+    player_id: str
+    display_name: str
+    is_bot: bool = False
+    table_id: int | None = None
+    chips: int = 0
+    place: int | None = None
+
+
+@dataclass
+class Tournament:
+    tournament_id: int
+    blueprint: TournamentBlueprint
+    status: str = "registering"  # registering -> running -> finished
+    entrants: dict[str, Entrant] = field(default_factory=dict)
+    level: int = 0
+    level_due: float | None = None
+    table_ids: set[int] = field(default_factory=set)
+    remaining: int = 0
+    # Busted player ids, first out first.
+    eliminated: list[str] = field(default_factory=list)
+    # Paused table id -> players it still has to give up (all of them when it is being broken).
+    pending_moves: dict[int, int] = field(default_factory=dict)
+    # Leaderboard heap of (-chips, player_id, generation); superseded entries are dropped lazily.
+    board: list[tuple[int, str, int]] = field(default_factory=list, repr=False)
+    board_generation: dict[str, int] = field(default_factory=dict, repr=False)
+    lock: RLock = field(default_factory=RLock, repr=False, compare=False)
+
+    def alive(self) -> list[Entrant]:
+        return [entrant for entrant in self.entrants.values() if entrant.place is None]
+
+
+class TournamentDirector:
+    def __init__(self, manager: GameManager, rng: random.Random | None = None) -> None:
+        self.manager = manager
+        self.rng = rng or random
+        self.tournaments: dict[int, Tournament] = {}
+        # Guards id allocation and the level schedule; each tournament has its own lock,
+        # always taken before any table lock.
+        self.lock = Lock()
+        self.next_tournament_id = 1
+        self.next_table_id = TOURNAMENT_TABLE_ID_BASE
+        self._levels: list[tuple[float, int, int]] = []  # (due, tournament_id, level)
+        self.clock: Callable[[], float] = time.monotonic
+
+    def create(self, blueprint: TournamentBlueprint) -> dict[str, Any]:
+        if not blueprint.levels:
+            raise ValueError("A tournament needs at least one level")
+        if not 2 <= blueprint.seats_per_table <= 6:
+            raise ValueError("Tournament tables seat 2 to 6 players")
+        if not 2 <= blueprint.min_entrants <= blueprint.max_entrants:
+            raise ValueError("Entrant limits out of range")
+        with self.lock:
+            tournament = Tournament(tournament_id=self.next_tournament_id, blueprint=blueprint)
+            self.next_tournament_id += 1
+            self.tournaments[tournament.tournament_id] = tournament
+        return self.state(tournament.tournament_id)
+
+    def list_tournaments(self) -> list[dict[str, Any]]:
+        return [self._summary(tournament) for tournament in sorted(self.tournaments.values(), key=lambda t: t.tournament_id)]
+
+    def register(self, tournament_id: int, player_id: str, display_name: str, is_bot: bool = False) -> dict[str, Any]:
+        tournament = self.tournaments[tournament_id]
+        with tournament.lock:
+            if tournament.status != "registering":
+                raise ValueError("Registration is closed")
+            if player_id in tournament.entrants:
+                raise ValueError("Already registered")
+            if len(tournament.entrants) >= tournament.blueprint.max_entrants:
+                raise ValueError("Tournament is full")
+            tournament.entrants[player_id] = Entrant(player_id=player_id, display_name=display_name, is_bot=is_bot)
+            return self._summary(tournament)
+
+    def add_bots(self, tournament_id: int, count: int) -> dict[str, Any]:
+        tournament = self.tournaments[tournament_id]
+        with tournament.lock:
+            for _ in range(count):
+                if len(tournament.entrants) >= tournament.blueprint.max_entrants:
+                    break
+                bot_id = f"tbot-{tournament_id}-{len(tournament.entrants) + 1}-{self.rng.randint(1000, 9999)}"
+                bot_name = self.rng.choice(["Ava", "Rex", "Nora", "Leo", "Mia", "Kane", "Iris"]) + " Bot"
+                self.register(tournament_id, bot_id, bot_name, is_bot=True)
+            return self._summary(tournament)
+
+    def start(self, tournament_id: int, now: float | None = None) -> set[int]:
+        """Seat every entrant at freshly created tables and deal; returns the table ids."""
+        tournament = self.tournaments[tournament_id]
+        now = self.clock() if now is None else now
+        with tournament.lock:
+            if tournament.status != "registering":
+                raise ValueError("Tournament already started")
+            if len(tournament.entrants) < tournament.blueprint.min_entrants:
+                raise ValueError("Not enough entrants")
+            blueprint = tournament.blueprint
+            entrants = list(tournament.entrants.values())
+            self.rng.shuffle(entrants)
+            table_ids = [self._open_table(tournament) for _ in range(math.ceil(len(entrants) / blueprint.seats_per_table))]
+            for idx, entrant in enumerate(entrants):
+                table_id = table_ids[idx % len(table_ids)]
+                try:
+                    self.manager.seat_entrant(table_id, entrant.player_id, entrant.display_name, blueprint.starting_stack, entrant.is_bot)
+                except ValueError:
+                    # The player hit their seat limit since registering; they are left out.
+                    del tournament.entrants[entrant.player_id]
+                    continue
+                entrant.table_id = table_id
+                entrant.chips = blueprint.starting_stack
+                self._rank(tournament, entrant)
+            tournament.remaining = len(tournament.entrants)
+            tournament.status = "running"
+            self._schedule_level(tournament, 1, now)
+            for table_id in table_ids:
+                self.manager.set_paused(table_id, False)
+            return set(table_ids)
+
+    def tick(self, now: float | None = None) -> set[int]:
+        """Do every tournament's due work; returns the ids of tables whose state changed."""
+        now = self.clock() if now is None else now
+        due: list[tuple[float, int, int]] = []
+        with self.lock:
+            while self._levels and self._levels[0][0] <= now:
+                due.append(heapq.heappop(self._levels))
+            tournaments = list(self.tournaments.values())
+
+        touched: set[int] = set()
+        for _, tournament_id, level in due:
+            touched |= self._raise_level(self.tournaments[tournament_id], level, now)
+        for tournament in tournaments:
+            if tournament.status == "registering" and len(tournament.entrants) >= tournament.blueprint.max_entrants:
+                try:
+                    touched |= self.start(tournament.tournament_id, now)
+                except ValueError:
+                    continue  # started by someone else in the meantime
+            elif tournament.status == "running":
+                with tournament.lock:
+                    self._record_busts(tournament)
+                    touched |= self._rebalance(tournament)
+        return touched
+
+    def standings(self, tournament_id: int, limit: int = 20) -> list[dict[str, Any]]:
+        """Live players by stack, then busted players by finishing place."""
+        tournament = self.tournaments[tournament_id]
+        with tournament.lock:
+            rows: list[dict[str, Any]] = []
+            kept: list[tuple[int, str, int]] = []
+            board = tournament.board
+            while board and len(rows) < limit:
+                entry = heapq.heappop(board)
+                if tournament.board_generation.get(entry[1]) != entry[2]:
+                    continue
+                kept.append(entry)
+                rows.append(self._row(tournament.entrants[entry[1]], rank=len(rows) + 1))
+            for entry in kept:
+                heapq.heappush(board, entry)
+            for player_id in reversed(tournament.eliminated):
+                if len(rows) >= limit:
+                    break
+                entrant = tournament.entrants[player_id]
+                rows.append(self._row(entrant, rank=entrant.place))
+            return rows
+
+    def state(self, tournament_id: int, limit: int = 20) -> dict[str, Any]:
+        tournament = self.tournaments[tournament_id]
+        with tournament.lock:
+            return {**self._summary(tournament), "standings": self.standings(tournament_id, limit)}
+
+    def _summary(self, tournament: Tournament) -> dict[str, Any]:
+        blueprint = tournament.blueprint
+        return {
+            "tournament_id": tournament.tournament_id,
+            "name": blueprint.name,
+            "status": tournament.status,
+            "entrants": len(tournament.entrants),
+            "max_entrants": blueprint.max_entrants,
+            "remaining": tournament.remaining,
+            "level": tournament.level + 1,
+            "boot_amount": blueprint.levels[tournament.level].boot_amount,
+            "tables": sorted(tournament.table_ids),
+        }
+
+    def _row(self, entrant: Entrant, rank: int | None) -> dict[str, Any]:
+        return {
+            "rank": rank,
+            "player_id": entrant.player_id,
+            "display_name": entrant.display_name,
+            "chips": entrant.chips,
+            "table_id": entrant.table_id,
+            "place": entrant.place,
+        }
+
+    def _open_table(self, tournament: Tournament) -> int:
+        with self.lock:
+            table_id = self.next_table_id
+            self.next_table_id += 1
+        blueprint = tournament.blueprint
+        self.manager.create_table(
+            {
+                "id": table_id,
+                "name": f"{blueprint.name} #{len(tournament.table_ids) + 1}",
+                "max_players": blueprint.seats_per_table,
+                "boot_amount": blueprint.levels[tournament.level].boot_amount,
+                "min_buyin": blueprint.starting_stack,
+                "max_buyin": blueprint.starting_stack,
+            },
+            tournament_id=tournament.tournament_id,
+        )
+        tournament.table_ids.add(table_id)
+        return table_id
+
+    def _schedule_level(self, tournament: Tournament, level: int, now: float) -> None:
+        levels = tournament.blueprint.levels
+        if level >= len(levels):
+            tournament.level_due = None  # the last level lasts until the end
+            return
+        tournament.level_due = now + levels[level - 1].seconds
+        with self.lock:
+            heapq.heappush(self._levels, (tournament.level_due, tournament.tournament_id, level))
+
+    def _raise_level(self, tournament: Tournament, level: int, now: float) -> set[int]:
+        with tournament.lock:
+            if tournament.status != "running" or level != tournament.level + 1:
+                return set()
+            tournament.level = level
+            boot = tournament.blueprint.levels[level].boot_amount
+            for table_id in tournament.table_ids:
+                self.manager.set_boot(table_id, boot)
+            self._schedule_level(tournament, level + 1, now)
+            return set(tournament.table_ids)
+
+    def _rank(self, tournament: Tournament, entrant: Entrant) -> None:
+        """Push ``entrant``'s current stack onto the leaderboard, superseding their previous entry."""
+        generation = tournament.board_generation.get(entrant.player_id, 0) + 1
+        tournament.board_generation[entrant.player_id] = generation
+        if entrant.place is None:
+            heapq.heappush(tournament.board, (-entrant.chips, entrant.player_id, generation))
+        if len(tournament.board) > 4 * max(tournament.remaining, 1):
+            tournament.board = [entry for entry in tournament.board if tournament.board_generation[entry[1]] == entry[2]]
+            heapq.heapify(tournament.board)
+
+    def _record_busts(self, tournament: Tournament) -> None:
+        seated: dict[str, tuple[int, bool]] = {}
+        for table_id in tournament.table_ids:
+            table = self.manager.tables[table_id]
+            with table.lock:
+                for player in table.players:
+                    seated[player.player_id] = (player.chips, table.hand_active)
+
+        busted: list[Entrant] = []
+        for entrant in tournament.alive():
+            chips, in_hand = seated.get(entrant.player_id, (0, False))
+            # An all-in stack shows 0 chips until its hand is settled.
+            if chips == 0 and not in_hand:
+                busted.append(entrant)
+            elif chips != entrant.chips:
+                entrant.chips = chips
+                self._rank(tournament, entrant)
+
+        # Players knocked out together finish in order of the stacks they last had.
+        for entrant in sorted(busted, key=lambda e: e.chips):
+            entrant.place = tournament.remaining
+            entrant.chips = 0
+            tournament.remaining -= 1
+            tournament.eliminated.append(entrant.player_id)
+            self._rank(tournament, entrant)
+
+        if tournament.remaining <= 1:
+            self._finish(tournament)
+
+    def _finish(self, tournament: Tournament) -> None:
+        for entrant in tournament.alive():
+            entrant.place = 1
+            tournament.eliminated.append(entrant.player_id)
+            self._rank(tournament, entrant)
+        tournament.status = "finished"
+        tournament.remaining = 0
+        tournament.pending_moves.clear()
+        for table_id in list(tournament.table_ids):
+            self.manager.close_table(table_id)
+            tournament.table_ids.discard(table_id)
+
+    def _plan_moves(self, counts: dict[int, int], remaining: int, seats: int) -> dict[int, int]:
+        """One round of moves: break the shortest surplus tables, then even out the rest to within one player."""
+        by_size = sorted(counts, key=lambda tid: (counts[tid], -tid))
+        plan = {table_id: counts[table_id] for table_id in by_size[: len(counts) - math.ceil(remaining / seats)]}
+        kept = {table_id: count for table_id, count in counts.items() if table_id not in plan}
+        for _ in range(sum(plan.values())):
+            kept[min(kept, key=lambda tid: (kept[tid], tid))] += 1
+        while kept:
+            largest = max(kept, key=lambda tid: (kept[tid], tid))
+            smallest = min(kept, key=lambda tid: (kept[tid], tid))
+            if kept[largest] - kept[smallest] <= 1:
+                break
+            kept[largest] -= 1
+            kept[smallest] += 1
+            plan[largest] = plan.get(largest, 0) + 1
+        return plan
+
+    def _rebalance(self, tournament: Tournament) -> set[int]:
+        if tournament.status != "running":
+            return set()
+        seats = tournament.blueprint.seats_per_table
+        counts = dict.fromkeys(tournament.table_ids, 0)
+        for entrant in tournament.alive():
+            counts[entrant.table_id] += 1
+
+        touched: set[int] = set()
+        if not tournament.pending_moves:
+            tournament.pending_moves = self._plan_moves(counts, tournament.remaining, seats)
+            for table_id in tournament.pending_moves:
+                self.manager.set_paused(table_id, True)
+                touched.add(table_id)
+
+        for table_id, count in list(tournament.pending_moves.items()):
+            if self.manager.tables[table_id].hand_active:
+                continue  # paused: the players move once this hand is over
+            movers = [entrant for entrant in tournament.alive() if entrant.table_id == table_id][:count]
+            for entrant in movers:
+                targets = [tid for tid in counts if tid != table_id and tid not in tournament.pending_moves and counts[tid] < seats]
+                if not targets:
+                    break
+                target = min(targets, key=lambda tid: (counts[tid], tid))
+                try:
+                    self.manager.transfer_seat(entrant.player_id, target, from_table_id=table_id)
+                except ValueError:
+                    break  # the table changed under us; the next round re-plans
+                entrant.table_id = target
+                counts[table_id] -= 1
+                counts[target] += 1
+                touched.add(target)
+            del tournament.pending_moves[table_id]
+            touched.add(table_id)
+            if counts[table_id] == 0:
+                self.manager.close_table(table_id)
+                tournament.table_ids.discard(table_id)
+                del counts[table_id]
+            else:
+                self.manager.set_paused(table_id, False)
+        return touched
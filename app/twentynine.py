@@ -3,12 +3,26 @@ from __future__ import annotations
 from dataclasses import dataclass, field
 from datetime import datetime
 import random
-from threading import Lock
-from typing import Any
+from threading import Lock, RLock
+import time
+from typing import Any, Callable, Protocol
+
+from .registry import ShardedTableRegistry
+from .shuffle import SeededShuffle, ShuffleService
 
 RANKS = ["J", "9", "A", "10", "K", "Q", "8", "7"]
 SUITS = ["S", "H", "D", "C"]
 RANK_POINTS = {"J": 3, "9": 2, "A": 1, "10": 1, "K": 0, "Q": 0, "8": 0, "7": 0}
+MATCH_POINTS = 6
+RESULT_BATCH_SIZE = 50
+HISTORY_LIMIT = 200
+MAX_TABLES_PER_USER = 3
+# Events a polling client can apply on top of its last snapshot; anything else forces a full resync.
+DELTA_EVENTS = {"bid", "bot_bid", "play", "bot_play", "trick_win", "hand_end", "match_end", "timeout", "ready"}
+# Consecutive timed-out turns after which a seat is handed to a bot.
+MAX_MISSED_TURNS = 3
+# Hands a training run plays per hold of the table lock.
+TRAINING_CHUNK_HANDS = 25
 
 
 @dataclass(frozen=True)
@@ -20,12 +34,22 @@ class T29Card:
         return f"{self.rank}{self.suit}"
 
 
+_DECK = tuple(T29Card(rank=r, suit=s) for s in SUITS for r in RANKS)
+
+
+def shuffled_deck(rng: random.Random) -> list[T29Card]:
+    deck = list(_DECK)
+    rng.shuffle(deck)
+    return deck
+
+
 @dataclass
 class T29Player:
     player_id: str
     display_name: str
     is_bot: bool = False
     hand: list[T29Card] = field(default_factory=list)
+    missed_turns: int = 0
 
 
 @dataclass
@@ -46,25 +70,90 @@ class T29Table:
     history: list[dict[str, Any]] = field(default_factory=list)
     deck: list[T29Card] = field(default_factory=list)
     hand_started_at: datetime | None = None
+    dealer_idx: int = 3
+    game_score: list[int] = field(default_factory=lambda: [0, 0])
+    match_no: int = 1
+    match_hands: int = 0
+    hands_played: int = 0
+    ready: set[str] = field(default_factory=set)
+    # player_id -> seat; seats never change once taken (a timed-out seat is handed to a bot in place).
+    seat_of: dict[str, int] = field(default_factory=dict)
+    # The committed shuffle behind the current hand, when dealt by a ShuffleService.
+    shuffle: SeededShuffle | None = None
+    version: int = 0
+    history_floor: int = 0
+    state_cache: dict[str | None, dict[str, Any]] = field(default_factory=dict, repr=False)
+    created_by: str | None = None
+    last_activity: float = field(default_factory=time.monotonic)
+    lock: RLock = field(default_factory=RLock, repr=False, compare=False)
+
+
+class T29Strategy(Protocol):
+    name: str
+
+    def choose_bid(self, manager: TwentyNineManager, table: T29Table, player: T29Player) -> tuple[int, str] | None: ...
+
+    def choose_card(self, manager: TwentyNineManager, table: T29Table, player: T29Player) -> T29Card: ...
+
+
+class EliteStrategy:
+    """Default bot: strength-based bidding and greedy trick play."""
+
+    name = "elite"
+
+    def choose_bid(self, manager: TwentyNineManager, table: T29Table, player: T29Player) -> tuple[int, str] | None:
+        # Bid what the hand is worth, or pass once the auction is past it.
+        strength = manager._estimate_hand_strength(player.hand)
+        target = min(29, 14 + int(strength * 13))
+        if target <= table.highest_bid:
+            return None
+        return target, manager._best_trump(player.hand)
+
+    def choose_card(self, manager: TwentyNineManager, table: T29Table, player: T29Player) -> T29Card:
+        return manager._elite_choose_card(table, player)
+
+
+DEFAULT_STRATEGY = EliteStrategy()
 
 
 class TwentyNineManager:
-    def __init__(self) -> None:
-        self.tables: dict[int, T29Table] = {}
+    def __init__(self, rng: random.Random | None = None) -> None:
+        self.tables: ShardedTableRegistry[T29Table] = ShardedTableRegistry()
         self.user_table: dict[str, int] = {}
         self.next_table_id = 1
-        self.lock = Lock()
-
-    def create_table(self, name: str) -> dict[str, Any]:
-        with self.lock:
-            table = T29Table(table_id=self.next_table_id, name=name)
-            self.tables[self.next_table_id] = table
+        # Guards table id allocation and the user_table seat index only; game
+        # state is protected by each table's own lock.
+        self.index_lock = Lock()
+        self.results_lock = Lock()
+        self.owned_tables: dict[str, set[int]] = {}
+        self.max_tables_per_user = MAX_TABLES_PER_USER
+        self.rng = rng or random
+        # When set, decks come from this service with a commit-reveal entry in the hand log.
+        self.shuffler: ShuffleService | None = None
+        # Per-bot overrides of DEFAULT_STRATEGY, keyed by player id.
+        self.strategies: dict[str, T29Strategy] = {}
+        # Finished matches are buffered and handed to the sink in batches so
+        # that training tables do not pay a database round-trip per match.
+        self.result_sink: Callable[[list[dict[str, Any]]], None] | None = None
+        self.result_batch_size = RESULT_BATCH_SIZE
+        self.pending_results: list[dict[str, Any]] = []
+
+    def create_table(self, name: str, owner_id: str | None = None) -> dict[str, Any]:
+        with self.index_lock:
+            if owner_id is not None:
+                owned = self.owned_tables.setdefault(owner_id, set())
+                if len(owned) >= self.max_tables_per_user:
+                    raise ValueError("Twenty-Nine table creation limit reached")
+                owned.add(self.next_table_id)
+            table = T29Table(table_id=self.next_table_id, name=name, created_by=owner_id)
             self.next_table_id += 1
+        self.tables[table.table_id] = table
+        with table.lock:
             return self._state(table, None)
 
     def list_tables(self) -> list[dict[str, Any]]:
-        with self.lock:
-            return [
+        return sorted(
+            (
                 {
                     "table_id": t.table_id,
                     "name": t.name,
@@ -73,61 +162,105 @@ class TwentyNineManager:
                     "highest_bid": t.highest_bid,
                 }
                 for t in self.tables.values()
-            ]
+            ),
+            key=lambda item: item["table_id"],
+        )
 
     def join_table(self, table_id: int, player_id: str, display_name: str, is_bot: bool = False) -> dict[str, Any]:
-        with self.lock:
-            if player_id in self.user_table:
-                raise ValueError("Player already joined a table")
-            table = self.tables[table_id]
+        table = self.tables[table_id]
+        with table.lock:
             if len(table.players) >= 4:
                 raise ValueError("Twenty-Nine table is full")
+            with self.index_lock:
+                if player_id in self.user_table:
+                    raise ValueError("Player already joined a table")
+                self.user_table[player_id] = table_id
+            table.seat_of[player_id] = len(table.players)
             table.players.append(T29Player(player_id=player_id, display_name=display_name, is_bot=is_bot))
-            self.user_table[player_id] = table_id
             table.won_tricks[player_id] = 0
-            table.history.append({"event": "join", "player_id": player_id, "at": datetime.utcnow().isoformat()})
+            self._log(table, {"event": "join", "player_id": player_id, "at": datetime.utcnow().isoformat()})
             return self._state(table, player_id)
 
     def add_bots(self, table_id: int, count: int) -> dict[str, Any]:
-        with self.lock:
-            table = self.tables[table_id]
+        table = self.tables[table_id]
+        with table.lock:
             for _ in range(count):
                 if len(table.players) >= 4:
                     break
-                bot_id = f"t29-bot-{table_id}-{len(table.players)+1}-{random.randint(1000,9999)}"
-                bot_name = random.choice(["Orion", "Nova", "Alpha", "Sigma"]) + " Bot"
+                bot_id = f"t29-bot-{table_id}-{len(table.players)+1}-{self.rng.randint(1000,9999)}"
+                bot_name = self.rng.choice(["Orion", "Nova", "Alpha", "Sigma"]) + " Bot"
+                table.seat_of[bot_id] = len(table.players)
                 table.players.append(T29Player(player_id=bot_id, display_name=bot_name, is_bot=True))
-                self.user_table[bot_id] = table_id
+                with self.index_lock:
+                    self.user_table[bot_id] = table_id
                 table.won_tricks[bot_id] = 0
+                self._log(table, {"event": "bot_join", "player_id": bot_id})
             return self._state(table, None)
 
     def start_hand(self, table_id: int) -> dict[str, Any]:
-        with self.lock:
-            table = self.tables[table_id]
+        """Deal a hand; on an all-bot table, which nothing else drives, play it out as well."""
+        table = self.tables[table_id]
+        with table.lock:
             if len(table.players) != 4:
                 raise ValueError("Twenty-Nine needs exactly 4 players")
-
-            table.deck = [T29Card(rank=r, suit=s) for s in SUITS for r in RANKS]
-            random.shuffle(table.deck)
-            for p in table.players:
-                p.hand = sorted([table.deck.pop() for _ in range(8)], key=lambda c: (SUITS.index(c.suit), RANKS.index(c.rank)))
-            table.hand_active = True
-            table.bids = {}
-            table.highest_bid = 16
-            table.highest_bidder = None
-            table.trump_suit = None
-            table.turn_idx = 0
-            table.team_points = {0: 0, 1: 0}
-            table.trick_cards = []
-            table.lead_suit = None
-            table.hand_started_at = datetime.utcnow()
-            table.history.append({"event": "hand_start", "at": datetime.utcnow().isoformat()})
-            self._auto_bid_if_bots(table)
-            return self._state(table, None)
+            self._deal_hand(table)
+            if self._all_bots(table):
+                self._play_out_hand(table)
+            else:
+                self._auto_play_bots(table)
+            state = self._state(table, None)
+            batch = self._take_result_batch()
+        self._persist_results(batch)
+        return state
+
+    def mark_ready(self, player_id: str) -> dict[str, Any]:
+        table = self._player_table(player_id)
+        with table.lock:
+            self._seat(table, player_id)
+            if table.hand_active:
+                raise ValueError("Hand already in progress")
+            table.ready.add(player_id)
+            self._log(table, {"event": "ready", "player_id": player_id})
+            if self._deal_if_ready(table):
+                self._auto_play_bots(table)
+            state = self._state(table, player_id)
+            batch = self._take_result_batch()
+        self._persist_results(batch)
+        return state
+
+    def run_bot_hands(self, table_id: int, hands: int) -> dict[str, Any]:
+        """Play ``hands`` complete hands on an all-bot table without leaving the engine.
+
+        The table lock is released every ``TRAINING_CHUNK_HANDS`` hands so state reads
+        and other requests are not held up for the whole run.
+        """
+        table = self.tables[table_id]
+        target: int | None = None
+        while True:
+            with table.lock:
+                if len(table.players) != 4 or not self._all_bots(table) or self.tables.get(table_id) is not table:
+                    raise ValueError("Training runs need a full all-bot table")
+                if target is None:
+                    target = table.hands_played + hands
+                chunk_end = min(target, table.hands_played + TRAINING_CHUNK_HANDS)
+                while table.hands_played < chunk_end:
+                    if not table.hand_active:
+                        self._deal_hand(table)
+                    self._play_out_hand(table)
+                state = self._state(table, None) if table.hands_played >= target else None
+                batch = self._take_result_batch()
+            self._persist_results(batch)
+            if state is not None:
+                return state
+
+    def flush_results(self) -> None:
+        batch = self._take_result_batch(force=True)
+        self._persist_results(batch)
 
     def bid(self, player_id: str, amount: int, trump_suit: str) -> dict[str, Any]:
-        with self.lock:
-            table = self.tables[self.user_table[player_id]]
+        table = self._player_table(player_id)
+        with table.lock:
+            self._seat(table, player_id)
             if amount <= table.highest_bid or amount > 29:
                 raise ValueError("Invalid bid")
             if trump_suit not in SUITS:
@@ -136,13 +269,14 @@ class TwentyNineManager:
             table.highest_bid = amount
             table.highest_bidder = player_id
             table.trump_suit = trump_suit
-            table.history.append({"event": "bid", "player_id": player_id, "amount": amount, "trump": trump_suit})
+            self._log(table, {"event": "bid", "player_id": player_id, "amount": amount, "trump": trump_suit})
             self._auto_bid_if_bots(table)
             return self._state(table, player_id)
 
     def play_card(self, player_id: str, card_repr: str) -> dict[str, Any]:
-        with self.lock:
-            table = self.tables[self.user_table[player_id]]
+        table = self._player_table(player_id)
+        with table.lock:
+            self._seat(table, player_id)
             if not table.hand_active:
                 raise ValueError("No active hand")
             current = table.players[table.turn_idx]
@@ -158,23 +292,185 @@ class TwentyNineManager:
                 if any(c.suit == table.lead_suit for c in player.hand):
                     raise ValueError("Must follow lead suit")
 
-            player.hand.remove(card)
-            if not table.lead_suit:
-                table.lead_suit = card.suit
-            table.trick_cards.append((player_id, card))
-            table.history.append({"event": "play", "player_id": player_id, "card": str(card)})
-
-            if len(table.trick_cards) == 4:
-                self._finish_trick(table)
-            else:
-                table.turn_idx = (table.turn_idx + 1) % 4
-
+            player.missed_turns = 0
+            self._play_card_locked(table, player, card)
             self._auto_play_bots(table)
-            return self._state(table, player_id)
-
-    def get_state(self, table_id: int, for_player: str | None = None) -> dict[str, Any]:
-        with self.lock:
-            return self._state(self.tables[table_id], for_player)
+            state = self._state(table, player_id)
+            batch = self._take_result_batch()
+        self._persist_results(batch)
+        return state
+
+    def turn_marker(self, table_id: int) -> tuple[str, int] | None:
+        """Identifies the human turn in progress (player id, version), or None if no human is to act."""
+        table = self.tables[table_id]
+        with table.lock:
+            return self._turn_marker(table)
+
+    def expire_turn(self, table_id: int, marker: tuple[str, int] | None) -> dict[str, Any] | None:
+        """Play the lowest legal card for a human whose turn ``marker`` ran out; None if it has moved on.
+
+        After ``MAX_MISSED_TURNS`` in a row the seat is handed to a bot and the
+        player's seat index entry is freed. If that was the last human, the bots
+        finish the hand in progress and the table is closed.
+        """
+        table = self.tables[table_id]
+        with table.lock:
+            if marker is None or self._turn_marker(table) != marker:
+                return None
+            player = table.players[table.turn_idx]
+            player.missed_turns += 1
+            card = min(self._legal_cards(table, player), key=lambda c: (RANK_POINTS[c.rank], -RANKS.index(c.rank)))
+            self._log(table, {"event": "timeout", "player_id": player.player_id})
+            self._play_card_locked(table, player, card)
+            if player.missed_turns >= MAX_MISSED_TURNS:
+                self._hand_seat_to_bot(table, player)
+            if self._all_bots(table):
+                self._play_out_hand(table)
+                self._drop_table(table)
+            else:
+                self._auto_play_bots(table)
+            state = self._state(table, None)
+            batch = self._take_result_batch()
+        self._persist_results(batch)
+        return state
+
+    def get_state(self, table_id: int, for_player: str | None = None, since_version: int | None = None) -> dict[str, Any]:
+        table = self.tables[table_id]
+        with table.lock:
+            if since_version is None:
+                return self._state(table, for_player)
+            return self._delta(table, for_player, since_version)
+
+    def reap_idle(self, idle_seconds: float, now: float | None = None) -> list[int]:
+        """Drop tables with no activity for ``idle_seconds`` and free their seats and quota."""
+        cutoff = (time.monotonic() if now is None else now) - idle_seconds
+        reaped: list[int] = []
+        for table in self.tables.values():
+            if table.last_activity >= cutoff:
+                continue
+            with table.lock:
+                if table.last_activity >= cutoff or self.tables.get(table.table_id) is not table:
+                    continue
+                self._drop_table(table)
+            reaped.append(table.table_id)
+        return reaped
+
+    def _drop_table(self, table: T29Table) -> None:
+        """Remove ``table`` from the registry and free its seats and quota; caller holds ``table.lock``."""
+        self.tables.pop(table.table_id, None)
+        with self.index_lock:
+            for player in table.players:
+                if self.user_table.get(player.player_id) == table.table_id:
+                    del self.user_table[player.player_id]
+                self.strategies.pop(player.player_id, None)
+            owned = self.owned_tables.get(table.created_by) if table.created_by is not None else None
+            if owned is not None:
+                owned.discard(table.table_id)
+                if not owned:
+                    del self.owned_tables[table.created_by]
+
+    def _player_table(self, player_id: str) -> T29Table:
+        return self.tables[self.user_table[player_id]]
+
+    def _seat(self, table: T29Table, player_id: str) -> T29Player:
+        # The index is read before the table lock; a reap or timeout may have freed the seat since.
+        seat = table.seat_of.get(player_id)
+        if seat is None or table.players[seat].is_bot or self.tables.get(table.table_id) is not table:
+            raise ValueError("Player seat is stale")
+        return table.players[seat]
+
+    def _deal_hand(self, table: T29Table) -> None:
+        table.dealer_idx = (table.dealer_idx + 1) % 4
+        if self.shuffler is not None:
+            table.shuffle = self.shuffler.deal(shuffled_deck)
+            table.deck = list(table.shuffle.deck)
+        else:
+            table.shuffle = None
+            table.deck = shuffled_deck(self.rng)
+        for p in table.players:
+            p.hand = sorted([table.deck.pop() for _ in range(8)], key=lambda c: (SUITS.index(c.suit), RANKS.index(c.rank)))
+        table.hand_active = True
+        table.bids = {}
+        table.highest_bid = 16
+        table.highest_bidder = None
+        table.trump_suit = None
+        table.turn_idx = (table.dealer_idx + 1) % 4
+        table.team_points = {0: 0, 1: 0}
+        table.trick_cards = []
+        table.lead_suit = None
+        table.ready = set()
+        if len(table.history) > HISTORY_LIMIT:
+            table.history_floor = table.history[-HISTORY_LIMIT - 1]["seq"]
+            del table.history[:-HISTORY_LIMIT]
+        table.hand_started_at = datetime.utcnow()
+        start = {"event": "hand_start", "dealer": table.players[table.dealer_idx].player_id, "at": datetime.utcnow().isoformat()}
+        if table.shuffle is not None:
+            start["commitment"] = table.shuffle.commitment
+        self._log(table, start)
+        self._auto_bid_if_bots(table)
+
+    def _touch(self, table: T29Table) -> None:
+        table.version += 1
+        table.last_activity = time.monotonic()
+        table.state_cache.clear()
+
+    def _log(self, table: T29Table, entry: dict[str, Any]) -> None:
+        self._touch(table)
+        entry["seq"] = table.version
+        table.history.append(entry)
+
+    def _turn_marker(self, table: T29Table) -> tuple[str, int] | None:
+        if not table.hand_active or len(table.players) != 4:
+            return None
+        player = table.players[table.turn_idx]
+        if player.is_bot:
+            return None
+        return (player.player_id, table.version)
+
+    def _hand_seat_to_bot(self, table: T29Table, player: T29Player) -> None:
+        player.is_bot = True
+        with self.index_lock:
+            if self.user_table.get(player.player_id) == table.table_id:
+                del self.user_table[player.player_id]
+        self._log(table, {"event": "seat_autoplay", "player_id": player.player_id})
+
+    def _play_card_locked(self, table: T29Table, player: T29Player, card: T29Card) -> None:
+        player.hand.remove(card)
+        if not table.lead_suit:
+            table.lead_suit = card.suit
+        table.trick_cards.append((player.player_id, card))
+        self._log(table, {"event": "play", "player_id": player.player_id, "card": str(card)})
+
+        if len(table.trick_cards) == 4:
+            self._finish_trick(table)
+        else:
+            table.turn_idx = (table.turn_idx + 1) % 4
+
+    def _all_bots(self, table: T29Table) -> bool:
+        return all(p.is_bot for p in table.players)
+
+    def _deal_if_ready(self, table: T29Table) -> bool:
+        """Deal the next hand once every human has marked ready; an all-bot table deals straight away."""
+        if table.hand_active or not self._everyone_ready(table):
+            return False
+        self._deal_hand(table)
+        return True
+
+    def _everyone_ready(self, table: T29Table) -> bool:
+        return len(table.players) == 4 and all(p.is_bot or p.player_id in table.ready for p in table.players)
+
+    def _take_result_batch(self, force: bool = False) -> list[dict[str, Any]]:
+        with self.results_lock:
+            if not self.pending_results or (not force and len(self.pending_results) < self.result_batch_size):
+                return []
+            batch = self.pending_results
+            self.pending_results = []
+            return batch
+
+    def _persist_results(self, batch: list[dict[str, Any]]) -> None:
+        # Called outside the table lock: the sink may block on I/O.
+        if batch and self.result_sink is not None:
+            self.result_sink(batch)
 
     def _parse_card(self, card_repr: str) -> T29Card:
         if len(card_repr) < 2:
@@ -200,57 +496,96 @@ class TwentyNineManager:
             table.trick_cards,
             key=lambda entry: self._card_strength(entry[1], table.lead_suit or "S", table.trump_suit or "S"),
         )
-        winner_seat = next(i for i, p in enumerate(table.players) if p.player_id == winner_pid)
+        winner_seat = table.seat_of[winner_pid]
         points = sum(RANK_POINTS[c.rank] for _, c in table.trick_cards)
         table.team_points[self._team_idx(winner_seat)] += points
         table.won_tricks[winner_pid] += 1
-        table.history.append({"event": "trick_win", "winner": winner_pid, "points": points, "winning_card": str(winner_card)})
+        self._log(table, {"event": "trick_win", "winner": winner_pid, "points": points, "winning_card": str(winner_card)})
 
         table.trick_cards = []
         table.lead_suit = None
         table.turn_idx = winner_seat
 
-        if all(len(p.hand) == 0 for p in table.players):
+        # Every seat plays one card per trick, so one empty hand means all are empty.
+        if not table.players[winner_seat].hand:
             self._finish_hand(table)
 
+    def _reveal(self, table: T29Table) -> dict[str, str]:
+        return {"seed": table.shuffle.reveal} if table.shuffle is not None else {}
+
     def _finish_hand(self, table: T29Table) -> None:
         table.hand_active = False
+        table.hands_played += 1
+        table.match_hands += 1
         if table.highest_bidder is None:
-            table.history.append({"event": "hand_end", "result": "no_bid"})
-            return
+            self._log(table, {"event": "hand_end", "result": "no_bid", **self._reveal(table)})
+        else:
+            bidder_seat = table.seat_of[table.highest_bidder]
+            bidder_team = self._team_idx(bidder_seat)
+            bidder_points = table.team_points[bidder_team]
+            success = bidder_points >= table.highest_bid
+            table.game_score[bidder_team] += 1 if success else -1
+            self._log(
+                table,
+                {
+                    "event": "hand_end",
+                    "bidder": table.highest_bidder,
+                    "bid": table.highest_bid,
+                    "bidder_team_points": bidder_points,
+                    "contract_made": success,
+                    "team_points": [table.team_points[0], table.team_points[1]],
+                    "game_score": list(table.game_score),
+                    **self._reveal(table),
+                }
+            )
+            self._maybe_finish_match(table)
 
-        bidder_seat = next(i for i, p in enumerate(table.players) if p.player_id == table.highest_bidder)
-        bidder_team = self._team_idx(bidder_seat)
-        bidder_points = table.team_points[bidder_team]
-        success = bidder_points >= table.highest_bid
-        table.history.append(
-            {
-                "event": "hand_end",
-                "bidder": table.highest_bidder,
-                "bid": table.highest_bid,
-                "bidder_team_points": bidder_points,
-                "contract_made": success,
-            }
-        )
+        self._deal_if_ready(table)
+
+    def _maybe_finish_match(self, table: T29Table) -> None:
+        score = table.game_score
+        if max(score) < MATCH_POINTS and min(score) > -MATCH_POINTS:
+            return
+        if max(score) >= MATCH_POINTS:
+            winner_team = 0 if score[0] >= MATCH_POINTS else 1
+        else:
+            winner_team = 1 if score[0] <= -MATCH_POINTS else 0
+        result = {
+            "table_id": table.table_id,
+            "match_no": table.match_no,
+            "winner_team": winner_team,
+            "game_score": list(score),
+            "hands": table.match_hands,
+            "finished_at": datetime.utcnow().isoformat(),
+        }
+        with self.results_lock:
+            self.pending_results.append(result)
+        self._log(table, {"event": "match_end", **result})
+        table.game_score = [0, 0]
+        table.match_no += 1
+        table.match_hands = 0
 
     def _auto_bid_if_bots(self, table: T29Table) -> None:
         if not table.hand_active:
             return
-        for p in table.players:
+        # Bidding opens left of the dealer, so the seat order rotates with the deal.
+        for offset in range(1, 5):
+            p = table.players[(table.dealer_idx + offset) % 4]
             if not p.is_bot:
                 continue
-            strength = self._estimate_hand_strength(p.hand)
-            target = min(29, max(table.highest_bid + 1, 16 + int(strength * 13)))
-            if target > table.highest_bid:
-                trump = self._best_trump(p.hand)
+            proposal = self.strategies.get(p.player_id, DEFAULT_STRATEGY).choose_bid(self, table, p)
+            if proposal is None:
+                continue
+            target, trump = proposal
+            if table.highest_bid < target <= 29 and trump in SUITS:
                 table.bids[p.player_id] = target
                 table.highest_bid = target
                 table.highest_bidder = p.player_id
                 table.trump_suit = trump
-                table.history.append({"event": "bot_bid", "player_id": p.player_id, "amount": target, "trump": trump})
+                self._log(table, {"event": "bot_bid", "player_id": p.player_id, "amount": target, "trump": trump})
 
         if table.trump_suit is None:
-            first = table.players[0]
+            first = table.players[(table.dealer_idx + 1) % 4]
             table.highest_bidder = first.player_id
             table.trump_suit = self._best_trump(first.hand)
 
@@ -263,7 +598,8 @@ class TwentyNineManager:
         return max(SUITS, key=lambda s: sum(RANK_POINTS[c.rank] + 0.25 for c in hand if c.suit == s))
 
     def _auto_play_bots(self, table: T29Table) -> None:
-        if not table.hand_active:
+        # All-bot tables are driven by run_bot_hands; chaining hands here would never yield.
+        if not table.hand_active or self._all_bots(table):
             return
         loop = 0
         while table.hand_active and loop < 20:
@@ -271,17 +607,28 @@ class TwentyNineManager:
             player = table.players[table.turn_idx]
             if not player.is_bot:
                 break
-            card = self._elite_choose_card(table, player)
-            player.hand.remove(card)
-            if table.lead_suit is None:
-                table.lead_suit = card.suit
-            table.trick_cards.append((player.player_id, card))
-            table.history.append({"event": "bot_play", "player_id": player.player_id, "card": str(card)})
-
-            if len(table.trick_cards) == 4:
-                self._finish_trick(table)
-            else:
-                table.turn_idx = (table.turn_idx + 1) % 4
+            self._play_bot_turn(table, player)
+
+    def _play_out_hand(self, table: T29Table) -> None:
+        # Stops at the hand boundary: an all-bot table deals its next hand straight away.
+        hand = table.hands_played
+        while table.hand_active and table.hands_played == hand:
+            self._play_bot_turn(table, table.players[table.turn_idx])
+
+    def _play_bot_turn(self, table: T29Table, player: T29Player) -> None:
+        card = self.strategies.get(player.player_id, DEFAULT_STRATEGY).choose_card(self, table, player)
+        if card not in self._legal_cards(table, player):
+            raise ValueError(f"Strategy played illegal card {card}")
+        player.hand.remove(card)
+        if table.lead_suit is None:
+            table.lead_suit = card.suit
+        table.trick_cards.append((player.player_id, card))
+        self._log(table, {"event": "bot_play", "player_id": player.player_id, "card": str(card)})
+
+        if len(table.trick_cards) == 4:
+            self._finish_trick(table)
+        else:
+            table.turn_idx = (table.turn_idx + 1) % 4
 
     def _elite_choose_card(self, table: T29Table, bot: T29Player) -> T29Card:
         legal = self._legal_cards(table, bot)
@@ -316,6 +663,13 @@ class TwentyNineManager:
         return same_suit if same_suit else list(player.hand)
 
     def _state(self, table: T29Table, for_player: str | None) -> dict[str, Any]:
+        """Snapshot for ``for_player``, cached until the next mutation; callers must not modify it."""
+        if for_player is not None and for_player not in table.seat_of:
+            for_player = None
+        cached = table.state_cache.get(for_player)
+        if cached is not None:
+            return cached
+
         players: list[dict[str, Any]] = []
         for p in table.players:
             cards = [str(c) for c in p.hand] if p.player_id == for_player else ["XX"] * len(p.hand)
@@ -329,16 +683,55 @@ class TwentyNineManager:
                 }
             )
 
-        return {
+        state = {
             "table_id": table.table_id,
+            "version": table.version,
             "name": table.name,
             "hand_active": table.hand_active,
             "highest_bid": table.highest_bid,
             "highest_bidder": table.highest_bidder,
             "trump_suit": table.trump_suit,
-            "team_points": table.team_points,
-            "turn_player": table.players[table.turn_idx].player_id if table.players and table.hand_active else None,
+            "team_points": dict(table.team_points),
+            "game_score": list(table.game_score),
+            "match_no": table.match_no,
+            "dealer": table.players[table.dealer_idx].player_id if len(table.players) == 4 else None,
+            "ready": sorted(table.ready),
+            "turn_player": self._turn_player(table),
             "players": players,
             "trick_cards": [{"player_id": pid, "card": str(card)} for pid, card in table.trick_cards],
             "history": table.history[-40:],
         }
+        table.state_cache[for_player] = state
+        return state
+
+    def _delta(self, table: T29Table, for_player: str | None, since_version: int) -> dict[str, Any]:
+        if since_version == table.version:
+            return {"table_id": table.table_id, "version": table.version, "changed": False}
+        if since_version > table.version or since_version < table.history_floor:
+            return self._state(table, for_player)
+
+        events: list[dict[str, Any]] = []
+        for entry in reversed(table.history):
+            if entry["seq"] <= since_version:
+                break
+            if entry["event"] not in DELTA_EVENTS:
+                return self._state(table, for_player)
+            events.append(entry)
+        events.reverse()
+        return {
+            "table_id": table.table_id,
+            "version": table.version,
+            "changed": True,
+            "events": events,
+            "hand_active": table.hand_active,
+            "highest_bid": table.highest_bid,
+            "highest_bidder": table.highest_bidder,
+            "trump_suit": table.trump_suit,
+            "team_points": dict(table.team_points),
+            "game_score": list(table.game_score),
+            "turn_player": self._turn_player(table),
+            "ready": sorted(table.ready),
+        }
+
+    def _turn_player(self, table: T29Table) -> str | None:
+        return table.players[table.turn_idx].player_id if table.players and table.hand_active else None
@@ -1,5 +1,8 @@
-from app.game import GameManager, SeatPlayer, TableState
+import random
+
+from app.game import MAX_MISSED_TURNS, GameManager, SeatPlayer, TableState
 from app.teenpatti import Card
+from app.teenpatti_equity import blind_equity, hand_equity
 
 
 def test_elite_bot_packs_on_clear_loss() -> None:
@@ -17,6 +20,7 @@ def test_elite_bot_packs_on_clear_loss() -> None:
     table.players = [bot, human]
     table.hand_active = True
     table.current_bet = 10
+    manager._reindex(table)
 
     action, _ = manager._bot_decision(table, bot)
     assert action == "pack"
@@ -37,6 +41,81 @@ def test_elite_bot_shows_on_near_certain_win_heads_up() -> None:
     table.players = [bot, human]
     table.hand_active = True
     table.current_bet = 10
+    manager._reindex(table)
 
     action, _ = manager._bot_decision(table, bot)
     assert action in {"show", "raise"}
+
+
+def test_bot_actions_are_deferred_to_step_bot() -> None:
+    # Seeded so the bots play into the human's turn rather than ending the hand first.
+    manager = GameManager(rng=random.Random(1))
+    manager.inline_bots = False
+    manager.seed_tables([{"id": 1, "name": "T", "max_players": 6, "boot_amount": 10, "min_buyin": 100, "max_buyin": 1000}])
+    manager.join_table(1, "u1", "Human", 500)
+    manager.add_bot_players(1, 2)
+    table = manager.tables[1]
+
+    while manager.step_bot(1) is not None:
+        pass
+    assert table.hand_active
+    assert manager._current_player(table).player_id == "u1"
+    seen = len(table.action_log)
+    manager.act("u1", "call")
+    # The human's action returns without playing the bots behind it.
+    assert table.hand_active and manager._current_player(table).is_bot
+    assert all(entry["event"] != "bot_action" for entry in table.action_log[seen:])
+    assert manager.step_bot(1) is not None
+    assert table.action_log[seen + 1]["event"] == "bot_action"
+
+
+def test_expired_turn_packs_and_drops_absent_player_at_next_deal() -> None:
+    manager = GameManager()
+    manager.seed_tables([{"id": 1, "name": "T", "max_players": 6, "boot_amount": 10, "min_buyin": 100, "max_buyin": 1000}])
+    manager.join_table(1, "u1", "A", 500)
+    manager.join_table(1, "u2", "B", 500)
+    manager.join_table(1, "u3", "C", 500)
+    table = manager.tables[1]
+
+    absent = manager._current_player(table)
+    absent.missed_turns = MAX_MISSED_TURNS - 1
+    marker = manager.turn_marker(1)
+    assert marker == (absent.player_id, len(table.action_log))
+
+    manager.expire_turn(1, marker)
+    assert absent.packed
+    assert manager.expire_turn(1, marker) is None
+
+    # Once the remaining two finish the hand, the next deal no longer seats the absent player.
+    manager.act(manager._current_player(table).player_id, "pack")
+    assert absent not in table.players
+    assert absent.player_id not in manager.user_seats
+
+
+def test_equity_table_orders_hands() -> None:
+    trail = [Card("A", "♠"), Card("A", "♥"), Card("A", "♦")]
+    pair = [Card("K", "♠"), Card("K", "♥"), Card("2", "♦")]
+    high = [Card("2", "♠"), Card("4", "♥"), Card("7", "♦")]
+    assert hand_equity(trail, 1) > hand_equity(pair, 1) > hand_equity(high, 1)
+    assert hand_equity(pair, 5) < hand_equity(pair, 1)
+    assert abs(blind_equity(1) - 0.5) < 1e-9
+
+
+def test_bot_decision_ignores_opponent_cards(monkeypatch) -> None:
+    monkeypatch.setattr("app.game.random.random", lambda: 0.99)
+    manager = GameManager()
+    decisions = set()
+    for opp_cards in (
+        [Card("2", "♠"), Card("3", "♥"), Card("5", "♦")],
+        [Card("A", "♠"), Card("A", "♥"), Card("A", "♦")],
+    ):
+        table = TableState(table_id=1, name="T", max_players=6, boot_amount=10, min_buyin=100, max_buyin=1000)
+        bot = SeatPlayer("b1", "Bot", chips=500, is_bot=True, cards=[Card("Q", "♠"), Card("Q", "♥"), Card("9", "♦")])
+        human = SeatPlayer("u1", "Human", chips=500, seen=True, cards=opp_cards)
+        table.players = [bot, human]
+        table.hand_active = True
+        table.current_bet = 10
+        table.pot = 40
+        manager._reindex(table)
+        decisions.add(manager._bot_decision(table, bot))
+    assert len(decisions) == 1
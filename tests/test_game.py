@@ -0,0 +1,223 @@
+import json
+
+import pytest
+
+from app.game import GameManager, SeatPlayer, TableState
+from app.teenpatti import Card
+
+
+def _table(manager: GameManager, *players: SeatPlayer) -> TableState:
+    table = TableState(table_id=1, name="T", max_players=6, boot_amount=10, min_buyin=100, max_buyin=1000)
+    table.players = list(players)
+    table.pot = sum(player.total_bet for player in players)
+    table.hand_active = True
+    table.current_bet = 10
+    manager._reindex(table)
+    return table
+
+
+def test_settle_builds_side_pots_from_contribution_levels() -> None:
+    manager = GameManager()
+    short = SeatPlayer("a", "A", chips=0, all_in=True, total_bet=50, cards=[Card("A", "♠"), Card("A", "♥"), Card("A", "♦")])
+    deep = SeatPlayer("b", "B", chips=100, total_bet=100, cards=[Card("K", "♠"), Card("K", "♥"), Card("K", "♦")])
+    other = SeatPlayer("c", "C", chips=100, total_bet=100, cards=[Card("2", "♠"), Card("4", "♥"), Card("7", "♦")])
+    folded = SeatPlayer("d", "D", chips=100, packed=True, total_bet=80, cards=[Card("Q", "♠"), Card("Q", "♥"), Card("Q", "♦")])
+    table = _table(manager, short, deep, other, folded)
+
+    pots = manager._settle(table, [short, deep, other])
+
+    # Main pot: 50 from each of the four; the side pot holds the rest, the folded player's 30 included.
+    assert pots == [{"amount": 200, "winners": ["a"]}, {"amount": 130, "winners": ["b"]}]
+    assert (short.chips, deep.chips, other.chips, folded.chips) == (200, 230, 100, 100)
+
+
+def test_settle_splits_ties_with_odd_chip_left_of_dealer() -> None:
+    manager = GameManager()
+    first = SeatPlayer("a", "A", chips=0, total_bet=25, cards=[Card("K", "♠"), Card("Q", "♥"), Card("9", "♦")])
+    second = SeatPlayer("b", "B", chips=0, total_bet=20, cards=[Card("K", "♥"), Card("Q", "♦"), Card("9", "♣")])
+    table = _table(manager, first, second)
+    table.dealer_idx = 0
+
+    pots = manager._settle(table, [first, second])
+
+    # 20 each is split evenly; A alone is eligible for its extra 5.
+    assert pots == [{"amount": 40, "winners": ["b", "a"]}, {"amount": 5, "winners": ["a"]}]
+    assert (first.chips, second.chips) == (25, 20)
+
+
+def test_short_stack_call_goes_all_in_and_settles_the_hand() -> None:
+    manager = GameManager()
+    manager.inline_bots = False
+    manager.auto_deal = False
+    manager.seed_tables([{"id": 1, "name": "T", "max_players": 6, "boot_amount": 10, "min_buyin": 15, "max_buyin": 1000}])
+    manager.join_table(1, "u1", "One", 15)
+    manager.join_table(1, "u2", "Two", 500)
+    table = manager.tables[1]
+    short = next(player for player in table.players if player.player_id == "u1")
+    deep = next(player for player in table.players if player.player_id == "u2")
+
+    if manager._current_player(table) is short:
+        manager.act("u1", "see")
+    if manager._current_player(table) is deep:
+        manager.act("u2", "raise", 40)
+    manager.act("u1", "call")
+
+    # The short stack could only put in its last 5 chips; with no one left to bet against the hand is shown down.
+    assert short.total_bet == 15
+    assert not table.hand_active
+    showdown = next(entry for entry in reversed(table.action_log) if entry["event"] == "showdown")
+    assert showdown["pots"][0]["amount"] == 30
+    assert short.chips + deep.chips == 515
+
+
+def test_side_show_packs_the_weaker_of_the_two_hands() -> None:
+    manager = GameManager()
+    first = SeatPlayer("a", "A", chips=500, seen=True, total_bet=10, cards=[Card("K", "♠"), Card("K", "♥"), Card("2", "♦")])
+    second = SeatPlayer("b", "B", chips=500, seen=True, total_bet=10, cards=[Card("Q", "♠"), Card("J", "♥"), Card("9", "♦")])
+    third = SeatPlayer("c", "C", chips=500, total_bet=10, cards=[Card("2", "♠"), Card("4", "♥"), Card("7", "♦")])
+    table = _table(manager, first, second, third)
+    table.turn_idx = 1
+
+    manager._side_show(table, second)
+
+    assert second.packed and not first.packed
+    assert second.chips == 480 and table.pot == 50
+    assert table.action_log[-1] == {"event": "sideshow", "player_id": "b", "target": "a", "loser": "b"}
+
+
+def test_side_show_needs_a_seen_previous_player() -> None:
+    manager = GameManager()
+    first = SeatPlayer("a", "A", chips=500, total_bet=10, cards=[Card("K", "♠"), Card("K", "♥"), Card("2", "♦")])
+    second = SeatPlayer("b", "B", chips=500, seen=True, total_bet=10, cards=[Card("Q", "♠"), Card("J", "♥"), Card("9", "♦")])
+    third = SeatPlayer("c", "C", chips=500, total_bet=10, cards=[Card("2", "♠"), Card("4", "♥"), Card("7", "♦")])
+    table = _table(manager, first, second, third)
+
+    with pytest.raises(ValueError, match="previous player"):
+        manager._side_show(table, second)
+
+
+def test_pot_limit_shows_down_every_live_hand() -> None:
+    manager = GameManager()
+    manager.auto_deal = False
+    players = [
+        SeatPlayer("a", "A", chips=50_000, total_bet=4000, cards=[Card("A", "♠"), Card("A", "♥"), Card("A", "♦")]),
+        SeatPlayer("b", "B", chips=50_000, total_bet=4000, cards=[Card("K", "♠"), Card("K", "♥"), Card("2", "♦")]),
+        SeatPlayer("c", "C", chips=50_000, total_bet=2240, cards=[Card("2", "♠"), Card("4", "♥"), Card("7", "♦")]),
+    ]
+    table = _table(manager, *players)
+
+    manager._maybe_finish_hand(table)
+
+    assert not table.hand_active
+    assert table.action_log[-1]["event"] == "showdown"
+    assert players[0].chips == 50_000 + 10_240
+
+
+def test_inline_bots_stop_after_the_next_deal_on_bot_only_tables() -> None:
+    manager = GameManager()
+    manager.seed_tables([{"id": 1, "name": "T", "max_players": 6, "boot_amount": 10, "min_buyin": 100, "max_buyin": 1000}])
+    manager.add_bot_players(1, 3)
+    table = manager.tables[1]
+    first_hand = table.hand_no
+
+    manager._play_bots_until_human_turn(table)
+
+    assert table.hand_no <= first_hand + 2
+
+
+def test_player_can_sit_at_several_tables_up_to_the_seat_limit() -> None:
+    manager = GameManager()
+    manager.inline_bots = False
+    manager.max_seats_per_user = 2
+    manager.seed_tables(
+        [
+            {"id": table_id, "name": f"T{table_id}", "max_players": 6, "boot_amount": 10, "min_buyin": 100, "max_buyin": 1000}
+            for table_id in (1, 2, 3)
+        ]
+    )
+    for table_id in (1, 2):
+        manager.join_table(table_id, "u1", "One", 200)
+        manager.join_table(table_id, f"u{table_id + 1}", "Other", 200)
+
+    assert manager.seats_of("u1") == {1, 2}
+    # Both buy-ins count against the player's balance, boots in the pot included.
+    assert manager.chips_on_tables("u1") == 400
+    with pytest.raises(ValueError, match="already seated"):
+        manager.join_table(1, "u1", "One", 200)
+    with pytest.raises(ValueError, match="Seat limit"):
+        manager.join_table(3, "u1", "One", 200)
+
+    with pytest.raises(ValueError, match="pass a table id"):
+        manager.act("u1", "pack")
+    with pytest.raises(ValueError, match="not seated at this table"):
+        manager.act("u1", "pack", table_id=3)
+    for table_id in (1, 2):
+        table = manager.tables[table_id]
+        player = manager._current_player(table).player_id
+        manager.act(player, "pack", table_id=table_id)
+        assert any(entry["event"] == "hand_win" for entry in table.action_log)
+
+
+def test_player_joining_mid_hand_sits_it_out() -> None:
+    manager = GameManager()
+    manager.inline_bots = False
+    manager.seed_tables([{"id": 1, "name": "T", "max_players": 6, "boot_amount": 10, "min_buyin": 100, "max_buyin": 1000}])
+    manager.join_table(1, "u1", "One", 200)
+    manager.join_table(1, "u2", "Two", 200)
+    table = manager.tables[1]
+    hand = table.hand_no
+
+    manager.join_table(1, "late", "Late", 200)
+
+    late = table.players[table.seat_of["late"]]
+    assert table.hand_no == hand and late.packed and not late.cards
+    assert table.live_count == 2
+    manager.act(manager._current_player(table).player_id, "pack")
+    assert any(entry["event"] == "hand_win" for entry in table.action_log)
+    # Dealt in from the next hand.
+    assert table.hand_no == hand + 1 and not late.packed and len(late.cards) == 3
+
+
+def test_spectator_frame_is_encoded_once_per_version_and_hides_cards() -> None:
+    manager = GameManager()
+    manager.inline_bots = False
+    manager.seed_tables([{"id": 1, "name": "T", "max_players": 6, "boot_amount": 10, "min_buyin": 100, "max_buyin": 1000}])
+    manager.join_table(1, "u1", "One", 200)
+    manager.join_table(1, "u2", "Two", 200)
+    table = manager.tables[1]
+
+    frame = manager.spectator_frame(1)
+    assert manager.spectator_frame(1) is frame
+    message = json.loads(frame)
+    assert message["type"] == "state" and message["state"]["version"] == table.version
+    assert all(player["cards"] == ["🂠", "🂠", "🂠"] for player in message["state"]["players"])
+
+    manager.act(manager._current_player(table).player_id, "see")
+
+    assert json.loads(manager.spectator_frame(1))["state"]["version"] == table.version > message["state"]["version"]
+
+
+@pytest.mark.parametrize("answer", ["call", "pack"])
+def test_heads_up_all_in_raise_waits_for_the_opponent(answer: str) -> None:
+    manager = GameManager()
+    manager.inline_bots = False
+    manager.auto_deal = False
+    manager.seed_tables([{"id": 1, "name": "T", "max_players": 6, "boot_amount": 10, "min_buyin": 100, "max_buyin": 1000}])
+    manager.join_table(1, "u1", "One", 500)
+    manager.join_table(1, "u2", "Two", 500)
+    table = manager.tables[1]
+    shover = manager._current_player(table)
+    opponent = next(player for player in table.players if player is not shover)
+
+    manager.act(shover.player_id, "raise", 490)
+
+    assert shover.all_in and table.hand_active
+    assert manager._current_player(table) is opponent
+    manager.act(opponent.player_id, answer)
+
+    assert not table.hand_active
+    if answer == "call":
+        assert opponent.total_bet == shover.total_bet == 500
+        assert table.action_log[-1]["event"] == "showdown"
+    else:
+        assert shover.chips == 510 and opponent.chips == 490
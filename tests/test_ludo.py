@@ -1,8 +1,10 @@
 import random
+import threading
 
 import pytest
 
-from app.ludo import MAX_STEPS, LudoManager
+from app.ludo import BOARD_SIZE, MAX_MISSED_TURNS, MAX_STEPS, PATH_MASKS, LudoManager
+from app.ludo_rules import build_variant, compile_rules
 
 
 def _seed_table(manager: LudoManager, name: str = "T") -> int:
@@ -89,6 +91,22 @@ def test_ludo_three_consecutive_sixes_forfeit_turn() -> None:
     assert any(e.get("event") == "turn_forfeit" for e in s3["history"])
 
 
+def test_ludo_turn_forfeit_reports_the_configured_sixes_count(monkeypatch: pytest.MonkeyPatch) -> None:
+    manager = LudoManager()
+    tid = manager.create_table("Two sixes", rules=compile_rules(build_variant(players=2, sixes_forfeit=2)))["table_id"]
+    manager.join_table(tid, "u1", "P1")
+    manager.join_table(tid, "u2", "P2")
+    manager.start_game(tid)
+    monkeypatch.setattr(random, "randint", lambda a, b: 6)
+
+    manager.roll_dice("u1")
+    manager.move_token("u1", 0)
+    state = manager.roll_dice("u1")
+
+    forfeit = next(e for e in state["history"] if e.get("event") == "turn_forfeit")
+    assert forfeit["reason"] == "three_consecutive_sixes" and forfeit["count"] == 2
+
+
 def test_ludo_safe_square_blocks_capture() -> None:
     manager = LudoManager()
     tid = _seed_table(manager, "SafeCapture")
@@ -196,3 +214,269 @@ def test_ludo_extra_turn_can_chain_for_second_capture() -> None:
 
     assert p3.tokens[0].steps == -1
     assert second["turn_player"] == "u1"
+
+
+def test_ludo_tables_lock_independently() -> None:
+    manager = LudoManager()
+    busy = _seed_table(manager, "Busy")
+    free = _seed_table_with_prefix(manager, "v")
+
+    acquired = threading.Event()
+    release = threading.Event()
+
+    def hold_busy_table() -> None:
+        with manager.tables[busy].lock:
+            acquired.set()
+            release.wait(5)
+
+    holder = threading.Thread(target=hold_busy_table)
+    holder.start()
+    try:
+        assert acquired.wait(5)
+        # A roll on another table must not wait for the busy table's lock.
+        state = manager.roll_dice("v1")
+        assert state["table_id"] == free
+    finally:
+        release.set()
+        holder.join()
+
+
+def _seed_table_with_prefix(manager: LudoManager, prefix: str) -> int:
+    tid = manager.create_table(f"{prefix} table")["table_id"]
+    for seat in range(1, 5):
+        manager.join_table(tid, f"{prefix}{seat}", f"{prefix.upper()}{seat}")
+    manager.start_game(tid)
+    return tid
+
+
+def test_ludo_idle_tables_are_reaped_and_seats_freed() -> None:
+    manager = LudoManager()
+    tid = manager.create_table("Idle", owner_id="owner")["table_id"]
+    manager.join_table(tid, "u1", "P1")
+    active = manager.create_table("Active", owner_id="owner")["table_id"]
+
+    manager.tables[tid].last_activity -= 120
+    assert manager.reap_idle(60) == [tid]
+
+    assert tid not in manager.tables
+    assert active in manager.tables
+    assert "u1" not in manager.user_table
+    assert manager.owned_tables["owner"] == {active}
+    assert [t["table_id"] for t in manager.list_tables()] == [active]
+
+
+def test_ludo_table_creation_quota_per_user() -> None:
+    manager = LudoManager()
+    manager.max_tables_per_user = 2
+    manager.create_table("A", owner_id="owner")
+    manager.create_table("B", owner_id="owner")
+
+    with pytest.raises(ValueError, match="creation limit"):
+        manager.create_table("C", owner_id="owner")
+    manager.create_table("D", owner_id="someone-else")
+
+
+def test_ludo_board_index_tracks_every_token_move() -> None:
+    manager = LudoManager()
+    tid = manager.create_table("Index")["table_id"]
+    manager.add_bots(tid, 4)
+    table = manager.tables[tid]
+
+    random.seed(5)
+    for _ in range(30):
+        manager.start_game(tid)
+        expected = [0] * BOARD_SIZE
+        for player in table.players:
+            for token in player.tokens:
+                pos = manager._board_position(player, token)
+                if pos is not None:
+                    expected[pos] += 1
+        assert table.board.counts == expected
+        assert table.board.blockades == {pos for pos, count in enumerate(expected) if count >= 2}
+
+
+def test_ludo_path_masks_cover_traversed_squares() -> None:
+    for color_idx in range(4):
+        start = color_idx * 13
+        # Leaving the yard only checks the start square.
+        assert PATH_MASKS[color_idx][0][6] == 1 << start
+        # A normal move checks every square it crosses, including the destination.
+        assert PATH_MASKS[color_idx][5 + 1][3] == sum(1 << ((start + s) % BOARD_SIZE) for s in (6, 7, 8))
+        # Moves that end in the home lane are never blocked.
+        assert PATH_MASKS[color_idx][49 + 1][4] == 0
+
+
+def test_ludo_bot_turns_are_deferred_to_step_bot() -> None:
+    manager = LudoManager(rng=random.Random(4))
+    manager.inline_bots = False
+    tid = manager.create_table("Deferred")["table_id"]
+    manager.add_bots(tid, 3)
+    manager.join_table(tid, "u1", "P1")
+    manager.start_game(tid)
+
+    table = manager.tables[tid]
+    assert table.rolls == 0
+    assert table.players[table.turn_idx].is_bot
+
+    turns = 0
+    while manager.step_bot(tid) is not None:
+        turns += 1
+    assert turns >= 3
+    assert table.players[table.turn_idx].player_id == "u1"
+    assert manager.step_bot(tid) is None
+
+
+def test_ludo_state_since_version_returns_compact_delta(monkeypatch) -> None:
+    manager = LudoManager()
+    tid = _seed_table(manager)
+    base = manager.get_state(tid, "u1")["version"]
+
+    assert manager.get_state(tid, "u1", since_version=base)["changed"] is False
+
+    monkeypatch.setattr(random, "randint", lambda a, b: 6)
+    manager.roll_dice("u1")
+    delta = manager.get_state(tid, "u1", since_version=base)
+    assert delta["changed"] is True
+    assert [e["event"] for e in delta["events"]] == ["roll"]
+    assert delta["dice_value"] == 6
+    assert delta["movable_tokens"] == [0, 1, 2, 3]
+    assert "players" not in delta
+
+    manager.move_token("u1", 0)
+    delta = manager.get_state(tid, "u2", since_version=base)
+    assert [e["event"] for e in delta["events"]] == ["roll", "move"]
+    assert delta["movable_tokens"] == []
+
+    # A join (or anything else outside DELTA_EVENTS) forces a full resync.
+    assert "players" in manager.get_state(tid, "u1", since_version=0)
+
+
+def test_ludo_state_shares_derived_fields_per_version(monkeypatch) -> None:
+    manager = LudoManager()
+    tid = _seed_table(manager)
+    monkeypatch.setattr(random, "randint", lambda a, b: 6)
+    manager.roll_dice("u1")
+
+    mover = manager.get_state(tid, "u1")
+    watcher = manager.get_state(tid, "u2")
+    assert mover["players"] is watcher["players"]
+    assert mover["movable_tokens"] == [0, 1, 2, 3]
+    assert watcher["movable_tokens"] == []
+
+    manager.move_token("u1", 0)
+    after = manager.get_state(tid, "u2")
+    assert after["players"] is not watcher["players"]
+    assert after["players"][0]["tokens"][0]["board_position"] == 0
+
+
+def test_ludo_history_cursor_sends_only_new_entries(monkeypatch) -> None:
+    manager = LudoManager()
+    tid = _seed_table(manager)
+    first = manager.get_state(tid, "u1")
+    cursor = first["history_cursor"]
+    assert first["history"][-1]["seq"] == cursor
+
+    monkeypatch.setattr(random, "randint", lambda a, b: 6)
+    manager.roll_dice("u1")
+    manager.move_token("u1", 0)
+
+    state = manager.get_state(tid, "u1", history_after=cursor)
+    assert [e["event"] for e in state["history"]] == ["roll", "move"]
+    assert manager.get_state(tid, "u1", history_after=state["history_cursor"])["history"] == []
+
+
+def test_ludo_two_player_quick_variant_starts_tokens_out() -> None:
+    manager = LudoManager()
+    rules = compile_rules(build_variant("quick", players=2))
+    tid = manager.create_table("Quick", rules=rules)["table_id"]
+    manager.join_table(tid, "u1", "P1")
+    manager.join_table(tid, "u2", "P2")
+    with pytest.raises(ValueError, match="supports exactly 2"):
+        manager.join_table(tid, "u3", "P3")
+
+    state = manager.start_game(tid)
+    assert [p["color"] for p in state["players"]] == ["red", "yellow"]
+    assert all(t["steps"] == 0 for p in state["players"] for t in p["tokens"])
+    assert state["rules"]["variant"] == "quick"
+    assert compile_rules(build_variant("quick", players=2)) is rules
+
+
+def test_ludo_no_blockade_variant_lets_tokens_pass_and_capture_stacks() -> None:
+    manager = LudoManager()
+    rules = compile_rules(build_variant("no_blockade"))
+    tid = manager.create_table("Open", rules=rules)["table_id"]
+    for seat in range(1, 5):
+        manager.join_table(tid, f"u{seat}", f"P{seat}")
+    manager.start_game(tid)
+    table_obj = manager.tables[tid]
+    p1, p2 = table_obj.players[0], table_obj.players[1]
+
+    p1.tokens[0].steps = 9
+    p1.tokens[1].steps = 9
+    p2.tokens[0].steps = 45  # board position 6; the stack on 9 is not a blockade here
+    table_obj.turn_idx = 1
+    table_obj.dice_value = 3
+    table_obj.pending_move = True
+
+    manager.move_token("u2", 0)
+    assert p1.tokens[0].steps == -1 and p1.tokens[1].steps == -1
+
+
+def test_ludo_quick_variant_start_stacks_are_not_blockades() -> None:
+    manager = LudoManager()
+    tid = manager.create_table("Quick", rules=compile_rules(build_variant("quick", players=2)))["table_id"]
+    manager.join_table(tid, "u1", "P1")
+    manager.join_table(tid, "u2", "P2")
+    manager.start_game(tid)
+    table_obj = manager.tables[tid]
+    red = table_obj.players[0]
+
+    # Yellow's four tokens all start on square 26; red at step 24 may still pass it.
+    red.tokens[0].steps = 24
+    state = manager.get_state(tid, "u1")
+    assert 26 not in state["blockades"]
+    assert red.tokens[0] in manager._movable_tokens(table_obj, red, 4)
+
+
+def test_ludo_classic_start_stacks_still_block() -> None:
+    manager = LudoManager()
+    tid = _seed_table(manager, "Classic")
+    table_obj = manager.tables[tid]
+    red, green = table_obj.players[0], table_obj.players[1]
+
+    green.tokens[0].steps = 0
+    green.tokens[1].steps = 0
+    red.tokens[0].steps = 11
+    assert 13 in manager.get_state(tid, "u1")["blockades"]
+    assert red.tokens[0] not in manager._movable_tokens(table_obj, red, 4)
+
+
+def test_ludo_variant_config_is_validated() -> None:
+    with pytest.raises(ValueError, match="2 to 4"):
+        compile_rules(build_variant(players=5))
+    with pytest.raises(ValueError, match="shared track"):
+        compile_rules(build_variant(safe_squares=[60]))
+    with pytest.raises(ValueError, match="Unknown"):
+        build_variant("chaos")
+
+
+def test_ludo_expired_turn_auto_plays_and_hands_seat_to_bot() -> None:
+    manager = LudoManager(rng=random.Random(7))
+    manager.inline_bots = False
+    tid = _seed_table(manager, "Timer")
+    table = manager.tables[tid]
+    human = table.players[0]
+
+    marker = manager.turn_marker(tid)
+    assert marker == ("u1", table.version)
+    manager.expire_turn(tid, marker)
+    assert table.rolls == 1
+    assert human.missed_turns == 1
+    assert manager.expire_turn(tid, marker) is None
+
+    human.missed_turns = MAX_MISSED_TURNS - 1
+    while table.players[table.turn_idx] is not human:
+        manager.expire_turn(tid, manager.turn_marker(tid))
+    manager.expire_turn(tid, manager.turn_marker(tid))
+    assert human.is_bot
+    assert "u1" not in manager.user_table
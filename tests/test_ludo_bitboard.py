@@ -0,0 +1,97 @@
+import random
+
+import pytest
+
+from app import ludo_bitboard as bb
+from app.ludo import LudoManager
+from app.ludo_rules import CLASSIC, LudoRules, build_variant, compile_rules
+
+
+def _table(manager: LudoManager, rules: LudoRules = CLASSIC) -> int:
+    tid = manager.create_table("Bitboard", rules=rules)["table_id"]
+    for seat in range(1, rules.seats + 1):
+        manager.join_table(tid, f"u{seat}", f"P{seat}")
+    manager.start_game(tid)
+    return tid
+
+
+def _assert_same(pos: bb.LudoPosition, other: bb.LudoPosition) -> None:
+    assert list(pos.steps) == list(other.steps)
+    assert pos.counts == other.counts
+    assert pos.blockade_mask == other.blockade_mask
+    assert (pos.turn, pos.consecutive_sixes, pos.active, pos.winners) == (
+        other.turn,
+        other.consecutive_sixes,
+        other.active,
+        other.winners,
+    )
+
+
+@pytest.mark.parametrize(
+    "rules",
+    [
+        CLASSIC,
+        compile_rules(build_variant("quick", players=2)),
+        compile_rules(build_variant("no_blockade", players=3, safe_squares=[0, 13, 26], sixes_forfeit=0)),
+    ],
+    ids=["classic", "quick-2p", "no-blockade-3p"],
+)
+def test_bitboard_matches_manager_rules_over_random_games(rules: LudoRules, monkeypatch: pytest.MonkeyPatch) -> None:
+    rng = random.Random(21)
+    manager = LudoManager()
+    tid = _table(manager, rules)
+    table = manager.tables[tid]
+    pos = bb.from_table(table)
+    dice = 0
+    monkeypatch.setattr(random, "randint", lambda a, b: dice)
+
+    for _ in range(1500):
+        if not table.hand_active:
+            break
+        player_id = table.players[table.turn_idx].player_id
+        dice = rng.randint(1, 6)
+        state = manager.roll_dice(player_id)
+
+        tokens, _ = bb.roll(pos, dice)
+        assert tokens == state["movable_tokens"]
+        if tokens:
+            token = rng.choice(tokens)
+            manager.move_token(player_id, token)
+            bb.move(pos, token, dice)
+        _assert_same(pos, bb.from_table(table))
+
+
+def test_bitboard_undo_restores_position() -> None:
+    rng = random.Random(4)
+    pos = bb.from_steps((0, 1, 2, 3), [-1] * 16)
+    for _ in range(400):
+        if not pos.active:
+            break
+        before = pos.copy()
+        dice = rng.randint(1, 6)
+        tokens, roll_undo = bb.roll(pos, dice)
+        if tokens:
+            move_undo = bb.move(pos, rng.choice(tokens), dice)
+            after = pos.copy()
+            bb.undo(pos, move_undo)
+            bb.undo(pos, roll_undo)
+            _assert_same(pos, before)
+            pos = after
+
+
+def test_manager_round_trips_positions() -> None:
+    manager = LudoManager()
+    tid = _table(manager)
+    table = manager.tables[tid]
+    table.players[0].tokens[0].steps = 8
+    table.players[0].tokens[1].steps = 8
+
+    pos = manager.export_position(tid)
+    assert pos.blockade_mask == 1 << 8
+
+    pos.steps[4] = 20  # green token 0
+    pos.turn = 2
+    state = manager.import_position(tid, pos)
+    assert state["turn_player"] == "u3"
+    assert table.players[1].tokens[0].steps == 20
+    assert table.board.counts[(13 + 20) % 52] == 1
@@ -0,0 +1,57 @@
+import time
+
+import pytest
+
+from app import ludo_bitboard as bb
+from app.ludo import LudoManager
+from app.ludo_search import LudoSearchBot, evaluate
+
+
+def test_search_respects_time_budget_and_returns_legal_token() -> None:
+    pos = bb.from_steps((0, 1, 2, 3), [5, 20, 33, 40] + [3, 9, -1, -1] + [14, -1, -1, -1] + [30, 31, -1, -1])
+    bot = LudoSearchBot(budget_ms=20, max_depth=8)
+    tokens = bb.movable(pos, 4)
+
+    started = time.perf_counter()
+    choice = bot.choose(pos, 4, tokens)
+    # The budget is per decision: the deadline is checked at every node, so overrun stays small.
+    assert time.perf_counter() - started < 0.020 + 0.010
+    assert choice in tokens
+    assert bot.cache
+
+
+def test_search_prefers_safe_square_over_exposed_progress() -> None:
+    # Red can move token 0 (square 3) onto safe square 8, or token 1 (square 30) to 35,
+    # two squares in front of a green token on 33. The progress heuristic ranks token 1 first.
+    steps = [3, 30, -1, -1] + [20, -1, -1, -1] + [-1] * 8
+    pos = bb.from_steps((0, 1, 2, 3), steps)
+    exposed = bb.from_steps((0, 1, 2, 3), [3, 35, -1, -1] + steps[4:])
+    safe = bb.from_steps((0, 1, 2, 3), [8, 30, -1, -1] + steps[4:])
+    assert evaluate(safe, 0) > evaluate(exposed, 0)
+
+    bot = LudoSearchBot(budget_ms=500, max_depth=2)
+    assert bot.choose(pos, 5, [1, 0]) == 0
+
+
+def test_expert_tables_use_search() -> None:
+    manager = LudoManager()
+    tid = manager.create_table("Expert", bot_level="expert")["table_id"]
+    manager.add_bots(tid, 4)
+    calls: list[int] = []
+    manager.search_bot = LudoSearchBot(budget_ms=2, max_depth=2)
+    original = manager.search_bot.choose
+
+    def spy(pos: bb.LudoPosition, dice: int, tokens: list[int]) -> int:
+        calls.append(dice)
+        return original(pos, dice, tokens)
+
+    manager.search_bot.choose = spy  # type: ignore[method-assign]
+    state = manager.start_game(tid)
+
+    assert state["bot_level"] == "expert"
+    assert calls
+
+
+def test_unknown_bot_level_is_rejected() -> None:
+    with pytest.raises(ValueError, match="bot level"):
+        LudoManager().create_table("Bad", bot_level="godlike")
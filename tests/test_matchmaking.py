@@ -0,0 +1,63 @@
+import pytest
+
+from app.game import GameManager
+from app.matchmaking import Matchmaker
+
+
+def _manager(*tables: tuple[int, int, int]) -> GameManager:
+    manager = GameManager()
+    manager.inline_bots = False
+    manager.seed_tables(
+        [
+            {"id": table_id, "name": f"T{table_id}", "max_players": max_players, "boot_amount": boot, "min_buyin": 100, "max_buyin": 1000}
+            for table_id, boot, max_players in tables
+        ]
+    )
+    return manager
+
+
+def test_join_any_fills_the_fullest_table_in_the_tier() -> None:
+    manager = _manager((1, 10, 3), (2, 10, 3), (3, 50, 3))
+    matchmaker = Matchmaker(manager)
+    manager.join_table(2, "seated", "Seated", 200)
+
+    state = matchmaker.join_any(10, "p1", "P1", 200)
+
+    assert state["table_id"] == 2
+
+
+def test_join_any_skips_full_tables_and_stays_in_tier() -> None:
+    manager = _manager((1, 10, 2), (2, 10, 2), (3, 50, 2))
+    matchmaker = Matchmaker(manager)
+
+    placed = [matchmaker.join_any(10, f"p{i}", f"P{i}", 200)["table_id"] for i in range(4)]
+
+    assert sorted(placed) == [1, 1, 2, 2]
+    assert not manager.tables[3].players
+    with pytest.raises(ValueError, match="No open seat"):
+        matchmaker.join_any(10, "late", "Late", 200)
+    with pytest.raises(ValueError, match="Unknown stake tier"):
+        matchmaker.join_any(25, "late", "Late", 200)
+
+
+def test_consolidate_moves_a_lone_player_to_an_occupied_table() -> None:
+    manager = _manager((1, 10, 6), (2, 10, 6), (3, 10, 6))
+    matchmaker = Matchmaker(manager)
+    manager.join_table(1, "alone", "Alone", 200)
+
+    # Nowhere to go: the other tables in the tier are empty.
+    assert matchmaker.consolidate() == []
+
+    manager.join_table(3, "host", "Host", 200)
+    manager.join_table(3, "guest", "Guest", 200)
+    table = manager.tables[3]
+    table.hand_active = False  # between hands
+
+    moves = matchmaker.consolidate()
+
+    assert moves == [{"player_id": "alone", "from_table": 1, "to_table": 3}]
+    assert not manager.tables[1].players
+    assert [player.player_id for player in table.players] == ["host", "guest", "alone"]
+    assert matchmaker.tiers() == [
+        {"boot_amount": 10, "tables": 3, "seated": 3, "open_seats": 15, "min_buyin": 100, "max_buyin": 1000}
+    ]
@@ -0,0 +1,20 @@
+from app.seats import at_most_one, iter_seats, next_seat, prev_seat
+
+
+def test_next_seat_wraps_and_keeps_a_lone_seat() -> None:
+    assert next_seat(0b1011, 1) == 3
+    assert next_seat(0b1011, 3) == 0
+    assert next_seat(0b0100, 2) == 2
+    assert next_seat(0, 0) == -1
+
+
+def test_prev_seat_skips_the_asking_seat() -> None:
+    assert prev_seat(0b1011, 0) == 3
+    assert prev_seat(0b1011, 3) == 1
+    assert prev_seat(0b1000, 3) == -1
+
+
+def test_mask_iteration_and_counting() -> None:
+    assert list(iter_seats(0b101001)) == [0, 3, 5]
+    assert at_most_one(0) and at_most_one(0b100)
+    assert not at_most_one(0b101)
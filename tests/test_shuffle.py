@@ -0,0 +1,74 @@
+import time
+
+from app.game import GameManager
+from app.ludo import LudoManager
+from app.shuffle import ShuffleService, commitment_for, replay, stream_for, verify
+from app.teenpatti import shuffled_deck
+from app.twentynine import TwentyNineManager, shuffled_deck as shuffled_t29_deck
+
+
+def test_commitment_and_replay_reproduce_the_deal() -> None:
+    service = ShuffleService(pool_size=0)
+    shuffle = service.deal(shuffled_deck)
+
+    assert shuffle.commitment == commitment_for(shuffle.seed)
+    assert verify(shuffle.reveal, shuffle.commitment)
+    assert not verify(bytes(32).hex(), shuffle.commitment)
+    assert replay(shuffled_deck, shuffle.reveal) == shuffle.deck
+    assert sorted(map(str, shuffle.deck)) == sorted(map(str, shuffled_deck(stream_for(bytes(32)))))
+
+
+def test_pool_is_pregenerated_in_the_background() -> None:
+    service = ShuffleService(pool_size=8)
+    service.prefill(shuffled_t29_deck)
+    deadline = time.monotonic() + 5
+    while service.pooled(shuffled_t29_deck) < 8 and time.monotonic() < deadline:
+        time.sleep(0.01)
+    assert service.pooled(shuffled_t29_deck) == 8
+
+    seeds = {service.deal(shuffled_t29_deck).seed for _ in range(8)}
+    service.shutdown()
+    assert len(seeds) == 8
+
+
+def test_teenpatti_hand_log_commits_then_reveals_the_seed() -> None:
+    manager = GameManager()
+    manager.shuffler = ShuffleService(pool_size=0)
+    manager.seed_tables([{"id": 1, "name": "T", "max_players": 6, "boot_amount": 10, "min_buyin": 100, "max_buyin": 1000}])
+    manager.join_table(1, "u1", "One", 500)
+    manager.join_table(1, "u2", "Two", 500)
+    table = manager.tables[1]
+    start = next(entry for entry in table.action_log if entry["event"] == "hand_start")
+    dealt = {player.player_id: list(player.cards) for player in table.players}
+
+    manager.act(manager._current_player(table).player_id, "pack")
+
+    end = next(entry for entry in table.action_log if entry["event"] == "hand_win")
+    assert verify(end["seed"], start["commitment"])
+    deck = replay(shuffled_deck, end["seed"])
+    # Cards are dealt three at a time from the end of the deck, in seat order.
+    assert dealt["u1"] == [deck[-1], deck[-2], deck[-3]]
+    assert dealt["u2"] == [deck[-4], deck[-5], deck[-6]]
+
+
+def test_twentynine_and_ludo_commit_their_streams() -> None:
+    service = ShuffleService(pool_size=0)
+    t29 = TwentyNineManager()
+    t29.shuffler = service
+    table_id = t29.create_table("T")["table_id"]
+    t29.add_bots(table_id, 4)
+    t29.start_hand(table_id)
+    t29_table = t29.tables[table_id]
+    # The all-bot hand is played out and the next one dealt; its commitment is the live one.
+    start = next(entry for entry in reversed(t29_table.history) if entry["event"] == "hand_start")
+    assert start["commitment"] == t29_table.shuffle.commitment
+
+    ludo = LudoManager()
+    ludo.shuffler = service
+    ludo_id = ludo.create_table("L")["table_id"]
+    ludo.add_bots(ludo_id, 4)
+    ludo.start_game(ludo_id)
+    ludo.play_out(ludo_id)
+    history = ludo.tables[ludo_id].history
+    end = next(entry for entry in reversed(history) if entry["event"] == "game_end")
+    assert verify(end["seed"], ludo.tables[ludo_id].dice_seed.commitment)
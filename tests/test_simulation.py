@@ -0,0 +1,76 @@
+from app.simulation.ludo import RandomStrategy as LudoRandomStrategy, StandardStrategy, run_tournament
+from app.simulation.teenpatti import (
+    CallingStrategy,
+    EquityStrategy,
+    RandomStrategy as TeenPattiRandomStrategy,
+    run_simulation as run_teenpatti_simulation,
+)
+from app.simulation.twentynine import RandomStrategy, run_simulation
+from app.twentynine import EliteStrategy
+
+
+def test_twentynine_simulation_is_reproducible_with_seed() -> None:
+    first = run_simulation(EliteStrategy(), RandomStrategy(), hands=40, seed=11)
+    second = run_simulation(EliteStrategy(), RandomStrategy(), hands=40, seed=11)
+
+    assert first.as_dict()["teams"] == second.as_dict()["teams"]
+    assert first.teams["elite"].hands == 40
+    # Every hand awards all 28 card points to one of the two teams.
+    assert first.teams["elite"].points + first.teams["random"].points == 40 * 28
+
+
+def test_twentynine_simulation_splits_work_across_processes() -> None:
+    report = run_simulation(EliteStrategy(), EliteStrategy(), hands=20, seed=3, workers=2)
+
+    assert report.hands == 20
+    assert set(report.teams) == {"elite:A", "elite:B"}
+    assert sum(stats.contracts for stats in report.teams.values()) == 20
+
+
+def test_twentynine_self_play_shares_contracts_and_makes_a_fair_share() -> None:
+    report = run_simulation(EliteStrategy(), EliteStrategy(), hands=400, seed=7)
+
+    for stats in report.teams.values():
+        assert stats.contracts > 100
+        assert 0.25 < stats.contracts_made / stats.contracts < 0.75
+
+
+def test_ludo_tournament_is_reproducible_with_seed() -> None:
+    lineup = [StandardStrategy(), LudoRandomStrategy(), LudoRandomStrategy(), LudoRandomStrategy()]
+    first = run_tournament(lineup, games=12, seed=5)
+    second = run_tournament(lineup, games=12, seed=5)
+
+    assert first.seat_wins == second.seat_wins
+    assert (first.rolls, first.captures) == (second.rolls, second.captures)
+    assert sum(first.seat_wins) == 12
+    assert set(first.strategy_games) == {"standard", "random:1", "random:2", "random:3"}
+    assert first.rolls > 0
+
+
+def test_ludo_tournament_splits_work_across_processes() -> None:
+    report = run_tournament([StandardStrategy() for _ in range(4)], games=8, seed=2, workers=2)
+
+    assert report.games == 8
+    assert sum(report.strategy_wins.values()) == 8
+    assert all(count == 8 for count in report.strategy_games.values())
+
+
+def test_teenpatti_simulation_is_reproducible_and_zero_sum() -> None:
+    lineup = [EquityStrategy(), CallingStrategy(), TeenPattiRandomStrategy()]
+    first = run_teenpatti_simulation(lineup, hands=200, seed=4)
+    second = run_teenpatti_simulation(lineup, hands=200, seed=4)
+
+    assert first.as_dict()["policies"] == second.as_dict()["policies"]
+    assert first.showdowns == second.showdowns
+    assert sum(stats.net_chips for stats in first.policies.values()) == 0
+    # Every hand has a winner; split pots credit each player who shares them.
+    assert sum(stats.wins for stats in first.policies.values()) >= 200
+    assert sum(first.categories.values()) == 200 * 3
+
+
+def test_teenpatti_simulation_splits_work_across_processes() -> None:
+    report = run_teenpatti_simulation([EquityStrategy(), EquityStrategy()], hands=20, seed=2, workers=2)
+
+    assert report.hands == 20
+    assert set(report.policies) == {"equity:0", "equity:1"}
+    assert all(stats.hands == 20 for stats in report.policies.values())
@@ -1,7 +1,7 @@
 import pytest
 
 from app.game import GameManager
-from app.teenpatti import Card, compare_hands, evaluate_hand
+from app.teenpatti import Card, compare_hands, evaluate_hand, rank_hands
 
 
 def test_trail_beats_sequence() -> None:
@@ -40,11 +40,26 @@ def test_show_action_rejects_when_not_two_active_players() -> None:
     manager.seed_tables([
         {"id": 1, "name": "T1", "max_players": 6, "boot_amount": 10, "min_buyin": 100, "max_buyin": 1000}
     ])
+    # Seat all three before the deal: a player joining mid-hand sits it out.
+    manager.set_paused(1, True)
     manager.join_table(1, "u1", "U1", 200)
     manager.join_table(1, "u2", "U2", 200)
     manager.join_table(1, "u3", "U3", 200)
+    manager.set_paused(1, False)
 
     state = manager.get_table_state(1, "u1")
     current_player = state["current_player"]
     with pytest.raises(ValueError):
         manager.act(current_player, "show")
+
+
+def test_rank_hands_groups_ties_strongest_first() -> None:
+    tiers = rank_hands(
+        {
+            "a": [Card("K", "♠"), Card("Q", "♥"), Card("9", "♦")],
+            "b": [Card("A", "♠"), Card("A", "♥"), Card("A", "♦")],
+            "c": [Card("K", "♥"), Card("Q", "♦"), Card("9", "♣")],
+        }
+    )
+    assert tiers[0] == ["b"]
+    assert sorted(tiers[1]) == ["a", "c"]
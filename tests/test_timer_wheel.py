@@ -0,0 +1,34 @@
+from app.timer_wheel import TimerWheel
+
+
+def test_timer_wheel_fires_in_deadline_order() -> None:
+    wheel: TimerWheel[str] = TimerWheel(tick_seconds=1.0, slots=8)
+    wheel.schedule("late", 5, now=0)
+    wheel.schedule("early", 2, now=0)
+
+    assert wheel.advance(1) == []
+    assert wheel.advance(2) == ["early"]
+    assert wheel.advance(10) == ["late"]
+    assert len(wheel) == 0
+
+
+def test_timer_wheel_rearm_and_cancel_drop_stale_deadlines() -> None:
+    wheel: TimerWheel[int] = TimerWheel(tick_seconds=1.0, slots=8)
+    wheel.schedule(1, 2, now=0)
+    wheel.schedule(1, 4, now=1)
+    wheel.schedule(2, 3, now=0)
+    wheel.cancel(2)
+
+    assert wheel.advance(3) == []
+    assert wheel.advance(5) == [1]
+    assert 1 not in wheel
+
+
+def test_timer_wheel_carries_deadlines_beyond_one_revolution() -> None:
+    wheel: TimerWheel[str] = TimerWheel(tick_seconds=1.0, slots=4)
+    wheel.schedule("far", 9, now=0)
+    wheel.schedule("near", 1, now=0)
+
+    assert wheel.advance(5) == ["near"]
+    assert wheel.advance(8) == []
+    assert wheel.advance(9) == ["far"]
@@ -0,0 +1,69 @@
+import random
+
+from app.game import GameManager
+from app.simulation.tournament import run_tournament
+from app.tournament import BlindLevel, TournamentBlueprint, TournamentDirector
+
+
+def _director(**blueprint: object) -> tuple[GameManager, TournamentDirector, int]:
+    manager = GameManager(rng=random.Random(3))
+    manager.inline_bots = False
+    director = TournamentDirector(manager, rng=random.Random(4))
+    tournament_id = director.create(TournamentBlueprint(name="Cup", **blueprint))["tournament_id"]
+    return manager, director, tournament_id
+
+
+def test_sit_and_go_starts_when_full_and_raises_the_boot_on_schedule() -> None:
+    levels = (BlindLevel(10, 60), BlindLevel(25, 60))
+    manager, director, tournament_id = _director(max_entrants=3, levels=levels)
+    director.register(tournament_id, "u1", "One")
+    director.add_bots(tournament_id, 5)
+
+    (table_id,) = director.tick(now=0.0)
+
+    table = manager.tables[table_id]
+    assert table.tournament_id == tournament_id and table.hand_active
+    assert sorted(player.player_id for player in table.players)[-1] == "u1"
+    assert table_id not in {row["table_id"] for row in manager.list_tables()}
+    assert director.tick(now=59.0) == set()
+    assert director.tick(now=60.0) >= {table_id}
+    assert table.boot_amount == 25
+    assert director.state(tournament_id)["level"] == 2
+
+
+def test_plan_breaks_surplus_tables_then_evens_out_the_rest() -> None:
+    _, director, _ = _director()
+
+    # Nine players fit on two six-seat tables: the shortest table breaks and its player evens out the rest.
+    assert director._plan_moves({1: 5, 2: 1, 3: 3}, remaining=9, seats=6) == {2: 1}
+    assert director._plan_moves({1: 6, 2: 1, 3: 2}, remaining=9, seats=6) == {2: 1, 1: 1}
+
+    assert director._plan_moves({1: 6, 2: 2}, remaining=8, seats=6) == {1: 2}
+    assert director._plan_moves({1: 4, 2: 3}, remaining=7, seats=6) == {}
+
+
+def test_multi_table_tournament_plays_down_to_one_winner() -> None:
+    report = run_tournament(40, seed=5)
+
+    assert report["finished"]
+    assert report["peak_tables"] == 7
+
+
+def test_standings_rank_live_stacks_then_busted_players() -> None:
+    manager, director, tournament_id = _director(max_entrants=4, starting_stack=100)
+    director.add_bots(tournament_id, 4)
+    director.tick(now=0.0)
+
+    for tick in range(1, 2000):
+        for table_id in list(director.tournaments[tournament_id].table_ids):
+            while manager.step_bot(table_id) is not None:
+                pass
+        director.tick(now=float(tick))
+        if director.tournaments[tournament_id].status == "finished":
+            break
+
+    standings = director.standings(tournament_id)
+    assert [row["place"] for row in standings] == [1, 2, 3, 4]
+    assert standings[0]["chips"] == 400 and director.state(tournament_id)["status"] == "finished"
+    assert not director.tournaments[tournament_id].table_ids
+    assert all(not manager.seats_of(row["player_id"]) for row in standings)
@@ -1,4 +1,17 @@
-from app.twentynine import T29Card, T29Player, T29Table, TwentyNineManager
+import random
+
+import pytest
+
+from app.twentynine import (
+    MAX_MISSED_TURNS,
+    RANK_POINTS,
+    RANKS,
+    TRAINING_CHUNK_HANDS,
+    T29Card,
+    T29Player,
+    T29Table,
+    TwentyNineManager,
+)
 
 
 def test_twentynine_create_join_and_start() -> None:
@@ -49,3 +62,197 @@ def test_elite_bot_prefers_winning_card_when_possible() -> None:
 
     card = manager._elite_choose_card(table, bot)
     assert card == T29Card("J", "H")
+
+
+def _bot_table(manager: TwentyNineManager) -> int:
+    tid = manager.create_table("Training")["table_id"]
+    manager.add_bots(tid, 4)
+    return tid
+
+
+def test_bot_table_runs_hands_and_rotates_dealer() -> None:
+    manager = TwentyNineManager()
+    tid = _bot_table(manager)
+
+    state = manager.run_bot_hands(tid, 3)
+    table = manager.tables[tid]
+
+    assert table.hands_played == 3
+    # The next hand is dealt automatically on an all-bot table.
+    assert state["hand_active"] is True
+    assert table.dealer_idx == 3
+    assert state["turn_player"] == table.players[0].player_id
+
+
+def test_start_on_all_bot_table_plays_one_hand_and_training_spans_chunks() -> None:
+    manager = TwentyNineManager()
+    tid = _bot_table(manager)
+    table = manager.tables[tid]
+
+    manager.start_hand(tid)
+    assert table.hands_played == 1 and table.hand_active
+
+    manager.run_bot_hands(tid, TRAINING_CHUNK_HANDS * 2 + 3)
+    assert table.hands_played == TRAINING_CHUNK_HANDS * 2 + 4
+
+
+def test_contract_goes_to_different_seats_as_the_deal_rotates() -> None:
+    manager = TwentyNineManager(rng=random.Random(5))
+    tid = _bot_table(manager)
+    table = manager.tables[tid]
+
+    bidders = []
+    for _ in range(12):
+        manager.run_bot_hands(tid, 1)
+        bidders.append(next(e for e in reversed(table.history) if e["event"] == "hand_end")["bidder"])
+
+    seats = {table.seat_of[bidder] for bidder in bidders}
+    assert len(seats) >= 3
+    assert {seat % 2 for seat in seats} == {0, 1}
+
+
+def test_match_results_are_flushed_in_batches() -> None:
+    manager = TwentyNineManager()
+    batches: list[list[dict]] = []
+    manager.result_sink = batches.append
+    manager.result_batch_size = 3
+    tid = _bot_table(manager)
+
+    manager.run_bot_hands(tid, 200)
+    assert batches
+    assert all(len(batch) >= 3 for batch in batches)
+    assert all(max(r["game_score"]) >= 6 or min(r["game_score"]) <= -6 for b in batches for r in b)
+
+    manager.flush_results()
+    assert not manager.pending_results
+
+
+def test_next_hand_waits_until_humans_are_ready() -> None:
+    manager = TwentyNineManager()
+    tid = manager.create_table("Ready")["table_id"]
+    manager.join_table(tid, "u1", "U1")
+    manager.add_bots(tid, 3)
+    table = manager.tables[tid]
+    table.hand_active = False
+
+    state = manager.mark_ready("u1")
+    assert state["hand_active"] is True
+    assert state["ready"] == []
+
+
+def test_ready_is_sent_as_a_delta() -> None:
+    manager = TwentyNineManager()
+    tid = manager.create_table("Ready")["table_id"]
+    manager.join_table(tid, "u1", "U1")
+    manager.join_table(tid, "u2", "U2")
+    manager.add_bots(tid, 2)
+    table = manager.tables[tid]
+    table.hand_active = False
+    before = table.version
+
+    manager.mark_ready("u1")
+    delta = manager.get_state(tid, "u2", since_version=before)
+
+    assert delta["events"] == [{"event": "ready", "player_id": "u1", "seq": before + 1}]
+    assert delta["ready"] == ["u1"] and delta["hand_active"] is False
+
+
+def test_state_is_cached_until_the_table_changes() -> None:
+    manager = TwentyNineManager()
+    tid = manager.create_table("Cache")["table_id"]
+    manager.join_table(tid, "u1", "U1")
+    manager.add_bots(tid, 3)
+    manager.start_hand(tid)
+
+    first = manager.get_state(tid, "u1")
+    assert manager.get_state(tid, "u1") is first
+    assert manager.get_state(tid, "spectator") is manager.get_state(tid, None)
+
+    unchanged = manager.get_state(tid, "u1", since_version=first["version"])
+    assert unchanged == {"table_id": tid, "version": first["version"], "changed": False}
+
+
+def test_since_version_returns_only_new_plays() -> None:
+    manager = TwentyNineManager()
+    tid = manager.create_table("Delta")["table_id"]
+    manager.join_table(tid, "u1", "U1")
+    manager.add_bots(tid, 3)
+    manager.start_hand(tid)
+    table = manager.tables[tid]
+    while table.players[table.turn_idx].player_id != "u1":
+        manager._play_bot_turn(table, table.players[table.turn_idx])
+    before = manager.get_state(tid, "u1")["version"]
+
+    card = manager._legal_cards(table, table.players[0])[0]
+    manager.play_card("u1", str(card))
+    delta = manager.get_state(tid, "u1", since_version=before)
+
+    assert delta["changed"] is True
+    assert "players" not in delta
+    assert delta["events"][0] == {"event": "play", "player_id": "u1", "card": str(card), "seq": before + 1}
+    assert all(e["event"] in {"play", "bot_play", "trick_win"} for e in delta["events"])
+    assert delta["version"] == table.version
+
+
+def test_idle_tables_are_reaped_and_seats_freed() -> None:
+    manager = TwentyNineManager()
+    tid = manager.create_table("Idle", owner_id="owner")["table_id"]
+    manager.join_table(tid, "u1", "U1")
+    manager.tables[tid].last_activity -= 120
+
+    assert manager.reap_idle(60) == [tid]
+    assert manager.list_tables() == []
+    assert "u1" not in manager.user_table
+    assert "owner" not in manager.owned_tables
+    manager.create_table("Again", owner_id="owner")
+
+
+def test_actions_recheck_the_seat_under_the_table_lock() -> None:
+    manager = TwentyNineManager()
+    tid = manager.create_table("Stale")["table_id"]
+    manager.join_table(tid, "u1", "U1")
+    manager.join_table(tid, "u2", "U2")
+    manager.add_bots(tid, 2)
+    table = manager.tables[tid]
+    table.hand_active = False
+    manager._hand_seat_to_bot(table, table.players[0])
+    # As if the index had been read just before the seat was handed over.
+    manager.user_table["u1"] = tid
+
+    with pytest.raises(ValueError, match="stale"):
+        manager.mark_ready("u1")
+    with pytest.raises(ValueError, match="stale"):
+        manager.bid("u1", 18, "S")
+
+
+def test_expired_turn_plays_lowest_card_then_hands_seat_to_bot() -> None:
+    manager = TwentyNineManager()
+    tid = manager.create_table("Timer")["table_id"]
+    manager.join_table(tid, "u1", "U1")
+    manager.add_bots(tid, 3)
+    manager.start_hand(tid)
+    table = manager.tables[tid]
+    human = table.players[0]
+
+    for missed in range(1, MAX_MISSED_TURNS + 1):
+        while table.players[table.turn_idx] is not human:
+            if not table.hand_active:
+                manager.mark_ready("u1")
+            else:
+                manager._play_bot_turn(table, table.players[table.turn_idx])
+        marker = manager.turn_marker(tid)
+        assert marker == ("u1", table.version)
+        expected = min(manager._legal_cards(table, human), key=lambda c: (RANK_POINTS[c.rank], -RANKS.index(c.rank)))
+
+        manager.expire_turn(tid, marker)
+        assert human.missed_turns == missed
+        assert any(e["event"] == "play" and e["card"] == str(expected) for e in table.history if e["seq"] == marker[1] + 2)
+        if missed < MAX_MISSED_TURNS:
+            # A stale marker never plays twice.
+            assert manager.expire_turn(tid, marker) is None
+
+    assert human.is_bot
+    assert "u1" not in manager.user_table
+    # The last human is gone: the bots finish the hand and the table closes instead of freezing.
+    assert any(e["event"] == "hand_end" for e in table.history if e["seq"] > marker[1])
+    assert tid not in manager.tables